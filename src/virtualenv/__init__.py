@@ -1,10 +1,28 @@
 from __future__ import annotations
 
-from .run import cli_run, session_via_cli
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .run import cli_run, cli_run_many, session_via_cli
+
+
+def __getattr__(name: str) -> object:
+    # import the creation machinery on first use, so that forwarding to a server (see virtualenv.daemon) stays cheap
+    if name in {"cli_run", "cli_run_many", "session_via_cli"}:
+        return getattr(import_module(f"{__name__}.run"), name)
+    if find_spec(f"{__name__}.{name}") is not None:  # the submodules stay reachable, as when imported with those
+        return import_module(f"{__name__}.{name}")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = [
     "__version__",
     "cli_run",
+    "cli_run_many",
     "session_via_cli",
 ]
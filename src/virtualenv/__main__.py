@@ -21,14 +21,17 @@ def run(
 ) -> None:
     env = os.environ if env is None else env
     start = default_timer()
+    from virtualenv.config.cli.parser import VirtualEnvOptions  # ruff:ignore[import-outside-top-level]
     from virtualenv.run import cli_run  # ruff:ignore[import-outside-top-level]
     from virtualenv.util.error import ProcessCallFailedError  # ruff:ignore[import-outside-top-level]
 
     if args is None:
         args = sys.argv[1:]
+    options = VirtualEnvOptions() if options is None else options
     try:
         session = cli_run(args, options, env=env)
         LOGGER.warning(LogSession(session, start))
+        _report_timings(session, options.timings)
     except ProcessCallFailedError as exception:
         print(f"subprocess call failed for {exception.cmd} with code {exception.code}")  # ruff:ignore[print]
         print(exception.out, file=sys.stdout, end="")  # ruff:ignore[print]
@@ -45,6 +48,13 @@ def run(
         raise
 
 
+def _report_timings(session: Session, report: str | None) -> None:
+    if report == "json":
+        print(session.timings.as_json())  # ruff:ignore[print]
+    elif report == "text":
+        LOGGER.warning(session.timings.as_text())
+
+
 class LogSession:
     def __init__(self, session: Session, start: float) -> None:
         self.session = session
@@ -69,9 +79,17 @@ class LogSession:
 
 
 def run_with_catch(args: list[str] | None = None, env: MutableMapping[str, str] | None = None) -> None:
-    from virtualenv.config.cli.parser import VirtualEnvOptions  # ruff:ignore[import-outside-top-level]
+    from virtualenv.daemon import forward  # ruff:ignore[import-outside-top-level]
 
     env = os.environ if env is None else env
+    code = forward(sys.argv[1:] if args is None else args, env)  # before importing the creation machinery
+    if code is not None:
+        if code:
+            sys.exit(code)
+        return
+
+    from virtualenv.config.cli.parser import VirtualEnvOptions  # ruff:ignore[import-outside-top-level]
+
     options = VirtualEnvOptions()
     try:
         run(args, options, env)
@@ -12,6 +12,8 @@ from platformdirs import user_cache_dir, user_data_dir
 from .na import AppDataDisabled
 from .read_only import ReadOnlyAppData
 from .via_disk_folder import AppDataDiskFolder
+from .via_memory import AppDataMemory
+from .via_sqlite import AppDataSQLite
 from .via_tempdir import TempAppData
 
 if TYPE_CHECKING:
@@ -21,6 +23,15 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+#: where the writable app data keeps its cached content, the files are kept in the folder either way
+BACKENDS: dict[str, type[AppDataDiskFolder]] = {
+    "folder": AppDataDiskFolder,
+    "sqlite": AppDataSQLite,
+    "memory": AppDataMemory,
+}
+#: keep the cached content in memory and the files in a temporary folder, nothing persists
+MEMORY_ONLY = "memory-only"
+
 
 def _default_app_data_dir(env: Mapping[str, str]) -> str:
     key = "VIRTUALENV_OVERRIDE_APP_DATA"
@@ -49,10 +60,14 @@ def _cache_dir_with_migration() -> str:
 def make_app_data(folder: str | None, **kwargs: Any) -> AppData:  # ruff:ignore[any-type]
     is_read_only = kwargs.pop("read_only")
     env = kwargs.pop("env")
+    backend = kwargs.pop("backend", "folder")
+    max_size = kwargs.pop("max_size", None)
     if kwargs:  # py3+ kwonly
         msg = "unexpected keywords: {}"
         raise TypeError(msg)
 
+    if backend == MEMORY_ONLY:
+        return AppDataMemory()
     if folder is None:
         folder = _default_app_data_dir(env)
     folder = os.path.abspath(folder)
@@ -67,14 +82,20 @@ def make_app_data(folder: str | None, **kwargs: Any) -> AppData:  # ruff:ignore[
         LOGGER.info("could not create app data folder %s due to %r", folder, exception)
 
     if os.access(folder, os.W_OK):
-        return AppDataDiskFolder(folder)
+        app_data = BACKENDS[backend](folder)
+        app_data.max_size = max_size
+        return app_data
     LOGGER.debug("app data folder %s has no write access", folder)
-    return TempAppData()
+    return AppDataMemory() if backend == "memory" else TempAppData()
 
 
 __all__ = (
+    "BACKENDS",
+    "MEMORY_ONLY",
     "AppDataDisabled",
     "AppDataDiskFolder",
+    "AppDataMemory",
+    "AppDataSQLite",
     "ReadOnlyAppData",
     "TempAppData",
     "make_app_data",
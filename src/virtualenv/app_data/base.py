@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from virtualenv.info import IS_ZIPAPP
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Sequence
     from pathlib import Path
     from typing import Any
 
@@ -41,6 +41,18 @@ class AppData(ABC):
         """Clear all cached interpreter information."""
         raise NotImplementedError
 
+    @abstractmethod
+    def plugin_index(self, executable: str, path: Sequence[str] = ()) -> ContentStore:
+        """Return a content store for the plugin entry points visible to an interpreter.
+
+        :param executable: the executable of the interpreter running virtualenv
+        :param path: the folders the interpreter finds the plugins in
+
+        :returns: a content store for the entry point index
+
+        """
+        raise NotImplementedError
+
     @property
     def can_update(self) -> bool:
         """``True`` if this app data store supports updating cached content."""
@@ -68,6 +80,11 @@ class AppData(ABC):
         """``True`` if this app data store is transient and does not persist across runs."""
         raise NotImplementedError
 
+    @property
+    def wheel_content(self) -> Path:
+        """The directory holding the extracted seed wheels by the hash of their content, the images take files from."""
+        raise NotImplementedError
+
     @abstractmethod
     def wheel_image(self, for_py_version: str, name: str) -> Path:
         """Return the path to a cached wheel image.
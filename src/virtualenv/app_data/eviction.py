@@ -0,0 +1,381 @@
+"""Keep the app data folder within a size budget, evicting the content used the least recently first.
+
+The install images of the seed wheels, the extracted wheels they take their files from, the wheels in the house, the
+files extracted by other virtualenv versions and the interpreter information kept in earlier formats can be evicted. An
+image is marked used whenever a creation installs from it, and an evicted wheel is dropped from the embed update logs so
+it no longer gets picked as the updated version. Images that environments created with the symlink or pth install
+methods still link to are never evicted: such installs leave a reference to the environment next to the image, and references to
+environments that are gone (or no longer link to the image) are dropped. Regardless of the budget the leftovers of
+interrupted image builds and the information cached about interpreters that no longer exist are removed.
+
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sys
+import time
+from argparse import ArgumentTypeError
+from contextlib import suppress
+from datetime import timedelta
+from functools import partial
+from hashlib import sha256
+from pathlib import Path
+from subprocess import DEVNULL, Popen
+from textwrap import dedent
+from typing import TYPE_CHECKING, NamedTuple
+
+from virtualenv.util.lock import PathLockBase, Timeout
+from virtualenv.util.path import safe_delete
+from virtualenv.util.subprocess import CREATE_NO_WINDOW
+from virtualenv.version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from .base import ContentStore
+    from .via_disk_folder import AppDataDiskFolder
+
+LOGGER = logging.getLogger(__name__)
+COLLECT_PERIOD = timedelta(days=1)  #: how often creations trigger a background collection when a budget is set
+IN_USE_PERIOD = timedelta(hours=1)  #: content used more recently than this might belong to a creation in progress
+LINKED_IMAGES = ("SymlinkPipInstall", "PthPipInstall")  #: the installers whose images environments link to
+_STAMP = "eviction.stamp"
+_SIZE = re.compile(r"(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?", re.IGNORECASE)
+_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+
+def parse_size(value: str) -> int:
+    """:returns: the number of bytes a size such as ``500M`` or ``2G`` stands for (the units are powers of 1024)"""
+    match = _SIZE.fullmatch(value.strip())
+    if match is None:
+        msg = f"invalid size {value!r}, expected a number of bytes optionally followed by K, M, G or T (e.g. 2G)"
+        raise ArgumentTypeError(msg)
+    return int(float(match[1]) * _UNITS[match[2].lower()])
+
+
+class Collected(NamedTuple):
+    removed: int  #: the number of items removed
+    freed: int  #: the number of bytes freed
+    size: int  #: the number of bytes the app data folder takes up after the collection
+
+
+class _Item(NamedTuple):
+    used: float  #: when the item was last used, as a timestamp
+    size: int
+    path: Path
+    remove: Callable[[], bool]  #: returns ``False`` if the item is in use, and thus kept
+
+
+def collect(app_data: AppDataDiskFolder, max_size: int | None) -> Collected:
+    """Remove the stale content of the app data, then evict the least recently used content while over the budget.
+
+    Content in use by other virtualenv processes is skipped, so this is safe to run while environments get created.
+
+    :param app_data: the writable app data to collect
+    :param max_size: the size budget in bytes, ``None`` to only remove the stale content
+
+    :returns: what the collection achieved
+
+    """
+    root = app_data.lock.path
+    before = _size(root)
+    removed = _remove_stale(app_data) + app_data.py_info_prune()
+    if max_size is not None:
+        removed += _evict(app_data, max_size, _size(root))
+    size = _size(root)
+    collected = Collected(removed, max(before - size, 0), size)
+    LOGGER.warning(
+        "collected app data %s: removed %d items, freed %s, now at %s%s",
+        root,
+        collected.removed,
+        _human(collected.freed),
+        _human(collected.size),
+        "" if max_size is None else f" out of {_human(max_size)}",
+    )
+    return collected
+
+
+def trigger_collect(app_data: AppDataDiskFolder, max_size: int) -> None:
+    """Collect the app data in a background process, unless it was collected within the :data:`COLLECT_PERIOD`."""
+    stamp = app_data.lock.path / _STAMP
+    with suppress(OSError):
+        if time.time() - stamp.stat().st_mtime < COLLECT_PERIOD.total_seconds():
+            return
+    try:
+        stamp.touch()
+    except OSError as exception:
+        LOGGER.debug("could not stamp app data collection at %s: %r", stamp, exception)
+        return
+    cmd = [
+        sys.executable,
+        "-c",
+        dedent(
+            """
+        from importlib import import_module
+        from virtualenv.report import setup_report, MAX_LEVEL
+        from virtualenv.app_data.eviction import collect
+        setup_report(MAX_LEVEL, show_pid=True)
+        collect(getattr(import_module({!r}), {!r})({!r}), {!r})
+        """,
+        )
+        .strip()
+        .format(type(app_data).__module__, type(app_data).__qualname__, str(app_data), max_size),
+    ]
+    kwargs = {"stdout": DEVNULL, "stderr": DEVNULL}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = CREATE_NO_WINDOW
+    process = Popen(cmd, **kwargs)  # ty: ignore[no-matching-overload]
+    LOGGER.info("triggered collection of app data %s via background process having PID %d", app_data, process.pid)
+    # set the returncode here -> no ResourceWarning on main process exit if the subprocess still runs
+    process.returncode = 0
+
+
+def refer_image(image: Path, purelib: Path) -> None:
+    """Record that the environment with the purelib links to the image, so the image does not get evicted."""
+    refs = _refs(image)
+    with suppress(OSError):  # e.g. the app data became read-only, the image may get evicted then
+        refs.mkdir(exist_ok=True)
+        (refs / sha256(str(purelib).encode("utf-8")).hexdigest()[:16]).write_text(str(purelib), encoding="utf-8")
+
+
+def refer_linked_images(purelib: Path) -> None:
+    """Record the images the environment with the purelib links to, when it got its files other than by installing."""
+    from virtualenv.seed.embed.via_app_data.pip_install.base import MANIFEST  # ruff:ignore[import-outside-top-level]
+
+    images = set()
+    for entry in purelib.iterdir() if purelib.is_dir() else ():
+        if entry.is_symlink():
+            images.add(Path(os.path.realpath(entry)).parent)
+        elif entry.name.startswith("_virtualenv-") and entry.suffix == ".pth":
+            images.add(Path(entry.read_text(encoding="utf-8").strip()))
+    for image in images:
+        if (image / MANIFEST).is_file():
+            refer_image(image, purelib)
+
+
+def image_path_file(image: Path, purelib: Path) -> Path:
+    """:returns: the path configuration file putting the image on the path of the environment with the purelib"""
+    return purelib / f"_virtualenv-{image.name}.pth"
+
+
+def mark_used(path: Path) -> None:
+    """Record that the content at path was used now."""
+    with suppress(OSError):
+        os.utime(path)
+
+
+def _evict(app_data: AppDataDiskFolder, max_size: int, size: int) -> int:
+    removed, in_use_after = 0, time.time() - IN_USE_PERIOD.total_seconds()
+    for item in sorted(_evictable(app_data), key=lambda i: i.used):
+        if size <= max_size or item.used > in_use_after:
+            break
+        if item.remove():
+            LOGGER.debug("evicted %s (%d bytes)", item.path, item.size)
+            removed, size = removed + 1, size - item.size
+    return removed
+
+
+def _remove_stale(app_data: AppDataDiskFolder) -> int:
+    removed, in_use_after = 0, time.time() - IN_USE_PERIOD.total_seconds()
+    for leftover in app_data.lock.path.glob(".*.import"):  # left behind by an app data import that died
+        if _used(leftover) < in_use_after:
+            safe_delete(leftover)
+            removed += 1
+    for installer in _installer_folders(app_data):
+        for entry in list(installer.path.iterdir()):
+            if entry.name.endswith(".staging"):  # .<image>.<id>.staging left behind by a build that died
+                image = entry.name[1:].rsplit(".", 2)[0]
+                removed += _remove_unlocked(installer, image, entry)
+            elif entry.name.endswith(".refs") and not entry.with_suffix("").exists():
+                removed += _remove_unlocked(installer, entry.stem, entry)
+    return removed
+
+
+def _evictable(app_data: AppDataDiskFolder) -> Iterator[_Item]:
+    root = app_data.lock.path
+    image_used: dict[str, float] = {}  # by the name of the wheel, and by the hash of its content
+    for installer in _installer_folders(app_data):
+        for image in _entries(installer):
+            used = _used(image)
+            for key in (image.name, _image_digest(image)):
+                image_used[key] = max(used, image_used.get(key, used))
+            yield _Item(used, _size(image), image, partial(_remove_image, installer, image))
+    content = app_data.lock / app_data.wheel_content
+    for extracted in _entries(content):  # ty: ignore[invalid-argument-type]
+        used = max(_used(extracted), image_used.get(extracted.name, 0))  # the content is used while its images are
+        yield _Item(used, _size(extracted), extracted, partial(_remove_image, content, extracted))
+    for wheel in (root / "wheel" / "house").glob("*.whl"):
+        used = max(_used(wheel), image_used.get(wheel.stem, 0))  # a wheel is used while its images are
+        yield _Item(used, _size(wheel), wheel, partial(_remove_wheel, app_data, wheel))
+    py_info = app_data.py_info_at.path
+    for folder, keep in ((root / "unzip", __version__), (py_info.parent, py_info.name)):
+        for entry in folder.iterdir() if folder.is_dir() else ():
+            if entry.is_dir() and entry.name != keep:  # extracted by other versions, or cached in other formats
+                yield _Item(_used(entry), _size(entry), entry, partial(_remove_folder, entry))
+
+
+def _entries(folder: PathLockBase) -> Iterator[Path]:
+    for entry in folder.path.iterdir() if folder.path.is_dir() else ():
+        if entry.is_dir() and not entry.name.startswith(".") and entry.suffix != ".refs":
+            yield entry
+
+
+def _image_digest(image: Path) -> str:
+    """:returns: the key of the extracted wheel content the image took its files from"""
+    from virtualenv.seed.embed.via_app_data.pip_install.base import MANIFEST  # ruff:ignore[import-outside-top-level]
+
+    try:
+        manifest = json.loads((image / MANIFEST).read_text(encoding="utf-8"))
+        return manifest["wheel"]["sha256"][:32]
+    except (OSError, ValueError, TypeError, KeyError):
+        return ""
+
+
+def _installer_folders(app_data: AppDataDiskFolder) -> Iterator[PathLockBase]:
+    for folder in app_data.lock.path.glob("wheel/*/image/*/*"):
+        if folder.is_dir():
+            yield app_data.lock / folder  # ty: ignore[invalid-return-type]
+
+
+def _remove_image(installer: PathLockBase, image: Path) -> bool:
+    try:
+        with installer.exclusive_lock_for_key(image.name, no_block=True):  # creations hold it shared while installing
+            if _linked(image):
+                return False
+            safe_delete(image)
+            safe_delete(_refs(image))
+    except Timeout:
+        return False
+    return True
+
+
+def _remove_unlocked(installer: PathLockBase, image: str, path: Path) -> int:
+    try:
+        with installer.exclusive_lock_for_key(image, no_block=True):
+            safe_delete(path)
+    except Timeout:  # a build of the image is in progress
+        return 0
+    return 1
+
+
+def _remove_wheel(app_data: AppDataDiskFolder, wheel: Path) -> bool:
+    # forget it first, so creations do not pick it as the periodically updated version while it gets removed
+    distribution = wheel.name.split("-")[0]
+    for folder in (app_data.lock.path / "wheel").iterdir():
+        if folder.is_dir() and folder.name not in {"house", "content"}:
+            _forget_wheel(app_data.embed_update_log(distribution, folder.name), wheel.name)
+    return _remove_file(wheel)
+
+
+def _forget_wheel(update_log: ContentStore, filename: str) -> None:
+    if not update_log.exists():
+        return
+    with update_log.locked():
+        content = update_log.read()
+        versions = content.get("versions") if isinstance(content, dict) else None
+        if isinstance(versions, list):
+            kept = [i for i in versions if not isinstance(i, dict) or i.get("filename") != filename]
+            if len(kept) != len(versions):
+                content["versions"] = kept
+                update_log.write(content)
+
+
+def _remove_file(path: Path) -> bool:
+    try:
+        path.unlink()
+    except OSError:  # e.g. open by a creation on Windows
+        return False
+    return True
+
+
+def _remove_folder(path: Path) -> bool:
+    safe_delete(path)
+    return not path.exists()
+
+
+def _linked(image: Path) -> bool:
+    """:returns: ``True`` if an environment still links to the image, forgetting the environments that do not"""
+    refs = _refs(image)
+    if not refs.is_dir():  # built before the references got recorded, an environment might link to it without one
+        return image.parent.name.split("-")[0] in LINKED_IMAGES
+    linked = False
+    for ref in refs.iterdir():
+        purelib = Path(ref.read_text(encoding="utf-8"))
+        if _points_to(image_path_file(image, purelib), image) or any(
+            _links_to(purelib / entry.name, entry) for entry in image.iterdir()
+        ):
+            linked = True
+        else:
+            ref.unlink()
+    return linked
+
+
+def _links_to(link: Path, target: Path) -> bool:
+    return link.is_symlink() and os.path.realpath(link) == os.path.realpath(target)
+
+
+def _points_to(pth: Path, target: Path) -> bool:
+    try:
+        return os.path.realpath(pth.read_text(encoding="utf-8").strip()) == os.path.realpath(target)
+    except OSError:
+        return False
+
+
+def _refs(image: Path) -> Path:
+    return image.with_name(f"{image.name}.refs")
+
+
+def _used(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0
+
+
+def _size(path: Path) -> int:
+    if not path.is_dir():
+        return _used_bytes(path)
+    # the lock files stay (holding the PID of their last holder) and leases come and go, they are not part of the budget
+    return sum(
+        _used_bytes(Path(folder, name))
+        for folder, _, files in os.walk(path)
+        for name in files
+        if not name.endswith((".lock", ".lease"))
+    )
+
+
+def _used_bytes(path: Path) -> int:
+    try:
+        stat = path.lstat()
+    except OSError:  # removed meanwhile
+        return 0
+    return stat.st_size // max(stat.st_nlink, 1)  # the images share the files of the extracted wheels as hardlinks
+
+
+def _human(size: float) -> str:
+    if size < 1024:  # ruff:ignore[magic-value-comparison]
+        return f"{size:.0f} B"
+    for unit in ("KiB", "MiB", "GiB", "TiB"):
+        size /= 1024
+        if size < 1024 or unit == "TiB":  # ruff:ignore[magic-value-comparison]
+            break
+    return f"{size:.1f} {unit}"
+
+
+__all__ = [
+    "COLLECT_PERIOD",
+    "IN_USE_PERIOD",
+    "LINKED_IMAGES",
+    "Collected",
+    "collect",
+    "image_path_file",
+    "mark_used",
+    "parse_size",
+    "refer_image",
+    "refer_linked_images",
+    "trigger_collect",
+]
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from .base import AppData, ContentStore
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Sequence
     from pathlib import Path
     from typing import Any, NoReturn
 
@@ -34,6 +34,9 @@ class AppDataDisabled(AppData):
     def embed_update_log(self, distribution: str, for_py_version: str) -> ContentStoreNA:  # ruff:ignore[unused-method-argument]
         return ContentStoreNA()
 
+    def plugin_index(self, executable: str, path: Sequence[str] = ()) -> ContentStoreNA:  # ruff:ignore[unused-method-argument]
+        return ContentStoreNA()
+
     def extract(self, path: Path, to_folder: Path | None) -> NoReturn:  # ruff:ignore[unused-method-argument]
         raise self.error
 
@@ -46,6 +49,10 @@ class AppDataDisabled(AppData):
     def house(self) -> NoReturn:
         raise self.error
 
+    @property
+    def wheel_content(self) -> NoReturn:
+        raise self.error
+
     def wheel_image(self, for_py_version: str, name: str) -> NoReturn:  # ruff:ignore[unused-method-argument]
         raise self.error
 
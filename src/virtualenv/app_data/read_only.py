@@ -29,6 +29,9 @@ class ReadOnlyAppData(AppDataDiskFolder):
     def py_info_clear(self) -> None:
         raise NotImplementedError
 
+    def py_info_prune(self) -> int:
+        raise NotImplementedError
+
     def py_info(self, path: Path) -> _PyInfoStoreDiskReadOnly:
         return _PyInfoStoreDiskReadOnly(self.py_info_at, path)
 
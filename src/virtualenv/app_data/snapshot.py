@@ -0,0 +1,195 @@
+"""Export the app data folder into a tar archive, and import such an archive into another app data folder.
+
+A warmed up app data (the wheel images, the interpreter information, the plugin index and the embed update logs) lets
+the first creation skip the work a cold one does, so CI images can ship it prebuilt. The archive holds the files of the
+folder (hardlinks included) along with a snapshot file recording where it was taken and the exact modification times of
+the files, that the wheel images compare against. Lock and lease files (and the choice between them), the leftovers of
+interrupted builds and the references of the images to the environments linking to them are machine specific, so they
+are not exported.
+
+An import keeps what the target folder already has: complete images and files present there stay as they are, SQLite
+content stores get the rows they miss. When imported into another folder the symlink and pth install images are dropped,
+as their bytecode records the folder they were built at; they are rebuilt on first use.
+
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tarfile
+from contextlib import closing
+from io import BytesIO
+from itertools import chain
+from pathlib import Path, PurePosixPath
+from tempfile import TemporaryDirectory
+from uuid import uuid4
+
+from virtualenv.app_data.eviction import LINKED_IMAGES
+from virtualenv.seed.embed.via_app_data.pip_install.base import MANIFEST
+from virtualenv.util.path import safe_delete
+from virtualenv.version import __version__
+
+LOGGER = logging.getLogger(__name__)
+SNAPSHOT = ".virtualenv-snapshot.json"  #: describes the snapshot, within the archive
+_SNAPSHOT_VERSION = 1
+#: the lock, lease and stamp files the app data writes for itself, never looked for within the images and wheel content
+_SKIP_FILES = (
+    ".lock",
+    ".lease",
+    ".stale",
+    "lease-locks",
+    "eviction.stamp",
+    ".tmp",
+    ".sqlite-wal",
+    ".sqlite-shm",
+    ".sqlite-journal",
+)
+_SKIP_FOLDERS = (".staging", ".refs", ".import")
+_WHEEL_TREES = (PurePosixPath("wheel/content/*/*"), PurePosixPath("wheel/*/image/*/*/*"))  #: extracted wheels, images
+_COMPRESSION = {".gz": "gz", ".tgz": "gz", ".bz2": "bz2", ".xz": "xz"}
+
+
+def export_app_data(root: Path, archive: Path) -> int:
+    """Write the content of the app data folder into a tar archive.
+
+    :param root: the app data folder
+    :param archive: the archive to write, compressed if the name ends with ``.gz``, ``.tgz``, ``.bz2`` or ``.xz``
+
+    :returns: the number of files exported
+
+    """
+    snapshot = {"version": _SNAPSHOT_VERSION, "virtualenv": __version__, "root": str(root), "mtime_ns": {}}
+    archive = archive.absolute()
+    mode = f"w:{_COMPRESSION.get(archive.suffix, '')}"
+    with TemporaryDirectory() as temp, tarfile.open(str(archive), mode, format=tarfile.PAX_FORMAT) as tar:
+        for folder, dirs, files in os.walk(root):
+            base = Path(folder).relative_to(root)
+            verbatim = _within_wheel(base)
+            dirs[:] = sorted(i for i in dirs if verbatim or not i.endswith(_SKIP_FOLDERS))
+            if base.parts:
+                tar.add(folder, arcname=base.as_posix(), recursive=False)
+            for name in sorted(files):
+                path, arcname = Path(folder, name), (base / name).as_posix()
+                if (not verbatim and name.endswith(_SKIP_FILES)) or path == archive:
+                    continue
+                if name.endswith(".sqlite"):  # take a consistent copy, the database may be written meanwhile
+                    path = _backup(path, Path(temp, name))
+                tar.add(str(path), arcname=arcname, recursive=False)
+                # the archive keeps modification times at best to the microsecond, the wheel identities need them exact
+                snapshot["mtime_ns"][arcname] = path.stat().st_mtime_ns
+        content = json.dumps(snapshot, sort_keys=True).encode("utf-8")
+        info = tarfile.TarInfo(SNAPSHOT)
+        info.size = len(content)
+        tar.addfile(info, BytesIO(content))
+    count = len(snapshot["mtime_ns"])
+    LOGGER.warning("exported app data %s into %s (%d files)", root, archive, count)
+    return count
+
+
+def import_app_data(root: Path, archive: Path) -> int:
+    """Restore a tar archive written by :func:`export_app_data` into the app data folder.
+
+    :param root: the app data folder
+    :param archive: the archive to restore
+
+    :returns: the number of entries restored, folders imported as a whole count as one
+
+    :raises RuntimeError: if the archive is not an app data snapshot, or holds entries that would land outside the folder
+
+    """
+    staging = root / f".{uuid4().hex[:8]}.import"
+    staging.mkdir(parents=True)
+    try:
+        with tarfile.open(str(archive)) as tar:
+            snapshot = _read_snapshot(tar)
+            members = [i for i in tar.getmembers() if i.name != SNAPSHOT]
+            for member in members:
+                _check(member)
+            kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+            tar.extractall(str(staging), members=members, **kwargs)  # ruff:ignore[tarfile-unsafe-members] # checked above
+        for name, mtime_ns in snapshot.get("mtime_ns", {}).items():
+            path = staging / name
+            if path.is_file():
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+        if snapshot.get("root") != str(root):
+            for images in chain.from_iterable(staging.glob(f"wheel/*/image/*/{i}*") for i in LINKED_IMAGES):
+                LOGGER.debug("drop linked images %s, they were built at %s", images, snapshot.get("root"))
+                safe_delete(images)
+        count = _merge(staging, root)
+    finally:
+        safe_delete(staging)
+    LOGGER.warning("imported app data %s from %s (%d entries)", root, archive, count)
+    return count
+
+
+def _within_wheel(base: Path) -> bool:
+    """:returns: ``True`` for folders within an image or an extracted wheel content, those are exported as they are"""
+    return any(PurePosixPath(*base.parts[: len(i.parts)]).match(str(i)) for i in _WHEEL_TREES)
+
+
+def _read_snapshot(tar: tarfile.TarFile) -> dict:
+    try:
+        handle = tar.extractfile(SNAPSHOT)
+        snapshot = json.loads(handle.read()) if handle is not None else None
+    except (KeyError, ValueError):
+        snapshot = None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != _SNAPSHOT_VERSION:
+        msg = f"{tar.name} is not an app data snapshot written by virtualenv --app-data-export"
+        raise RuntimeError(msg)
+    return snapshot
+
+
+def _check(member: tarfile.TarInfo) -> None:
+    name = member.name
+    if _escapes(name):
+        msg = f"refusing to import entry outside of the app data: {name!r}"
+        raise RuntimeError(msg)
+    if member.islnk() and _escapes(member.linkname):
+        msg = f"refusing to import link to outside of the app data: {name!r} -> {member.linkname!r}"
+        raise RuntimeError(msg)
+    if not (member.isfile() or member.isdir() or member.islnk()):
+        msg = f"refusing to import entry that is not a file or folder: {name!r}"
+        raise RuntimeError(msg)
+
+
+def _escapes(name: str) -> bool:
+    return name.startswith(("/", "\\")) or os.path.isabs(name) or ".." in Path(name).parts
+
+
+def _merge(src: Path, dst: Path) -> int:
+    count = 0
+    for entry in sorted(src.iterdir()):
+        target = dst / entry.name
+        if not target.exists():
+            os.replace(entry, target)  # a complete image gets in place at once
+            count += 1
+        elif entry.is_dir() and target.is_dir() and not (entry / MANIFEST).exists():  # images are whole or not at all
+            count += _merge(entry, target)
+        elif entry.suffix == ".sqlite" and target.is_file():
+            count += _merge_database(entry, target)
+    return count
+
+
+def _merge_database(src: Path, dst: Path) -> int:
+    with closing(sqlite3.connect(str(dst), timeout=60, isolation_level=None)) as connection:
+        connection.execute("ATTACH DATABASE ? AS snapshot", (str(src),))
+        try:
+            return connection.execute("INSERT OR IGNORE INTO content SELECT * FROM snapshot.content").rowcount
+        finally:
+            connection.execute("DETACH DATABASE snapshot")
+
+
+def _backup(src: Path, dst: Path) -> Path:
+    with closing(sqlite3.connect(str(src))) as source, closing(sqlite3.connect(str(dst))) as target:
+        source.backup(target)
+    return dst
+
+
+__all__ = [
+    "SNAPSHOT",
+    "export_app_data",
+    "import_app_data",
+]
@@ -5,17 +5,29 @@ r"""A rough layout of the current storage goes as:
     virtualenv-app-data
     ├── py - <version> <cache information about python interpreters>
     │  └── *.json/lock
+    ├── plugins <index of the virtualenv plugin entry points, per interpreter running virtualenv>
+    │   └── 1 -> json format versioning
+    │       └── *.json/lock
     ├── wheel <cache wheels used for seeding>
     │   ├── house
     │   │   └── *.whl <wheels downloaded go here>
+    │   ├── content
+    │   │   └── 1 -> format versioning
+    │   │       ├── <wheel hash> -> the wheel extracted, shared by the images of every python version and install class
+    │   │       └── <wheel hash>.lock -> held exclusive while the wheel is extracted, shared while images take from it
     │   └── <python major.minor> -> 3.9
     │       ├── img-<version>
     │       │   └── image
-    │       │           └── <install class> -> CopyPipInstall / SymlinkPipInstall
-    │       │               └── <wheel name> -> pip-20.1.1-py2.py3-none-any
+    │       │           └── <install class> -> CopyPipInstall / SymlinkPipInstall, -o<levels>-<mode> if compiled otherwise
+    │       │               ├── <wheel name> -> pip-20.1.1-py2.py3-none-any, .virtualenv-image.json stamps it complete
+    │       │               ├── .<wheel name>.<id>.staging -> the image while being built, renamed in place after
+    │       │               ├── <wheel name>.refs -> the environments linking to the image (symlink install)
+    │       │               └── <wheel name>.lock -> held exclusive while the image is built, shared while used
     │       └── embed
     │           └── 3 -> json format versioning
     │               └── *.json -> for every distribution contains data about newer embed versions and releases
+    ├── eviction.stamp <when the folder was last collected down to its size budget>
+    ├── lease-locks <if present, lock with *.lease files instead of *.lock ones, for network file systems>
     └─── unzip <in zip app we cannot refer to some internal files, so first extract them>
          └── <virtualenv version>
              ├── py_info.py
@@ -28,23 +40,29 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from abc import ABC
 from contextlib import contextmanager, suppress
+from copy import deepcopy
 from hashlib import sha256
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
-from virtualenv.util.lock import ReentrantFileLock
+from virtualenv.util.lock import LeaseFileLock, PathLockBase, ReentrantFileLock
 from virtualenv.util.path import safe_delete
 from virtualenv.util.zipapp import extract
 from virtualenv.version import __version__
 
 from .base import AppData, ContentStore
+from .eviction import trigger_collect
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Sequence
     from pathlib import Path
 
 LOGGER = logging.getLogger(__name__)
+LEASE_LOCKS = "lease-locks"  #: marks an app data folder locked with lease files
+_MEMO: dict[Path, tuple[tuple[int, int, int], Any]] = {}  #: decoded content by file, valid while its stat matches
 
 
 class AppDataDiskFolder(AppData):
@@ -52,9 +70,11 @@ class AppDataDiskFolder(AppData):
 
     transient = False
     can_update = True
+    max_size: int | None = None  #: collect the folder down to this many bytes in the background, once a day
 
     def __init__(self, folder: str) -> None:
-        self.lock = ReentrantFileLock(folder)
+        lease = os.path.exists(os.path.join(folder, LEASE_LOCKS))
+        self.lock: PathLockBase = LeaseFileLock(folder) if lease else ReentrantFileLock(folder)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.lock.path})"
@@ -66,8 +86,16 @@ class AppDataDiskFolder(AppData):
         LOGGER.debug("reset app data folder %s", self.lock.path)
         safe_delete(self.lock.path)
 
+    def use_lease_locks(self) -> None:
+        """Lock the folder with lease files from now on, by every process using it (it is kept in the folder)."""
+        self.lock.path.mkdir(parents=True, exist_ok=True)
+        (self.lock.path / LEASE_LOCKS).touch()
+        self.lock = LeaseFileLock(self.lock.path)
+
     def close(self) -> None:
-        """Do nothing."""
+        """Trigger a background collection of the folder if it has a size budget."""
+        if self.max_size is not None and self.can_update:
+            trigger_collect(self, self.max_size)
 
     @contextmanager
     def locked(self, path: Path) -> Generator[None]:
@@ -77,7 +105,7 @@ class AppDataDiskFolder(AppData):
 
     @contextmanager
     def extract(self, path: Path, to_folder: Path | None) -> Generator[Path]:
-        root = ReentrantFileLock(to_folder()) if to_folder is not None else self.lock / "unzip" / __version__  # ty: ignore[call-non-callable]
+        root = type(self.lock)(to_folder()) if to_folder is not None else self.lock / "unzip" / __version__  # ty: ignore[call-non-callable]
         with root.lock_for_key(path.name):
             dest = root.path / path.name
             if not dest.exists():
@@ -85,7 +113,7 @@ class AppDataDiskFolder(AppData):
             yield dest
 
     @property
-    def py_info_at(self) -> ReentrantFileLock:
+    def py_info_at(self) -> PathLockBase:
         return self.lock / "py_info" / "5"  # ty: ignore[invalid-return-type]
 
     def py_info(self, path: Path) -> PyInfoStoreDisk:
@@ -101,6 +129,24 @@ class AppDataDiskFolder(AppData):
                         if filename.exists():
                             filename.unlink()
 
+    def py_info_prune(self) -> int:
+        """Remove the information cached about interpreters that do not exist anymore.
+
+        :returns: the number of interpreters removed
+
+        """
+        removed, py_info_folder = 0, self.py_info_at
+        for filename in py_info_folder.path.glob("*.json") if py_info_folder.path.is_dir() else ():
+            with py_info_folder.lock_for_key(filename.stem):
+                if not os.path.exists(_py_info_path(filename)):
+                    with suppress(OSError):
+                        filename.unlink()
+                        removed += 1
+        return removed
+
+    def plugin_index(self, executable: str, path: Sequence[str] = ()) -> PluginIndexStoreDisk:
+        return PluginIndexStoreDisk(self.lock / "plugins" / "1", executable, path)  # ty: ignore[invalid-argument-type]
+
     def embed_update_log(self, distribution: str, for_py_version: str) -> EmbedDistributionUpdateStoreDisk:
         return EmbedDistributionUpdateStoreDisk(self.lock / "wheel" / for_py_version / "embed" / "3", distribution)  # ty: ignore[invalid-argument-type]
 
@@ -110,12 +156,29 @@ class AppDataDiskFolder(AppData):
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @property
+    def wheel_content(self) -> Path:
+        return self.lock.path / "wheel" / "content" / "1"
+
     def wheel_image(self, for_py_version: str, name: str) -> Path:
         return self.lock.path / "wheel" / for_py_version / "image" / "1" / name
 
 
+def _py_info_path(filename: Path) -> str:
+    try:
+        content = json.loads(filename.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    path = content.get("path") if isinstance(content, dict) else None
+    return path if isinstance(path, str) else ""
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
 class JSONStoreDisk(ContentStore, ABC):
-    def __init__(self, in_folder: ReentrantFileLock, key: str, msg_args: tuple[str, ...]) -> None:
+    def __init__(self, in_folder: PathLockBase, key: str, msg_args: tuple[str, ...]) -> None:
         self.in_folder = in_folder
         self.key = key
         self.msg_args = (*msg_args, self.file)
@@ -128,22 +191,29 @@ class JSONStoreDisk(ContentStore, ABC):
         return self.file.exists()
 
     def read(self) -> Any:  # ruff:ignore[any-type]
-        data, bad_format = None, False
         try:
-            data = json.loads(self.file.read_text(encoding="utf-8"))
+            with self.file.open("rb") as handle:
+                signature = _signature(os.fstat(handle.fileno()))
+                memo = _MEMO.get(self.file)
+                raw = None if memo is not None and memo[0] == signature else handle.read()
+        except OSError:
+            return None
+        if memo is not None and raw is None:
+            return deepcopy(memo[1])
+        try:
+            data = json.loads(raw)
         except ValueError:
-            bad_format = True
-        except Exception:  # ruff:ignore[blind-except, try-except-pass]
-            pass
-        else:
-            LOGGER.debug("got %s %s from %s", *self.msg_args)
-            return data
-        if bad_format:
-            with suppress(OSError):  # reading and writing on the same file may cause race on multiple processes
-                self.remove()
-        return None
+            # writes replace the file at once, so a bad one was not in progress, unless replaced since we read it
+            with suppress(OSError):
+                if _signature(self.file.stat()) == signature:
+                    self.remove()
+            return None
+        _MEMO[self.file] = signature, data
+        LOGGER.debug("got %s %s from %s", *self.msg_args)
+        return deepcopy(data)
 
     def remove(self) -> None:
+        _MEMO.pop(self.file, None)
         self.file.unlink()
         LOGGER.debug("removed %s %s at %s", *self.msg_args)
 
@@ -153,20 +223,35 @@ class JSONStoreDisk(ContentStore, ABC):
             yield
 
     def write(self, content: Any) -> None:  # ruff:ignore[any-type]
+        _MEMO.pop(self.file, None)
         folder = self.file.parent
         folder.mkdir(parents=True, exist_ok=True)
-        self.file.write_text(json.dumps(content, sort_keys=True, indent=2), encoding="utf-8")
+        # readers in other processes must see either the old or the new content, never a partially written one
+        temp = folder / f".{self.key}.{uuid4().hex[:8]}.tmp"
+        try:
+            temp.write_text(json.dumps(content, sort_keys=True, indent=2), encoding="utf-8")
+            os.replace(temp, self.file)
+        except BaseException:
+            with suppress(OSError):
+                temp.unlink()
+            raise
         LOGGER.debug("wrote %s %s at %s", *self.msg_args)
 
 
 class PyInfoStoreDisk(JSONStoreDisk):
-    def __init__(self, in_folder: ReentrantFileLock, path: Path) -> None:
+    def __init__(self, in_folder: PathLockBase, path: Path) -> None:
         key = sha256(str(path).encode("utf-8")).hexdigest()
         super().__init__(in_folder, key, ("python info of", path))  # ty: ignore[invalid-argument-type]
 
 
+class PluginIndexStoreDisk(JSONStoreDisk):
+    def __init__(self, in_folder: PathLockBase, executable: str, path: Sequence[str] = ()) -> None:
+        key = sha256(os.pathsep.join([executable, *path]).encode("utf-8")).hexdigest()
+        super().__init__(in_folder, key, ("plugin index of", executable))
+
+
 class EmbedDistributionUpdateStoreDisk(JSONStoreDisk):
-    def __init__(self, in_folder: ReentrantFileLock, distribution: str) -> None:
+    def __init__(self, in_folder: PathLockBase, distribution: str) -> None:
         super().__init__(
             in_folder,
             distribution,
@@ -177,5 +262,6 @@ class EmbedDistributionUpdateStoreDisk(JSONStoreDisk):
 __all__ = [
     "AppDataDiskFolder",
     "JSONStoreDisk",
+    "PluginIndexStoreDisk",
     "PyInfoStoreDisk",
 ]
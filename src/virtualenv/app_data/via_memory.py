@@ -0,0 +1,164 @@
+"""Keep the cached content of the app data in the memory of the process.
+
+Layered above an app data folder the content is read from it once and then served from memory for as long as the
+process lives, so the creations of a long-running process (such as ``virtualenv --serve``) do not touch the disk for
+cache hits; writes go through to the folder. Without a folder nothing persists: the content lives only in memory, and
+the wheels, images and files extracted from the zipapp go into a temporary folder on a memory backed file system (when
+the host has one), removed on close.
+
+Content written by other processes after it got into memory is not seen; the interpreter information checks itself
+against the interpreter anyway, and the embed update logs are only consulted to decide on a periodic update.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from copy import deepcopy
+from tempfile import mkdtemp
+from threading import Lock, RLock
+from typing import TYPE_CHECKING, Any
+
+from virtualenv.util.path import safe_delete
+
+from .base import ContentStore
+from .via_disk_folder import AppDataDiskFolder
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+_SHARED_MEMORY = "/dev/shm"  # ruff:ignore[hardcoded-temp-file]
+_CONTENT: dict[tuple[str, str, str], Any] = {}  #: by app data, kind and key; shared by the app data of the process
+_LOCK = Lock()
+_KEY_LOCKS: defaultdict[tuple[str, str, str], RLock] = defaultdict(RLock)
+
+
+class AppDataMemory(AppDataDiskFolder):
+    """Keep the cached content of the application data in memory, above an app data folder persisting it (if any)."""
+
+    def __init__(self, folder: str | None = None, backing: AppDataDiskFolder | None = None) -> None:
+        if backing is None and folder is not None:
+            backing = AppDataDiskFolder(folder)
+        self.backing = backing
+        if backing is None:
+            folder = mkdtemp(prefix="virtualenv-", dir=_memory_folder())
+            LOGGER.debug("created in memory app data folder %s", folder)
+        super().__init__(folder if backing is None else str(backing.lock.path))
+        self._at = repr(self) if backing is None else repr(backing)
+
+    @property
+    def transient(self) -> bool:
+        return self.backing is None
+
+    @property
+    def can_update(self) -> bool:  # the background processes updating the content need it persisted
+        return self.backing is not None and self.backing.can_update
+
+    @property
+    def max_size(self) -> int | None:
+        return None if self.backing is None else self.backing.max_size
+
+    @max_size.setter
+    def max_size(self, value: int | None) -> None:
+        if self.backing is not None:
+            self.backing.max_size = value
+
+    def close(self) -> None:
+        if self.backing is None:
+            LOGGER.debug("remove in memory app data folder %s", self.lock.path)
+            _forget(self._at)
+            safe_delete(self.lock.path)
+        else:
+            self.backing.close()
+
+    def reset(self) -> None:
+        _forget(self._at)
+        if self.backing is not None:
+            self.backing.reset()
+
+    def py_info(self, path: Path) -> MemoryStore:
+        backing = None if self.backing is None else self.backing.py_info(path)
+        return MemoryStore((self._at, "py_info", str(path)), backing)
+
+    def py_info_clear(self) -> None:
+        _forget(self._at, "py_info")
+        if self.backing is not None:
+            self.backing.py_info_clear()
+
+    def py_info_prune(self) -> int:
+        with _LOCK:
+            gone = [i for i in _CONTENT if i[:2] == (self._at, "py_info") and not os.path.exists(i[2])]
+            for key in gone:
+                del _CONTENT[key]
+        return len(gone) if self.backing is None else self.backing.py_info_prune()
+
+    def plugin_index(self, executable: str, path: Sequence[str] = ()) -> MemoryStore:
+        backing = None if self.backing is None else self.backing.plugin_index(executable, path)
+        return MemoryStore((self._at, "plugins", os.pathsep.join([executable, *path])), backing)
+
+    def embed_update_log(self, distribution: str, for_py_version: str) -> MemoryStore:
+        backing = None if self.backing is None else self.backing.embed_update_log(distribution, for_py_version)
+        return MemoryStore((self._at, "embed", f"{for_py_version}/{distribution}"), backing)
+
+
+class MemoryStore(ContentStore):
+    """Content held in memory, loaded from and written through to the store backing it (if any)."""
+
+    def __init__(self, key: tuple[str, str, str], backing: ContentStore | None) -> None:
+        self.key = key
+        self.backing = backing
+
+    def exists(self) -> bool:
+        return self.key in _CONTENT or (self.backing is not None and self.backing.exists())
+
+    def read(self) -> Any:  # ruff:ignore[any-type]
+        if self.key not in _CONTENT:
+            data = None if self.backing is None else self.backing.read()
+            if data is None:
+                return None
+            _CONTENT[self.key] = data
+        return deepcopy(_CONTENT.get(self.key))
+
+    def write(self, content: Any) -> None:  # ruff:ignore[any-type]
+        if self.backing is not None:
+            self.backing.write(content)
+        _CONTENT[self.key] = deepcopy(content)
+
+    def remove(self) -> None:
+        _CONTENT.pop(self.key, None)
+        if self.backing is not None:
+            self.backing.remove()
+
+    @contextmanager
+    def locked(self) -> Generator[None]:
+        if self.backing is not None:
+            with self.backing.locked():
+                yield
+        else:
+            with _LOCK:
+                lock = _KEY_LOCKS[self.key]
+            with lock:
+                yield
+
+
+def _memory_folder() -> str | None:
+    """:returns: a folder on a memory backed file system for the temporary files, ``None`` for the system default"""
+    return _SHARED_MEMORY if os.path.isdir(_SHARED_MEMORY) and os.access(_SHARED_MEMORY, os.W_OK) else None
+
+
+def _forget(at: str, kind: str | None = None) -> None:
+    with _LOCK:
+        for key in [i for i in _CONTENT if i[0] == at and (kind is None or i[1] == kind)]:
+            del _CONTENT[key]
+
+
+__all__ = [
+    "AppDataMemory",
+    "MemoryStore",
+]
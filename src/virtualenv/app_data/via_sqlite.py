@@ -0,0 +1,185 @@
+"""Keep the cached content of the app data in a SQLite database instead of a JSON and a lock file per item.
+
+The database lives at ``content/1.sqlite`` within the app data folder; wheels, images and the files extracted from the
+zipapp stay on disk, laid out as :class:`~virtualenv.app_data.via_disk_folder.AppDataDiskFolder` does it. Every read
+and write is a transaction of its own, so concurrent processes do not need lock files to see consistent content; work
+done while holding the lock of an item (such as a read followed by a write) is a single write transaction, which other
+writers wait for.
+
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager, suppress
+from threading import RLock
+from typing import TYPE_CHECKING, Any
+
+from .base import ContentStore
+from .via_disk_folder import AppDataDiskFolder
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS content (kind TEXT, key TEXT, value TEXT NOT NULL, PRIMARY KEY (kind, key))"
+
+
+class AppDataSQLite(AppDataDiskFolder):
+    """Store the cached content of the application data in a SQLite database, and the files on the disk."""
+
+    def __init__(self, folder: str) -> None:
+        super().__init__(folder)
+        self._db = ContentDatabase(self.lock.path / "content" / "1.sqlite")
+
+    def reset(self) -> None:
+        self._db.close()
+        super().reset()
+
+    def close(self) -> None:
+        self._db.close()
+        super().close()
+
+    def py_info(self, path: Path) -> SQLiteStore:
+        return SQLiteStore(self._db, "py_info", str(path), ("python info of", path))
+
+    def py_info_clear(self) -> None:
+        self._db.clear("py_info")
+
+    def py_info_prune(self) -> int:
+        gone = [key for key in self._db.keys("py_info") if not os.path.exists(key)]  # keyed by the interpreter path
+        for key in gone:
+            self._db.delete("py_info", key)
+        return len(gone)
+
+    def plugin_index(self, executable: str, path: Sequence[str] = ()) -> SQLiteStore:
+        key = os.pathsep.join([executable, *path])
+        return SQLiteStore(self._db, "plugins", key, ("plugin index of", executable))
+
+    def embed_update_log(self, distribution: str, for_py_version: str) -> SQLiteStore:
+        key = f"{for_py_version}/{distribution}"
+        return SQLiteStore(self._db, "embed", key, ("embed update of distribution", distribution))
+
+
+class ContentDatabase:
+    """A SQLite database (in write-ahead log mode) of JSON content, by kind and key; connects on first use."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        # the connection is shared by the threads of the creation stages, the one within a transaction holds it until done
+        self._lock = RLock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path})"
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        with self._lock:
+            if self._connection is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+                try:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                except sqlite3.OperationalError as exception:  # e.g. on network file systems
+                    LOGGER.debug("could not use write-ahead log for %s: %r", self.path, exception)
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(_SCHEMA)
+                self._connection = connection
+            yield self._connection
+
+    def get(self, kind: str, key: str) -> str | None:
+        with self._connect() as connection:
+            row = connection.execute("SELECT value FROM content WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+        return None if row is None else row[0]
+
+    def set(self, kind: str, key: str, value: str) -> None:
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO content (kind, key, value) VALUES (?, ?, ?)", (kind, key, value))
+
+    def keys(self, kind: str) -> list[str]:
+        with self._connect() as connection:
+            return [row[0] for row in connection.execute("SELECT key FROM content WHERE kind = ?", (kind,))]
+
+    def delete(self, kind: str, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM content WHERE kind = ? AND key = ?", (kind, key))
+
+    def clear(self, kind: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM content WHERE kind = ?", (kind,))
+
+    @contextmanager
+    def locked(self) -> Generator[None, None, None]:
+        """Work on the content within a write transaction, excluding the writers of other processes and other threads."""
+        with self._connect() as connection:
+            if connection.in_transaction:  # nested within the transaction of this thread
+                yield
+                return
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class SQLiteStore(ContentStore):
+    def __init__(self, db: ContentDatabase, kind: str, key: str, msg_args: tuple[Any, ...]) -> None:
+        self.db = db
+        self.kind = kind
+        self.key = key
+        self.msg_args = (*msg_args, db.path)
+
+    @property
+    def file(self) -> Path:
+        """The database holding the content."""
+        return self.db.path
+
+    def exists(self) -> bool:
+        return self.db.get(self.kind, self.key) is not None
+
+    def read(self) -> Any:  # ruff:ignore[any-type]
+        raw = self.db.get(self.kind, self.key)
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            with suppress(sqlite3.Error):
+                self.remove()
+            return None
+        LOGGER.debug("got %s %s from %s", *self.msg_args)
+        return data
+
+    def write(self, content: Any) -> None:  # ruff:ignore[any-type]
+        self.db.set(self.kind, self.key, json.dumps(content, sort_keys=True))
+        LOGGER.debug("wrote %s %s at %s", *self.msg_args)
+
+    def remove(self) -> None:
+        self.db.delete(self.kind, self.key)
+        LOGGER.debug("removed %s %s at %s", *self.msg_args)
+
+    @contextmanager
+    def locked(self) -> Generator[None]:
+        with self.db.locked():
+            yield
+
+
+__all__ = [
+    "AppDataSQLite",
+    "ContentDatabase",
+    "SQLiteStore",
+]
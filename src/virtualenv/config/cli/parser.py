@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import shutil
+import sys
 from argparse import SUPPRESS, ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
@@ -90,6 +91,7 @@ class VirtualEnvConfigParser(ArgumentParser):
         self.options = VirtualEnvOptions() if options is None else options
         self._interpreter = None
         self._app_data = None
+        self._last_parse: tuple[tuple[str, ...], int, list[str]] | None = None
 
     def _fix_defaults(self) -> None:
         for action in self._actions:
@@ -135,10 +137,35 @@ class VirtualEnvConfigParser(ArgumentParser):
         self.options._src = "cli"  # ruff:ignore[private-member-access]
         try:
             namespace.env = self.env
-            return super().parse_known_args(args, namespace=namespace)
+            args = list(sys.argv[1:] if args is None else args)
+            if (parsed := self._parse_added(args)) is not None:
+                return parsed
+            parsed = super().parse_known_args(args, namespace=namespace)
+            self._last_parse = tuple(args), len(self._actions), list(parsed[1])
+            return parsed  # ty: ignore[invalid-return-type]
         finally:
             self.options._src = None  # ruff:ignore[private-member-access]
 
+    def _parse_added(self, args: list[str]) -> tuple[VirtualEnvOptions, list[str]] | None:
+        # options get added (and the arguments parsed again) as the plugins load; when the arguments did not change and
+        # none the last parse left unrecognized looks like an option, the options added since can only take their
+        # defaults (already set by _fix_defaults), so skip parsing the arguments again
+        if self._last_parse is None:
+            return None
+        last_args, known, unknown = self._last_parse
+        added = self._actions[known:]
+        if (
+            tuple(args) != last_args
+            or any(i.startswith(tuple(self.prefix_chars)) for i in unknown)
+            or any(not i.option_strings or i.required for i in added)
+        ):
+            return None
+        for action in added:  # argparse converts the defaults given as a string on the first parse
+            if isinstance(action.default, str) and getattr(self.options, action.dest, None) is action.default:
+                setattr(self.options, action.dest, self._get_value(action, action.default))
+        self._last_parse = last_args, len(self._actions), unknown
+        return self.options, list(unknown)
+
 
 class HelpFormatter(ArgumentDefaultsHelpFormatter):
     def __init__(self, prog: str, **kwargs: Any) -> None:  # ruff:ignore[any-type]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import sys
 import textwrap
 from abc import ABC, abstractmethod
@@ -23,7 +24,8 @@ if TYPE_CHECKING:
 
 from os.path import commonpath
 
-from virtualenv.util.path import safe_delete
+from virtualenv.app_data.eviction import refer_linked_images
+from virtualenv.util.path import ensure_dir, hardlink, safe_delete
 from virtualenv.util.subprocess import LogCmd, run_cmd
 from virtualenv.version import __version__
 
@@ -58,6 +60,8 @@ class Creator(ABC):
         self.app_data = options.app_data
         self.env = options.env
         self.prompt = getattr(options, "prompt", None)
+        template = getattr(options, "from_template", None)
+        self.from_template = None if template is None else Path(os.path.abspath(template))
 
     if TYPE_CHECKING:
 
@@ -90,6 +94,7 @@ class Creator(ABC):
             ("dest", str(self.dest)),
             ("clear", self.clear),
             ("no_vcs_ignore", self.no_vcs_ignore),
+            *([("from_template", str(self.from_template))] if self.from_template is not None else []),
         ]
 
     @classmethod
@@ -139,6 +144,14 @@ class Creator(ABC):
             help="don't create VCS ignore directive in the destination directory",
             default=False,
         )
+        parser.add_argument(
+            "--from-template",
+            dest="from_template",
+            metavar="dir",
+            help="clone this virtual environment (created for the same interpreter) instead of creating a new one - files "
+            "are hardlinked where possible and the seed packages are taken from the template",
+            default=None,
+        )
 
     @abstractmethod
     def create(self) -> None:
@@ -199,12 +212,54 @@ class Creator(ABC):
         if self.dest.exists() and self.clear:
             LOGGER.debug("delete %s", self.dest)
             safe_delete(self.dest)
-        self.create()
+        if self.from_template is None:
+            self.create()
+        else:
+            self.clone()
         self.add_cachedir_tag()
         self.set_pyenv_cfg()
         if not self.no_vcs_ignore:
             self.setup_ignore_vcs()
 
+    def clone(self) -> None:
+        """Materialize the virtual environment from the template, hardlinking the files it never writes to."""
+        template = self.from_template
+        assert template is not None  # ruff:ignore[assert]  # only called when cloning
+        self._check_template(template)
+        LOGGER.debug("clone %s from template %s", self.dest, template)
+        ensure_dir(self.dest)
+        for entry in template.iterdir():
+            hardlink(entry, self.dest / entry.name)
+        # match the template path only when not followed by more characters of a file name
+        old = sorted({str(template), str(template.resolve())}, key=len, reverse=True)
+        pattern = re.compile(rb"(%s)(?=[/\\\s'\"]|\Z)" % b"|".join(re.escape(i.encode("utf-8")) for i in old))
+        new = str(self.dest).encode("utf-8")
+        _rewrite_path(self.dest / "pyvenv.cfg", pattern, new, force=True)  # always break the link, as we rewrite it
+        for folder in {self.bin_dir, self.script_dir}:  # the activators write in place here, so break the links too
+            for path in sorted(folder.iterdir()):
+                if path.is_file() and not path.is_symlink():
+                    _rewrite_path(path, pattern, new, force=True)
+        refer_linked_images(self.purelib)  # the clone links to the images of the template, keep them around
+
+    def _check_template(self, template: Path) -> None:
+        if template == self.dest:
+            msg = f"cannot clone the template {template} onto itself"
+            raise RuntimeError(msg)
+        cfg = PyEnvCfg.from_folder(template)
+        if not cfg.content:
+            msg = f"template {template} is not a virtual environment as it has no pyvenv.cfg"
+            raise RuntimeError(msg)
+        system_executable = self.interpreter.system_executable or self.interpreter.executable
+        expected = {
+            "home": os.path.dirname(os.path.abspath(str(system_executable))),
+            "implementation": self.interpreter.implementation,
+            "version_info": ".".join(str(i) for i in self.interpreter.version_info),
+        }
+        if mismatch := {k: cfg.content.get(k) for k, v in expected.items() if cfg.content.get(k) != v}:
+            got = ", ".join(f"{k}={v}" for k, v in mismatch.items())
+            msg = f"template {template} was not created for {self.interpreter.spec} ({got})"
+            raise RuntimeError(msg)
+
     def add_cachedir_tag(self) -> None:
         """Generate a file indicating that this is not meant to be backed up."""
         cachedir_tag_file = self.dest / "CACHEDIR.TAG"
@@ -256,6 +311,16 @@ class Creator(ABC):
         return DEBUG_SCRIPT
 
 
+def _rewrite_path(path: Path, pattern: re.Pattern[bytes], new: bytes, force: bool) -> None:
+    content, count = pattern.subn(lambda _: new, path.read_bytes())
+    if not count and not force:
+        return
+    mode = path.stat().st_mode
+    path.unlink()  # the file might be a hardlink to the template, so write a new one instead of modifying it in place
+    path.write_bytes(content)
+    path.chmod(mode)
+
+
 def get_env_debug_info(env_exe: Path, debug_script: Path, app_data: AppData, env: dict[str, str]) -> dict[str, Any]:
     env = env.copy()
     env.pop("PYTHONPATH", None)
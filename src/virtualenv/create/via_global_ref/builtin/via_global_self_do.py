@@ -10,6 +10,7 @@ from virtualenv.create.via_global_ref.builtin.ref import (
     RefWhen,
 )
 from virtualenv.util.path import ensure_dir
+from virtualenv.util.timings import timed
 
 from .builtin_way import VirtualenvBuiltin
 
@@ -105,7 +106,8 @@ class ViaGlobalRefVirtualenvBuiltin(ViaGlobalRefApi, VirtualenvBuiltin, ABC):
                     or (src.when == RefWhen.SYMLINK and self.symlinks is True)
                     or (src.when == RefWhen.COPY and self.symlinks is False)
                 ):
-                    src.run(self, self.symlinks)
+                    with timed(f"{type(src).__name__} {src.src.name}"):
+                        src.run(self, self.symlinks)
         finally:
             if true_system_site != self.enable_system_site_package:
                 self.enable_system_site_package = true_system_site
@@ -0,0 +1,163 @@
+"""Serve virtual environment creations from a long-running process, and forward command lines to it.
+
+A fresh ``virtualenv`` process pays for the Python startup, importing the creation machinery, scanning the entry points
+for plugins and discovering the interpreter before it touches the file system. The server pays these once and keeps
+them (along with the interpreter information and the seed wheel lookups) cached in memory; clients hand over their
+command line through a Unix domain socket and print the output they get back.
+
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout, suppress
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+ENV_SOCKET = "VIRTUALENV_DAEMON_SOCKET"  #: clients forward to the server listening on the socket this points to
+
+# the commands other than creations: served, they would block the server (or serve from within it)
+_IN_PROCESS = ("--app-data-export", "--app-data-gc", "--app-data-import", "--serve", "--upgrade-embed-wheels")
+_SERVING: ContextVar[bool] = ContextVar("virtualenv_serving", default=False)
+
+
+def serve(path: str) -> int:
+    """Create virtual environments for the clients connecting to the socket, until interrupted.
+
+    :param path: the Unix domain socket to listen on, only the current user may connect to it
+
+    :returns: the exit code
+
+    """
+    if _SERVING.get():
+        msg = "cannot serve from within a request of a server"
+        raise RuntimeError(msg)
+    server = make_server(path)
+    LOGGER.warning("serving virtual environment creations on %s (set %s to forward to it)", path, ENV_SOCKET)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with suppress(OSError):
+                Path(path).unlink()
+    return 0
+
+
+def make_server(path: str) -> socketserver.BaseServer:
+    """:returns: a server for the socket at path that handles one creation at a time"""
+    if not hasattr(socket, "AF_UNIX"):
+        msg = "serving requires Unix domain sockets, which are not available on this platform"
+        raise RuntimeError(msg)
+    if _listening(path):
+        msg = f"a server is already listening on {path}"
+        raise RuntimeError(msg)
+    with suppress(FileNotFoundError):
+        Path(path).unlink()  # left behind by a server that did not shut down cleanly
+    umask = os.umask(0o077)
+    try:
+        return socketserver.UnixStreamServer(path, _Handler)
+    finally:
+        os.umask(umask)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:  # a probe checking if the server is up
+            return
+        request = json.loads(line)
+        response = _create(request["args"], request["cwd"], request["env"])
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _create(args: list[str], cwd: str, env: dict[str, str]) -> dict[str, object]:
+    from virtualenv.__main__ import run_with_catch  # ruff:ignore[import-outside-top-level]
+
+    env.pop(ENV_SOCKET, None)  # do not forward back to ourselves
+    stdout, stderr, code = io.StringIO(), io.StringIO(), 0
+    previous, token = os.getcwd(), _SERVING.set(True)
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            # relative paths in the command line are relative to the client, so requests are served one at a time
+            os.chdir(cwd)
+            run_with_catch(args, env)
+        except SystemExit as exception:
+            code = exception.code if isinstance(exception.code, int) else int(exception.code is not None)
+        except Exception:  # ruff:ignore[blind-except] # raised as is with --with-traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            os.chdir(previous)
+            _SERVING.reset(token)
+    return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def forward(args: list[str], env: Mapping[str, str]) -> int | None:
+    """Run the command line on the server the environment points to.
+
+    :param args: the command line arguments
+    :param env: the environment variables, :data:`ENV_SOCKET` selects the server
+
+    :returns: the exit code of the command, or ``None`` if no server is configured or reachable, or the command is not
+        a creation
+
+    """
+    path = env.get(ENV_SOCKET)
+    if not path or not hasattr(socket, "AF_UNIX") or any(map(_in_process, args)):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with client:
+        try:
+            client.connect(path)
+        except OSError:
+            LOGGER.debug("no virtualenv server on %s, run in process", path)
+            return None
+        request = {"args": args, "cwd": os.getcwd(), "env": {k: v for k, v in env.items() if k != ENV_SOCKET}}
+        try:
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as reader:
+                response = json.loads(reader.readline())
+        except (OSError, ValueError):  # the server stopped in the middle of the request
+            sys.stderr.write(f"the virtualenv server on {path} stopped without answering\n")
+            return 1
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["code"]
+
+
+def _in_process(arg: str) -> bool:
+    """:returns: ``True`` if the argument may select an option run in process, abbreviated as argparse allows too"""
+    name = arg.split("=", 1)[0]
+    return name.startswith("--") and name != "--" and any(i.startswith(name) for i in _IN_PROCESS)
+
+
+def _listening(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+__all__ = [
+    "ENV_SOCKET",
+    "forward",
+    "make_server",
+    "serve",
+]
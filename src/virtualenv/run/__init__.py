@@ -2,26 +2,38 @@ from __future__ import annotations
 
 import logging
 import os
+from argparse import ArgumentTypeError
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from virtualenv.app_data import make_app_data
+from virtualenv.app_data import BACKENDS, MEMORY_ONLY, AppDataDiskFolder, make_app_data
+from virtualenv.app_data.eviction import collect, parse_size
+from virtualenv.app_data.snapshot import export_app_data, import_app_data
 from virtualenv.config.cli.parser import VirtualEnvConfigParser, VirtualEnvOptions
 from virtualenv.report import LEVELS, setup_report
-from virtualenv.run.session import Session
+from virtualenv.run.session import Session, report_stats
 from virtualenv.seed.wheels.periodic_update import manual_upgrade
+from virtualenv.util.lock import set_lock_timeout
+from virtualenv.util.path import REFLINK_MODES, set_reflink_mode
+from virtualenv.util.timings import Timing, timed
 from virtualenv.version import __version__
 
 from .plugin.activators import ActivationSelector
+from .plugin.base import PluginLoader
 from .plugin.creators import CreatorSelector
 from .plugin.discovery import get_discover
 from .plugin.seeders import SeederSelector
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import MutableMapping, Sequence
 
     from .plugin.base import ComponentBuilder
 
+LOGGER = logging.getLogger(__name__)
+
 
 def cli_run(
     args: list[str],
@@ -42,11 +54,107 @@ def cli_run(
     """
     env = os.environ if env is None else env
     of_session = session_via_cli(args, options, setup_logging, env)
-    with of_session:
+    with of_session, report_stats():
         of_session.run()
     return of_session
 
 
+def cli_run_many(  # ruff:ignore[too-many-arguments]
+    destinations: Sequence[str],
+    args: list[str] | None = None,
+    options: VirtualEnvOptions | None = None,
+    setup_logging: bool = True,  # ruff:ignore[boolean-default-value-positional-argument]
+    env: MutableMapping[str, str] | None = None,
+    max_workers: int | None = None,
+) -> list[Session | Exception]:
+    """Create many virtual environments that share the same command line interface arguments.
+
+    Option parsing, plugin loading and interpreter discovery happen once for the whole batch, and all environments share
+    one seeder so the seed wheels are resolved and their images built only once. The creations themselves then run on a
+    bounded pool of worker threads.
+
+    :param destinations: the directories to create the virtual environments at
+    :param args: the command line arguments shared by every creation (must not contain the destination)
+    :param options: passing in a ``VirtualEnvOptions`` object allows return of the parsed options
+    :param setup_logging: ``True`` if setup logging handlers, ``False`` to use handlers already registered
+    :param env: environment variables to use
+    :param max_workers: the maximum number of creations to run at the same time, ``None`` picks a default based on the
+        number of CPUs
+
+    :returns: for every destination, in order, either the session object of the creation or the exception it failed with
+
+    """
+    env = os.environ if env is None else env
+    sessions = sessions_via_cli(destinations, args, options, setup_logging, env)
+    created = [session for session in sessions if isinstance(session, Session)]
+    if not created:
+        return sessions
+    # the sessions share the app data; the statistics are of the whole batch, as the creations run at the same time
+    with created[0], report_stats(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(session.run) if isinstance(session, Session) else None for session in sessions]
+    return [
+        session if future is None or (error := future.exception()) is None else error  # ty: ignore[invalid-return-type]
+        for session, future in zip(sessions, futures)
+    ]
+
+
+def sessions_via_cli(
+    destinations: Sequence[str],
+    args: list[str] | None = None,
+    options: VirtualEnvOptions | None = None,
+    setup_logging: bool = True,  # ruff:ignore[boolean-default-value-positional-argument]
+    env: MutableMapping[str, str] | None = None,
+) -> list[Session | Exception]:
+    """Create a virtualenv session for each destination (same as cli_run_many, but this does not perform the creation).
+
+    :param destinations: the directories to create the virtual environments at
+    :param args: the command line arguments shared by every creation (must not contain the destination)
+    :param options: passing in a ``VirtualEnvOptions`` object allows return of the parsed options
+    :param setup_logging: ``True`` if setup logging handlers, ``False`` to use handlers already registered
+    :param env: environment variables to use
+
+    :returns: for every destination, in order, either its session object or the exception raised while validating it
+
+    """
+    env = os.environ if env is None else env
+    args = [] if args is None else list(args)
+    parsed = Timing("virtualenv")  # parsing is shared, so every session reports it
+    with parsed.activate(), timed("parse"):
+        parser, (creator_builder, seeder_builder, activation_builder) = build_parser(args, options, setup_logging, env)
+        validated: list[str | Exception] = []
+        for destination in destinations:
+            try:
+                validated.append(creator_builder._impl_class.validate_dest(str(destination)))  # ruff:ignore[private-member-access]  # ty: ignore[unresolved-attribute]
+            except ArgumentTypeError as exception:  # ruff:ignore[try-except-in-loop]
+                validated.append(exception)
+        if (first := next((i for i in validated if isinstance(i, str)), None)) is None:
+            return validated  # ty: ignore[invalid-return-type]
+        options = parser.parse_args([*args, first])  # ty: ignore[invalid-assignment]
+        options.py_version = parser._interpreter.version_info  # ruff:ignore[private-member-access]  # ty: ignore[invalid-assignment, unresolved-attribute]
+        seeder = seeder_builder.create(options)  # ty: ignore[invalid-argument-type]
+    sessions: list[Session | Exception] = []
+    for dest in validated:
+        if isinstance(dest, Exception):
+            sessions.append(dest)
+            continue
+        of_options = copy(options)
+        of_options.dest = dest
+        timings = Timing(parsed.name)
+        timings.elapsed, timings.children = parsed.elapsed, list(parsed.children)
+        sessions.append(
+            Session(
+                options.verbosity,  # ty: ignore[unresolved-attribute, invalid-argument-type]
+                options.app_data,  # ty: ignore[unresolved-attribute]
+                parser._interpreter,  # ruff:ignore[private-member-access]  # ty: ignore[invalid-argument-type]
+                creator_builder.create(of_options),  # ty: ignore[invalid-argument-type]
+                seeder,  # ty: ignore[invalid-argument-type]
+                activation_builder.create(of_options),  # ty: ignore[invalid-argument-type]
+                timings,
+            )
+        )
+    return sessions
+
+
 def session_via_cli(
     args: list[str],
     options: VirtualEnvOptions | None = None,
@@ -65,13 +173,15 @@ def session_via_cli(
 
     """
     env = os.environ if env is None else env
-    parser, elements = build_parser(args, options, setup_logging, env)
-    options = parser.parse_args(args)  # ty: ignore[invalid-assignment]
-    options.py_version = parser._interpreter.version_info  # ruff:ignore[private-member-access]  # ty: ignore[invalid-assignment, unresolved-attribute]
-    creator, seeder, activators = tuple(
-        e.create(options)  # ty: ignore[invalid-argument-type]
-        for e in elements
-    )  # create types
+    timings = Timing("virtualenv")
+    with timings.activate(), timed("parse"):
+        parser, elements = build_parser(args, options, setup_logging, env)
+        options = parser.parse_args(args)  # ty: ignore[invalid-assignment]
+        options.py_version = parser._interpreter.version_info  # ruff:ignore[private-member-access]  # ty: ignore[invalid-assignment, unresolved-attribute]
+        creator, seeder, activators = tuple(
+            e.create(options)  # ty: ignore[invalid-argument-type]
+            for e in elements
+        )  # create types
     return Session(
         options.verbosity,  # ty: ignore[unresolved-attribute, invalid-argument-type]
         options.app_data,  # ty: ignore[unresolved-attribute]
@@ -79,6 +189,7 @@ def session_via_cli(
         creator,  # ty: ignore[invalid-argument-type]
         seeder,  # ty: ignore[invalid-argument-type]
         activators,  # ty: ignore[invalid-argument-type]
+        timings,
     )
 
 
@@ -97,23 +208,51 @@ def build_parser(
         default=False,
         help="on failure also display the stacktrace internals of virtualenv",
     )
+    parser.add_argument(
+        "--reflink",
+        choices=REFLINK_MODES,
+        default="auto",
+        help="copy files as copy-on-write clones where the file system supports it (btrfs, XFS): auto falls back to a "
+        "regular copy, always fails if a clone is not possible, never always does a regular copy",
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        metavar="seconds",
+        type=float,
+        default=None,
+        help="fail instead of waiting longer than this for a lock of the app data held by another process (by default "
+        "wait as long as it takes, reporting the holder every 10 seconds)",
+    )
+    parser.add_argument(
+        "--timings",
+        choices=["text", "json"],
+        default=None,
+        help="report how long each stage of the creation took, as an indented tree (text) or as JSON on the standard "
+        "output (combine with -q to get only the JSON)",
+    )
     _do_report_setup(parser, args, setup_logging)
-    options = load_app_data(args, parser, options)
+    with timed("app data"):
+        options = load_app_data(args, parser, options)
+    PluginLoader.index_in(options.app_data)  # ty: ignore[invalid-argument-type]
+    set_reflink_mode(options.reflink)  # ty: ignore[invalid-argument-type]
+    set_lock_timeout(options.lock_timeout)  # ty: ignore[invalid-argument-type]
     handle_extra_commands(options)
 
-    discover = get_discover(parser, args)
-    parser._interpreter = interpreter = discover.interpreter  # ruff:ignore[private-member-access]
+    with timed("discovery"):
+        discover = get_discover(parser, args)
+        parser._interpreter = interpreter = discover.interpreter  # ruff:ignore[private-member-access]
     if interpreter is None:
         msg = f"failed to find interpreter for {discover}"
         raise RuntimeError(msg)
-    elements: list[ComponentBuilder] = [
-        CreatorSelector(interpreter, parser),
-        SeederSelector(interpreter, parser),
-        ActivationSelector(interpreter, parser),
-    ]
-    options, _ = parser.parse_known_args(args)
-    for element in elements:
-        element.handle_selected_arg_parse(options)
+    with timed("plugin load"):
+        elements: list[ComponentBuilder] = [
+            CreatorSelector(interpreter, parser),
+            SeederSelector(interpreter, parser),
+            ActivationSelector(interpreter, parser),
+        ]
+        options, _ = parser.parse_known_args(args)
+        for element in elements:
+            element.handle_selected_arg_parse(options)
     parser.enable_help()
     return parser, elements
 
@@ -127,6 +266,31 @@ def handle_extra_commands(options: VirtualEnvOptions) -> None:
     if options.upgrade_embed_wheels:
         result = manual_upgrade(options.app_data, options.env)
         raise SystemExit(result)
+    app_data = options.app_data
+    writable = isinstance(app_data, AppDataDiskFolder) and not app_data.transient and app_data.can_update
+    if options.app_data_gc:
+        if not writable:
+            LOGGER.error("app data %s is not a writable folder, nothing to collect", app_data)
+            raise SystemExit(1)
+        collect(app_data, options.app_data_max_size)
+        raise SystemExit(0)
+    if options.app_data_export:
+        if not isinstance(app_data, AppDataDiskFolder) or app_data.transient:
+            LOGGER.error("app data %s is not a folder, nothing to export", app_data)
+            raise SystemExit(1)
+        export_app_data(app_data.lock.path, Path(options.app_data_export))
+        raise SystemExit(0)
+    if options.app_data_import:
+        if not writable:
+            LOGGER.error("app data %s is not a writable folder, cannot import into it", app_data)
+            raise SystemExit(1)
+        app_data.close()  # release the content store, the import might add to it
+        import_app_data(app_data.lock.path, Path(options.app_data_import))
+        raise SystemExit(0)
+    if options.serve:
+        from virtualenv.daemon import serve  # ruff:ignore[import-outside-top-level]
+
+        raise SystemExit(serve(options.serve))
 
 
 def load_app_data(
@@ -137,14 +301,25 @@ def load_app_data(
         action="store_true",
         help="use app data folder in read-only mode (write operations will fail with error)",
     )
+    parser.add_argument(
+        "--backend-app-data",
+        choices=[*BACKENDS, MEMORY_ONLY],
+        default="folder",
+        help="keep the cached content of the app data (interpreter information, plugin index, embed update logs) as "
+        "JSON files guarded by lock files in the folder, in a single SQLite database in it, in memory above the JSON "
+        "files, or only in memory with the wheels in a temporary folder (nothing persists)",
+    )
     options, _ = parser.parse_known_args(args, namespace=options)
 
     # here we need a write-able application data (e.g. the zipapp might need this for discovery cache)
-    parser.add_argument(
+    make = partial(
+        make_app_data, read_only=options.read_only_app_data, env=options.env, backend=options.backend_app_data
+    )
+    app_data = parser.add_argument(
         "--app-data",
         help="a data folder used as cache by the virtualenv",
-        type=partial(make_app_data, read_only=options.read_only_app_data, env=options.env),
-        default=make_app_data(None, read_only=options.read_only_app_data, env=options.env),
+        type=make,
+        default=make(None),
     )
     parser.add_argument(
         "--reset-app-data",
@@ -156,7 +331,59 @@ def load_app_data(
         action="store_true",
         help="trigger a manual update of the embedded wheels",
     )
+    parser.add_argument(
+        "--serve",
+        metavar="socket",
+        default=None,
+        help="keep running and create virtual environments for the clients connecting to this Unix domain socket; "
+        "the virtualenv command forwards to it when VIRTUALENV_DAEMON_SOCKET points to the socket",
+    )
+    parser.add_argument(
+        "--app-data-max-size",
+        metavar="size",
+        type=parse_size,
+        default=None,
+        help="keep the app data folder within this size (such as 500M or 2G): once a day a creation triggers a "
+        "background process evicting the least recently used wheel images, wheels and caches",
+    )
+    parser.add_argument(
+        "--app-data-gc",
+        action="store_true",
+        help="remove the stale content of the app data folder, and evict the least recently used content until it "
+        "fits within --app-data-max-size (if set), then exit",
+    )
+    parser.add_argument(
+        "--app-data-export",
+        metavar="archive",
+        default=None,
+        help="write the app data folder (wheel images, interpreter information, embed update logs) into this tar "
+        "archive, compressed if the name ends with .gz, .bz2 or .xz, then exit",
+    )
+    parser.add_argument(
+        "--app-data-import",
+        metavar="archive",
+        default=None,
+        help="restore an archive written by --app-data-export into the app data folder, keeping the content already "
+        "there, then exit",
+    )
+    parser.add_argument(
+        "--app-data-lease-locks",
+        action="store_true",
+        help="lock the app data folder with lease files instead of file system locks from now on, for a folder shared "
+        "between hosts over a network file system (the choice is kept in the folder, switch while no one uses it)",
+    )
     options, _ = parser.parse_known_args(args, namespace=options)
+    if options.app_data_lease_locks:
+        folder = options.app_data
+        if isinstance(folder, AppDataDiskFolder) and not folder.transient and folder.can_update:
+            folder.use_lease_locks()
+        else:
+            LOGGER.warning("app data %s is not a writable folder, keep its locking as is", folder)
+    if options.app_data_max_size is not None:  # later parses convert the app data anew, give them the budget too
+        app_data.type = make = partial(make, max_size=options.app_data_max_size)
+        app_data.default = make(None)
+        if isinstance(options.app_data, AppDataDiskFolder):
+            options.app_data.max_size = options.app_data_max_size
     if options.reset_app_data:
         options.app_data.reset()
     return options
@@ -193,5 +420,7 @@ def _do_report_setup(parser: VirtualEnvConfigParser, args: list[str] | None, set
 
 __all__ = [
     "cli_run",
+    "cli_run_many",
     "session_via_cli",
+    "sessions_via_cli",
 ]
@@ -1,40 +1,112 @@
 from __future__ import annotations
 
+import logging
+import os
 import sys
 from collections import OrderedDict
-from importlib.metadata import entry_points
+from collections.abc import Mapping
+from importlib.metadata import EntryPoint, entry_points
 from typing import TYPE_CHECKING
 
+from virtualenv.util.timings import timed
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from python_discovery import PythonInfo
 
+    from virtualenv.app_data.base import AppData
     from virtualenv.config.cli.parser import VirtualEnvConfigParser, VirtualEnvOptions
 
+LOGGER = logging.getLogger(__name__)
+
 
 class PluginLoader:
     _OPTIONS = None
-    _ENTRY_POINTS = None
+    _ENTRY_POINTS: dict[str, list[EntryPoint]] | None = None
+    _APP_DATA: AppData | None = None
 
     @classmethod
-    def entry_points_for(cls, key: str) -> OrderedDict[str, type]:
-        if sys.version_info >= (3, 10):
-            selected = list(cls.entry_points().select(group=key))  # ty: ignore[unresolved-attribute]
-        else:
-            selected = list(cls.entry_points().get(key, []))  # ty: ignore[unresolved-attribute]
-        # Third-party packages may register entry points with the same name as virtualenv's
-        # built-ins (e.g. xonsh's own `virtualenv.activate.xonsh`). Sort so built-ins are
-        # inserted last into the OrderedDict, making them win on name collision.
-        selected.sort(key=lambda e: e.value.startswith("virtualenv."))
-        return OrderedDict((e.name, e.load()) for e in selected)
+    def entry_points_for(cls, key: str) -> Mapping[str, type]:
+        with timed(f"load {key}"):
+            selected = list(cls.entry_points().get(key, []))
+            # Third-party packages may register entry points with the same name as virtualenv's
+            # built-ins (e.g. xonsh's own `virtualenv.activate.xonsh`). Sort so built-ins are
+            # inserted last into the OrderedDict, making them win on name collision.
+            selected.sort(key=lambda e: e.value.startswith("virtualenv."))
+            return LazyPlugins(selected)
 
     @staticmethod
-    def entry_points() -> object:
+    def entry_points() -> dict[str, list[EntryPoint]]:
         if PluginLoader._ENTRY_POINTS is None:
-            PluginLoader._ENTRY_POINTS = entry_points()
+            PluginLoader._ENTRY_POINTS = _load_entry_points(PluginLoader._APP_DATA)
         return PluginLoader._ENTRY_POINTS
 
+    @staticmethod
+    def index_in(app_data: AppData) -> None:
+        """Keep the index of the plugin entry points in the app data, so later runs can skip scanning for them."""
+        PluginLoader._APP_DATA = app_data
+
+
+class LazyPlugins(Mapping):
+    """Plugin classes by name, importing a plugin only when its class is first accessed."""
+
+    def __init__(self, entry_points: list[EntryPoint]) -> None:
+        self._entry_points = OrderedDict((e.name, e) for e in entry_points)
+        self._loaded: dict[str, type] = {}
+
+    def __getitem__(self, key: str) -> type:
+        if key not in self._loaded:
+            self._loaded[key] = self._entry_points[key].load()
+        return self._loaded[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entry_points
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entry_points)
+
+    def __len__(self) -> int:
+        return len(self._entry_points)
+
+
+def _load_entry_points(app_data: AppData | None) -> dict[str, list[EntryPoint]]:
+    # scanning walks every distribution on sys.path, so keep the outcome until a folder on sys.path changes; leave out the
+    # working directory, which changes along with the environments created within
+    cwd = os.path.realpath(os.getcwd())
+    paths = [path for path in sys.path if path and os.path.realpath(path) != cwd]
+    store = None if app_data is None else app_data.plugin_index(sys.executable, paths)
+    fingerprint = [[path, _mtime(path)] for path in paths]
+    data = store.read() if store is not None and store.exists() else None
+    if isinstance(data, dict) and data.get("fingerprint") == fingerprint:
+        groups = data["groups"]
+    else:
+        groups = _scan_entry_points()
+        if store is not None and app_data.can_update:  # ty: ignore[possibly-missing-attribute]
+            with store.locked():
+                store.write({"fingerprint": fingerprint, "groups": groups})
+    return {group: [EntryPoint(name, value, group) for name, value in pairs] for group, pairs in groups.items()}
+
+
+def _scan_entry_points() -> dict[str, list[list[str]]]:
+    found = entry_points()
+    if sys.version_info >= (3, 10):
+        by_group = {group: found.select(group=group) for group in found.groups}
+    else:
+        by_group = found
+    return {
+        group: [[e.name, e.value] for e in values]
+        for group, values in by_group.items()
+        if group.startswith("virtualenv.")
+    }
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
 class ComponentBuilder(PluginLoader):
     def __init__(
@@ -48,7 +120,7 @@ class ComponentBuilder(PluginLoader):
         self.add_selector_arg_parse(name, list(self.possible))
 
     @classmethod
-    def options(cls, key: str) -> OrderedDict[str, type]:
+    def options(cls, key: str) -> Mapping[str, type]:
         if cls._OPTIONS is None:
             cls._OPTIONS = cls.entry_points_for(key)
         return cls._OPTIONS
@@ -77,5 +149,6 @@ class ComponentBuilder(PluginLoader):
 
 __all__ = [
     "ComponentBuilder",
+    "LazyPlugins",
     "PluginLoader",
 ]
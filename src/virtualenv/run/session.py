@@ -3,9 +3,17 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from typing import TYPE_CHECKING
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+from virtualenv.util.lock import LockWait, lock_waits
+from virtualenv.util.path import copy_stats
+from virtualenv.util.timings import Timing, in_context, timed
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from concurrent.futures import Future
     from types import TracebackType
 
     from python_discovery import PythonInfo
@@ -14,6 +22,7 @@ if TYPE_CHECKING:
     from virtualenv.app_data.base import AppData
     from virtualenv.create.creator import Creator
     from virtualenv.seed.seeder import Seeder
+    from virtualenv.util.path import CopyStats
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -34,6 +43,7 @@ class Session:
         creator: Creator,
         seeder: Seeder,
         activators: list[Activator],
+        timings: Timing | None = None,
     ) -> None:
         self._verbosity = verbosity
         self._app_data = app_data
@@ -41,6 +51,7 @@ class Session:
         self._creator = creator
         self._seeder = seeder
         self._activators = activators
+        self._timings = Timing("virtualenv") if timings is None else timings
 
     @property
     def verbosity(self) -> int:
@@ -67,11 +78,20 @@ class Session:
         """Activators used to generate activations scripts."""
         return self._activators
 
+    @property
+    def timings(self) -> Timing:
+        """How long the stages of the session (parsing included) took, as a tree of timings."""
+        return self._timings
+
     def run(self) -> None:
-        self._create()
-        self._seed()
-        self._activate()
-        self.creator.pyenv_cfg.write()
+        with self._timings.activate():
+            _run_stages([
+                _Stage("create", (), self._create),
+                _Stage("prepare seed", (), self._prepare_seed),
+                _Stage("seed", ("create", "prepare seed"), self._seed),
+                _Stage("activate", ("create",), self._activate),
+                _Stage("pyenv.cfg", ("seed", "activate"), self.creator.pyenv_cfg.write),
+            ])
 
     def _create(self) -> None:
         LOGGER.info("create virtual environment via %s", self.creator)
@@ -79,8 +99,14 @@ class Session:
         LOGGER.debug(_DEBUG_MARKER)
         LOGGER.debug("%s", _Debug(self.creator))
 
+    def _prepare_seed(self) -> None:
+        if self.creator.from_template is None and self.seeder is not None and self.seeder.enabled:
+            self.seeder.prepare(self.creator)
+
     def _seed(self) -> None:
-        if self.seeder is not None and self.seeder.enabled:
+        if self.creator.from_template is not None:
+            LOGGER.debug("seed packages provided by template %s", self.creator.from_template)
+        elif self.seeder is not None and self.seeder.enabled:
             LOGGER.info("add seed packages via %s", self.seeder)
             self.seeder.run(self.creator)
 
@@ -89,7 +115,8 @@ class Session:
             active = ", ".join(type(i).__name__.replace("Activator", "") for i in self.activators)
             LOGGER.info("add activators for %s", active)
             for activator in self.activators:
-                activator.generate(self.creator)
+                with timed(type(activator).__name__):
+                    activator.generate(self.creator)
 
     def __enter__(self) -> Self:
         return self
@@ -100,9 +127,73 @@ class Session:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if self._seeder is not None:
+            self._seeder.close()
         self._app_data.close()
 
 
+class _Stage(NamedTuple):
+    name: str
+    requires: tuple[str, ...]
+    run: Callable[[], None]
+
+
+@contextmanager
+def report_stats() -> Generator[None, None, None]:
+    """Report the files copied and the locks contended by the creations run within, once for all of them.
+
+    The counters are kept for the whole process, so creations running at the same time cannot tell theirs apart.
+
+    """
+    copied_before, waits_before = copy_stats(), lock_waits()
+    try:
+        yield
+    finally:
+        _report_copies(copy_stats() - copied_before)
+        _report_locks({k: v - waits_before.get(k, LockWait()) for k, v in lock_waits().items()})
+
+
+def _report_copies(copied: CopyStats) -> None:
+    if any(copied):
+        LOGGER.info("copied %d files: %d reflinked, %d in kernel, %d regular", sum(copied), *copied)
+
+
+def _report_locks(waits: dict[str, LockWait]) -> None:
+    contended = sorted(((k, v) for k, v in waits.items() if v.contended), key=lambda i: -i[1].waited)
+    if contended:
+        total = sum(v.waited for _, v in contended)
+        lines = [f"waited {total * 1000:.0f}ms for {len(contended)} contended locks:"]
+        lines.extend(
+            f"  {lock_file} {v.waited * 1000:.0f}ms, contended {v.contended} of {v.acquired} times"
+            for lock_file, v in contended
+        )
+        LOGGER.info("\n".join(lines))
+
+
+def _run_stages(stages: list[_Stage]) -> None:
+    """Run each stage as soon as the stages it requires are done, so independent stages overlap.
+
+    On failure no new stages start, the ones already running are waited for and the first failure is raised.
+
+    """
+    pending, done = list(stages), set()
+    with ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="virtualenv-stage") as executor:
+        running: dict[Future[None], _Stage] = {}
+        while pending or running:
+            for stage in [i for i in pending if done.issuperset(i.requires)]:
+                pending.remove(stage)
+                running[executor.submit(in_context(_run_stage), stage)] = stage
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+                done.add(running.pop(future).name)
+
+
+def _run_stage(stage: _Stage) -> None:
+    with timed(stage.name):
+        stage.run()
+
+
 _DEBUG_MARKER = "=" * 30 + " target debug " + "=" * 30
 
 
@@ -118,4 +209,5 @@ class _Debug:
 
 __all__ = [
     "Session",
+    "report_stats",
 ]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import re
 from abc import ABC
-from argparse import SUPPRESS
+from argparse import SUPPRESS, ArgumentTypeError
+from functools import partial
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -20,6 +23,10 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 PERIODIC_UPDATE_ON_BY_DEFAULT = True
+# only a name and an exact version: the wheel is looked up by its file name, not resolved
+_SEED_PACKAGE_RE = re.compile(
+    r"^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(?:==\s*(?P<version>[A-Za-z0-9._+!-]+))?\s*$"
+)
 
 
 class BaseEmbed(Seeder, ABC):
@@ -36,6 +43,11 @@ class BaseEmbed(Seeder, ABC):
         # warning below fires only when you pass --wheel or --no-wheel
         self.wheel_version = options.wheel or "none"
 
+        #: the packages to seed in addition to the embedded ones, by their name, ``None`` for the latest version found
+        self.seed_packages: dict[str, str | None] = dict([
+            *chain.from_iterable(options.seed_requirements),
+            *options.seed_package,
+        ])
         self.no_pip = options.no_pip
         self.no_setuptools = options.no_setuptools
         self.app_data = options.app_data
@@ -59,13 +71,23 @@ class BaseEmbed(Seeder, ABC):
             "wheel": Version.bundle,
         }
 
-    def distribution_to_versions(self) -> dict[str, str]:
+    def distribution_to_versions(self) -> dict[str, str | None]:
         return {
-            distribution: getattr(self, f"{distribution}_version")
-            for distribution in self.distributions()
-            if getattr(self, f"no_{distribution}", None) is False and getattr(self, f"{distribution}_version") != "none"
+            **{
+                distribution: getattr(self, f"{distribution}_version")
+                for distribution in self.distributions()
+                if getattr(self, f"no_{distribution}", None) is False
+                and getattr(self, f"{distribution}_version") != "none"
+            },
+            **self.seed_packages,
         }
 
+    def wheel_search(self, distribution: str) -> tuple[list[Path], bool]:
+        """:returns: the folders to look for the wheel of the distribution in, and if it is periodically updated"""
+        if distribution in self.seed_packages:  # not embedded, so only the wheels found locally (or downloaded)
+            return [*self.extra_search_dir, self.app_data.house], False
+        return self.extra_search_dir, self.periodic_update
+
     @classmethod
     def cannot_seed(cls, interpreter: PythonInfo) -> str | None:
         """Explain why the bundled wheels cannot seed the target Python version.
@@ -139,6 +161,25 @@ class BaseEmbed(Seeder, ABC):
                 help=help_,
                 default=False,
             )
+        parser.add_argument(
+            "--seed-package",
+            dest="seed_package",
+            metavar="NAME[==VER]",
+            action="append",
+            type=partial(_seed_package, cls.distributions()),
+            help="an additional package to seed from a wheel in --extra-search-dir or the app data wheel house (or "
+            "downloaded with --download), the latest found if no version is given (can be set 1+ times)",
+            default=[],
+        )
+        parser.add_argument(
+            "--seed-requirements",
+            dest="seed_requirements",
+            metavar="file",
+            action="append",
+            type=partial(_seed_requirements, cls.distributions()),
+            help="a file listing additional packages to seed, one NAME[==VER] per line (can be set 1+ times)",
+            default=[],
+        )
         parser.add_argument(
             "--no-periodic-update",
             dest="no_periodic_update",
@@ -161,9 +202,33 @@ class BaseEmbed(Seeder, ABC):
                 continue
             ver = f"={version or 'latest'}"
             result += f" {distribution}{ver},"
+        for distribution, version in self.seed_packages.items():
+            result += f" {distribution}={version or 'latest'},"
         return result[:-1] + ")"
 
 
+def _seed_package(embedded: dict[str, str], value: str) -> tuple[str, str | None]:
+    match = _SEED_PACKAGE_RE.match(value)
+    if match is None:
+        msg = f"invalid seed package {value!r}, expected NAME or NAME==VERSION"
+        raise ArgumentTypeError(msg)
+    name = match.group("name")
+    if name.lower() in embedded:
+        msg = f"seed {name} with --{name.lower()} instead of --seed-package"
+        raise ArgumentTypeError(msg)
+    return name, match.group("version")
+
+
+def _seed_requirements(embedded: dict[str, str], value: str) -> list[tuple[str, str | None]]:
+    try:
+        lines = Path(value).read_text(encoding="utf-8").splitlines()
+    except OSError as exception:
+        msg = f"cannot read seed requirements {value}: {exception}"
+        raise ArgumentTypeError(msg) from exception
+    requirements = (line.split("#", 1)[0] for line in lines)
+    return [_seed_package(embedded, requirement) for requirement in requirements if requirement.strip()]
+
+
 __all__ = [
     "BaseEmbed",
 ]
@@ -58,14 +58,15 @@ class PipInvoke(BaseEmbed):
             cmd.append("--no-index")
         folders = set()
         for dist, version in self.distribution_to_versions().items():
+            search_dirs, do_periodic_update = self.wheel_search(dist)
             wheel = get_wheel(
                 distribution=dist,
                 version=version,
                 for_py_version=for_py_version,
-                search_dirs=self.extra_search_dir,
+                search_dirs=search_dirs,
                 download=False,
                 app_data=self.app_data,
-                do_periodic_update=self.periodic_update,
+                do_periodic_update=do_periodic_update,
                 env=self.env,
             )
             if wheel is None:
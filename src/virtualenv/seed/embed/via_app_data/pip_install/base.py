@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import ntpath
 import os
@@ -8,20 +10,48 @@ import re
 import zipfile
 from abc import ABC, abstractmethod
 from configparser import ConfigParser
+from contextlib import contextmanager
 from itertools import chain
 from pathlib import Path
+from subprocess import PIPE, Popen
 from tempfile import mkdtemp
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
+from uuid import uuid4
 
 from distlib.scripts import ScriptMaker, enquote_executable
 
-from virtualenv.util.path import safe_delete
+from virtualenv.app_data.eviction import mark_used
+from virtualenv.util.path import copy, hardlink, safe_delete
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from virtualenv.create.creator import Creator
+    from virtualenv.util.lock import PathLockBase
+
+    from .compiler import Compiler
 
 LOGGER = logging.getLogger(__name__)
 
+#: the manifest an image is stamped with once complete, within the image but never installed
+MANIFEST = ".virtualenv-image.json"
+_MANIFEST_VERSION = 1
+_VERIFIED: dict[Path, tuple[int, int]] = {}  #: images found complete by this process, by the stat of their manifest
+#: how the bytecode of the images is compiled by default: for imports without ``-O``, checked against the source
+#: timestamp as the copies of the sources keep their modification time
+DEFAULT_OPTIMIZE = (0,)
+DEFAULT_INVALIDATION_MODE = "timestamp"
+INVALIDATION_MODES = ("checked-hash", "unchecked-hash", "timestamp")
+
+
+class CompileSpec(NamedTuple):
+    """How the bytecode of the images gets compiled."""
+
+    optimize: tuple[int, ...] = DEFAULT_OPTIMIZE  #: the optimization levels to compile for
+    invalidation_mode: str = DEFAULT_INVALIDATION_MODE  #: how the interpreter checks the bytecode is up to date
+    workers: int = 0  #: the number of processes compiling in parallel, one per CPU if zero
+    compiler: Compiler | None = None  #: the long-lived process to compile with, a process per image if not set
+
 
 def _safe_extract_zip(zip_ref: zipfile.ZipFile, target_dir: Path) -> None:
     # Guard against zip slip: a wheel is a zip and a tampered entry name (absolute path or one containing ``..``)
@@ -42,10 +72,20 @@ def _safe_extract_zip(zip_ref: zipfile.ZipFile, target_dir: Path) -> None:
 
 
 class PipInstall(ABC):
-    def __init__(self, wheel: Path, creator: Creator, image_folder: Path) -> None:
+    def __init__(
+        self,
+        wheel: Path,
+        creator: Creator,
+        image_folder: Path,
+        content: PathLockBase | None = None,
+        compile_spec: CompileSpec = CompileSpec(),  # ruff:ignore[function-call-in-default-argument]
+    ) -> None:
         self._wheel = wheel
         self._creator = creator
-        self._image_dir = image_folder
+        self._image_folder = image_folder  # where the image lives once complete
+        self._image_dir = image_folder  # where the image is at the moment, a staging directory while being built
+        self._content = content  # the store of extracted wheels shared by the images, extract per image if not set
+        self._compile_with = compile_spec._replace(optimize=tuple(sorted(set(compile_spec.optimize))))
         self._extracted = False
         self.__dist_info = None
         self._console_entry_points = None
@@ -59,6 +99,8 @@ class PipInstall(ABC):
         self._uninstall_previous_version()
         # sync image
         for filename in self._image_dir.iterdir():
+            if filename.name == MANIFEST:
+                continue
             into = self._creator.purelib / filename.name
             self._sync(filename, into)
         # generate console executables
@@ -69,38 +111,110 @@ class PipInstall(ABC):
         LOGGER.debug("generated console scripts %s", " ".join(i.name for i in consoles))
 
     def build_image(self) -> None:
-        """Extract the seed wheel into the image directory and fix up its RECORD file.
+        """Build the image in a staging directory next to the image directory, then rename it into place.
 
-        Each archive entry is validated before extraction so a tampered wheel cannot escape the image directory via an
-        absolute path or ``..`` traversal.
+        The staged image is stamped with a manifest (see :meth:`has_image`) before the rename, so an image directory
+        is always complete: a build that dies midway leaves at most a staging directory behind, and an image that does
+        not match its manifest (built by an older version, or damaged since) is replaced.
 
         :raises RuntimeError: if the wheel contains an entry that would land outside the image directory.
 
         """
-        # 1. first extract the wheel
+        self._image_folder.parent.mkdir(parents=True, exist_ok=True)
+        self._image_dir = self._image_folder.with_name(f".{self._image_folder.name}.{uuid4().hex[:8]}.staging")
+        self._image_dir.mkdir()
+        try:
+            self._build_image()
+            if self._image_folder.exists():
+                safe_delete(self._image_folder)
+            os.replace(self._image_dir, self._image_folder)
+        except BaseException:
+            safe_delete(self._image_dir)
+            raise
+        finally:
+            self._image_dir = self._image_folder
+
+    def _build_image(self) -> None:
+        """Fill the image directory with the content of the seed wheel, fix up its RECORD file and stamp it.
+
+        The wheel is extracted once into the content store (keyed by the hash of the wheel, so shared between the
+        images of every Python version and install method), images take their files from there; without a store the
+        wheel is extracted into the image directly.
+
+        """
+        identity = self._wheel_identity()
+        # 1. first get the content of the wheel
         LOGGER.debug("build install image for %s to %s", self._wheel.name, self._image_dir)
-        with zipfile.ZipFile(str(self._wheel)) as zip_ref:
-            self._shorten_path_if_needed(zip_ref)
-            _safe_extract_zip(zip_ref, self._image_dir)
-            self._extracted = True
+        if self._content is None:
+            self._image_dir, _ = _extract_wheel(self._wheel, self._image_dir)
+        else:
+            with self._wheel_content(identity["sha256"]) as (content, longest):
+                self._image_dir = _short_path(self._image_dir, longest)
+                for entry in content.iterdir():
+                    if entry.name != MANIFEST:
+                        self._populate(entry, self._image_dir / entry.name)
+        self._extracted = True
         # 2. now add additional files not present in the distribution
         new_files = self._generate_new_files()
-        # 3. finally fix the records file
+        # 3. then fix the records file
         self._fix_records(new_files)
+        # 4. finally mark the image complete
+        manifest = {
+            "version": _MANIFEST_VERSION,
+            "wheel": identity,
+            "compile": self._compile_spec(),
+            **_count_files(self._image_dir, self._compile_with.optimize),
+        }
+        (self._image_dir / MANIFEST).write_text(json.dumps(manifest, sort_keys=True, indent=2), encoding="utf-8")
+
+    def _populate(self, src: Path, dst: Path) -> None:
+        """Take an entry of the wheel content into the image, the dist-info is rewritten per image so gets copied."""
+        (copy if src.suffix == ".dist-info" else hardlink)(src, dst)
 
-    def _shorten_path_if_needed(self, zip_ref: zipfile.ZipFile) -> None:
-        if os.name == "nt":
-            to_folder = str(self._image_dir)
-            # https://docs.microsoft.com/en-us/windows/win32/fileio/maximum-file-path-limitation
-            zip_max_len = max(len(i) for i in zip_ref.namelist())
-            path_len = zip_max_len + len(to_folder)
-            if path_len > 260:  # ruff:ignore[magic-value-comparison]
-                self._image_dir.mkdir(exist_ok=True)  # to get a short path must exist
+    @contextmanager
+    def _wheel_content(self, digest: str) -> Generator[tuple[Path, int]]:
+        """Extract the wheel into the content store unless there already, and keep it in place while in use.
 
-                from virtualenv.util.path import get_short_path_name  # ruff:ignore[import-outside-top-level]
+        :returns: the folder holding the content, and the length of the longest entry name within
 
-                to_folder = get_short_path_name(to_folder)
-                self._image_dir = Path(to_folder)
+        """
+        content, name = self._content, digest[:32]
+        folder = content.path / name  # ty: ignore[unresolved-attribute]
+        with content.shared_lock_for_key(name):  # ty: ignore[unresolved-attribute]
+            if (longest := _content_longest(folder)) is not None:
+                mark_used(folder)
+                yield folder, longest
+                return
+        with content.exclusive_lock_for_key(name):  # ty: ignore[unresolved-attribute]
+            if (longest := _content_longest(folder)) is None:
+                if folder.exists():
+                    LOGGER.warning("wheel content %s is damaged, extract it again", folder)
+                    safe_delete(folder)
+                _, longest = _extract_wheel(self._wheel, folder)
+                content_manifest = {"version": _MANIFEST_VERSION, "longest": longest, **_count_files(folder)}
+                (folder / MANIFEST).write_text(json.dumps(content_manifest, sort_keys=True), encoding="utf-8")
+            yield folder, longest
+
+    def _compile(self, dest: Path | None = None) -> None:
+        """Compile the bytecode of the image for the target interpreter, spreading the files over a pool of workers.
+
+        :param dest: the folder to record in the bytecode as the location of the sources, the image directory if not set
+            (the interpreter corrects it on import anyway, it only shows up when inspecting the bytecode)
+
+        """
+        spec, folder = self._compile_with, self._image_dir
+        if spec.compiler is not None:
+            failed = spec.compiler.compile(folder, dest, spec.optimize, spec.invalidation_mode)
+        else:
+            failed = _compile_in_process(self._creator, folder, dest, spec)
+        if failed:  # the files that failed to compile are compiled on first import instead
+            LOGGER.warning("failed to compile the bytecode of %s:\n%s", self._wheel.name, "\n".join(failed))
+
+    def _compile_spec(self) -> dict[str, Any]:
+        return {
+            "optimize": list(self._compile_with.optimize),
+            "invalidation_mode": self._compile_with.invalidation_mode,
+        }
 
     def _records_text(self, files: set[Path] | list[Path]) -> str:
         return "\n".join(f"{os.path.relpath(str(rec), str(self._image_dir))},," for rec in files)
@@ -217,7 +331,117 @@ class PipInstall(ABC):
             safe_delete(self._image_dir)
 
     def has_image(self) -> bool:
-        return self._image_dir.exists() and any(self._image_dir.iterdir())
+        """:returns: ``True`` if the image is complete: stamped from this wheel, and no file went missing since"""
+        manifest_file = self._image_folder / MANIFEST
+        try:
+            stat = manifest_file.stat()
+            if _VERIFIED.get(self._image_folder) == (stat.st_ino, stat.st_mtime_ns):
+                return True
+            manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+            return False
+        wheel = manifest.get("wheel")
+        # an image compiled otherwise (or not at all, by an older version) is built anew too
+        if (
+            not isinstance(wheel, dict)
+            or wheel.get("sha256") != self._wheel_identity(wheel).get("sha256")
+            or manifest.get("compile") != self._compile_spec()
+        ):
+            LOGGER.debug(
+                "image %s was built from another %s or compiled otherwise, rebuild it",
+                self._image_folder,
+                self._wheel.name,
+            )
+            return False
+        # environments importing from a linked image compile the levels it lacks into it, those do not damage it
+        if {k: manifest.get(k) for k in ("files", "pyc")} != _count_files(
+            self._image_folder, self._compile_with.optimize
+        ):
+            LOGGER.warning("image %s is damaged, rebuild it", self._image_folder)
+            return False
+        _VERIFIED[self._image_folder] = stat.st_ino, stat.st_mtime_ns
+        return True
+
+    def _wheel_identity(self, known: dict[str, Any] | None = None) -> dict[str, Any]:
+        # hashing the wheel is the expensive part, so reuse the hash recorded for the same size and modification time
+        stat = self._wheel.stat()
+        identity: dict[str, Any] = {"name": self._wheel.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if known is not None and all(known.get(k) == v for k, v in identity.items()) and "sha256" in known:
+            identity["sha256"] = known["sha256"]
+        else:
+            identity["sha256"] = hashlib.sha256(self._wheel.read_bytes()).hexdigest()
+        return identity
+
+
+def _compile_in_process(creator: Creator, folder: Path, dest: Path | None, spec: CompileSpec) -> list[str]:
+    """:returns: the lines reporting the files that failed to compile"""
+    # use the system interpreter, as the image is built while the virtual environment is still being created
+    exe = creator.interpreter.system_executable or creator.exe
+    cmd = [str(exe), "-m", "compileall", "-q", "-j", str(spec.workers), "--invalidation-mode", spec.invalidation_mode]
+    cmd.extend(chain.from_iterable(("-o", str(level)) for level in spec.optimize))
+    if dest is not None:
+        cmd.extend(("-d", str(dest)))
+    cmd.append(str(folder))
+    process = Popen(cmd, stdout=PIPE, stderr=PIPE, encoding="utf-8")
+    out, err = process.communicate()
+    if not process.returncode:
+        return []
+    return [line for line in (out + err).splitlines() if line.strip()] or [f"{exe} exited with {process.returncode}"]
+
+
+def _extract_wheel(wheel: Path, folder: Path) -> tuple[Path, int]:
+    """Extract the wheel into the folder, refusing entries that would land outside of it.
+
+    :returns: the folder the wheel got extracted into (on Windows a short path if needed to fit the path length limit),
+        and the length of the longest entry name within
+
+    """
+    with zipfile.ZipFile(str(wheel)) as zip_ref:
+        longest = max(len(i) for i in zip_ref.namelist())
+        folder = _short_path(folder, longest)
+        _safe_extract_zip(zip_ref, folder)
+    return folder, longest
+
+
+def _short_path(folder: Path, longest: int) -> Path:
+    if os.name == "nt" and len(str(folder)) + longest > 260:  # ruff:ignore[magic-value-comparison]
+        # https://docs.microsoft.com/en-us/windows/win32/fileio/maximum-file-path-limitation
+        folder.mkdir(parents=True, exist_ok=True)  # to get a short path must exist
+
+        from virtualenv.util.path import get_short_path_name  # ruff:ignore[import-outside-top-level]
+
+        return Path(get_short_path_name(str(folder)))
+    return folder
+
+
+def _content_longest(folder: Path) -> int | None:
+    """:returns: the length of the longest entry name in the extracted wheel content, ``None`` if not complete"""
+    try:
+        manifest = json.loads((folder / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+        return None
+    if {k: manifest.get(k) for k in ("files", "pyc")} != _count_files(folder):
+        return None
+    return manifest.get("longest")
+
+
+def _count_files(folder: Path, optimize: tuple[int, ...] | None = None) -> dict[str, int]:
+    """:param optimize: count only the bytecode of these optimization levels, all of it if not set"""
+    files = pyc = 0
+    for _, _, names in os.walk(folder):
+        kept = [i for i in names if optimize is None or not i.endswith(".pyc") or _optimization_level(i) in optimize]
+        files += len(kept)
+        pyc += sum(1 for name in kept if name.endswith(".pyc"))
+    return {"files": files - (folder / MANIFEST).exists(), "pyc": pyc}
+
+
+def _optimization_level(pyc: str) -> int:
+    tag = pyc[: -len(".pyc")].rsplit(".", 1)[-1]  # e.g. opt-1 of __init__.cpython-312.opt-1.pyc
+    return int(tag[len("opt-") :]) if tag.startswith("opt-") and tag[len("opt-") :].isdigit() else 0
 
 
 class ScriptMakerCustom(ScriptMaker):
@@ -238,5 +462,9 @@ class ScriptMakerCustom(ScriptMaker):
 
 
 __all__ = [
+    "DEFAULT_INVALIDATION_MODE",
+    "DEFAULT_OPTIMIZE",
+    "INVALIDATION_MODES",
+    "CompileSpec",
     "PipInstall",
 ]
@@ -0,0 +1,113 @@
+"""Compile the bytecode of the install images with one long-lived interpreter process.
+
+Starting an interpreter, and the pool of workers compiling in parallel within, costs about as much as compiling a small
+seed package; a :class:`Compiler` starts them once and then compiles every image built in the run, one after the other.
+
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from subprocess import PIPE, Popen
+from tempfile import TemporaryFile
+from threading import Lock
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+# runs within the target interpreter: reads a request per line, answers with the files that failed to compile; anything
+# printed (by the workers too) goes to standard error, so it does not mix with the answers
+_SERVE = """
+import compileall, json, os, py_compile, sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+answer = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)
+executor = ProcessPoolExecutor(int(sys.argv[1]) or None)
+for line in sys.stdin:
+    request = json.loads(line)
+    folder, dest, sources, dest_dirs = request["folder"], request["dest"], [], []
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(i for i in dirs if i != "__pycache__")
+        for name in sorted(i for i in files if i.endswith(".py")):
+            sources.append(os.path.join(root, name))
+            dest_dirs.append(None if dest is None else os.path.join(dest, os.path.relpath(root, folder)))
+    mode = py_compile.PycInvalidationMode[request["invalidation_mode"].upper().replace("-", "_")]
+    work = partial(compileall.compile_file, quiet=2, optimize=request["optimize"], invalidation_mode=mode)
+    done = executor.map(work, sources, dest_dirs, chunksize=16)
+    answer.write(json.dumps({"failed": [i for i, ok in zip(sources, done) if not ok]}) + "\\n")
+    answer.flush()
+"""
+
+
+class Compiler:
+    """A long-lived interpreter process compiling bytecode for the images, started on first use."""
+
+    def __init__(self, exe: Path, workers: int = 0) -> None:
+        self.exe = exe
+        self.workers = workers  #: the number of processes compiling in parallel, one per CPU if zero
+        self._lock = Lock()
+        self._process: Popen[str] | None = None
+        # a file rather than a pipe: warnings of the workers might fill a pipe no one reads while waiting for the answer
+        self._errors: IO[str] | None = None
+
+    def compile(self, folder: Path, dest: Path | None, optimize: tuple[int, ...], invalidation_mode: str) -> list[str]:
+        """Compile the sources within the folder, in parallel.
+
+        :param folder: the folder to compile
+        :param dest: the folder to record in the bytecode as the location of the sources, the folder itself if not set
+        :param optimize: the optimization levels to compile for
+        :param invalidation_mode: how the bytecode is checked to be up to date, see :mod:`py_compile`
+
+        :returns: the sources that failed to compile
+
+        :raises RuntimeError: if the interpreter process died
+
+        """
+        request = {"folder": str(folder), "dest": None if dest is None else str(dest)}
+        request.update(optimize=list(optimize), invalidation_mode=invalidation_mode)
+        with self._lock:
+            if self._process is None:
+                LOGGER.debug("start bytecode compiler %s", self.exe)
+                cmd = [str(self.exe), "-c", _SERVE, str(self.workers)]
+                self._errors = TemporaryFile("w+", encoding="utf-8")  # ruff:ignore[open-file-with-context-handler]
+                self._process = Popen(cmd, stdin=PIPE, stdout=PIPE, stderr=self._errors, encoding="utf-8")
+            process = self._process
+            try:
+                process.stdin.write(json.dumps(request) + "\n")  # ty: ignore[possibly-missing-attribute]
+                process.stdin.flush()  # ty: ignore[possibly-missing-attribute]
+                answer = process.stdout.readline()  # ty: ignore[possibly-missing-attribute]
+            except OSError:
+                answer = ""
+            if not answer:
+                process.communicate()
+                msg = f"bytecode compiler {self.exe} exited with {process.returncode}: {self._stop()}"
+                raise RuntimeError(msg)
+        return json.loads(answer)["failed"]
+
+    def close(self) -> None:
+        with self._lock:
+            process = self._process
+            if process is not None:
+                LOGGER.debug("stop bytecode compiler %s", self.exe)
+                process.communicate()  # the end of its input stops it
+                self._stop()
+
+    def _stop(self) -> str:
+        """:returns: what the process printed"""
+        errors, self._process, self._errors = self._errors, None, None
+        if errors is None:
+            return ""
+        with errors:
+            errors.seek(0)
+            return errors.read()
+
+
+__all__ = [
+    "Compiler",
+]
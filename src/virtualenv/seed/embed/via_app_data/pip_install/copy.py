@@ -15,23 +15,24 @@ if TYPE_CHECKING:
 class CopyPipInstall(PipInstall):
     def _sync(self, src: Path, dst: Path) -> None:
         copy(src, dst)
+        # bytecode checked against the timestamp is valid only next to sources of the same age
+        if self._compile_with.invalidation_mode == "timestamp":
+            _keep_source_times(src, dst)
 
     def _generate_new_files(self) -> set[Path]:
-        # create the pyc files
+        # create the pyc files, once per image instead of on first import within every environment
+        self._compile()
         new_files = super()._generate_new_files()
         new_files.update(self._cache_files())
         return new_files
 
     def _cache_files(self) -> Generator[Path, None, None]:
-        version = self._creator.interpreter.version_info
-        py_c_ext = f".{self._creator.interpreter.implementation.lower()}-{version.major}{version.minor}.pyc"
-        for root, dirs, files in os.walk(str(self._image_dir), topdown=True):
-            root_path = Path(root)
-            for name in files:
-                if name.endswith(".py"):
-                    yield root_path / f"{name[:-3]}{py_c_ext}"
-            for name in dirs:
-                yield root_path / name / "__pycache__"
+        for root, dirs, _ in os.walk(str(self._image_dir), topdown=True):
+            if "__pycache__" in dirs:
+                dirs.remove("__pycache__")
+                py_cache = Path(root) / "__pycache__"
+                yield py_cache
+                yield from py_cache.iterdir()
 
     def _fix_records(self, extra_record_data: set[Path]) -> None:
         extra_record_data_str = self._records_text(extra_record_data)
@@ -39,6 +40,17 @@ class CopyPipInstall(PipInstall):
             file_handler.write(extra_record_data_str.encode("utf-8"))
 
 
+def _keep_source_times(src: Path, dst: Path) -> None:
+    sources = (
+        (Path(root) / name for root, _, files in os.walk(str(src)) for name in files if name.endswith(".py"))
+        if src.is_dir()
+        else [src]
+    )
+    for source in sources:
+        stat = source.stat()
+        os.utime(dst / source.relative_to(src), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
 __all__ = [
     "CopyPipInstall",
 ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from virtualenv.util.path import hardlink
+
+from .copy import CopyPipInstall
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class HardlinkPipInstall(CopyPipInstall):
+    """Hardlink every file of the image, so the environment gets a real directory tree without copying file content.
+
+    Files fall back to a copy when the image and the environment are on different file systems.
+
+    """
+
+    def _sync(self, src: Path, dst: Path) -> None:
+        hardlink(src, dst)
+
+
+__all__ = [
+    "HardlinkPipInstall",
+]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from virtualenv.app_data.eviction import image_path_file, refer_image
+
+from .symlink import SymlinkPipInstall
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class PthPipInstall(SymlinkPipInstall):
+    """Put the read-only image itself on the path of the environment, through a path configuration file.
+
+    The environment gets a copy of the ``.dist-info`` folder (so pip sees the package as installed, and upgrades it by
+    removing the copy along with the path configuration file), the path configuration files of the package and the
+    console scripts; the rest stays in the image, so the work does not grow with the number of files of the package.
+
+    """
+
+    def install(self, version_info: tuple[int, ...]) -> None:
+        self._extracted = True
+        self._uninstall_previous_version()
+        purelib = self._creator.purelib
+        # sorts before the path configuration files of the packages, which may import from the image
+        pth = image_path_file(self._image_folder, purelib)
+        pth.write_text(f"{self._image_folder}\n", encoding="utf-8")
+        installed = [pth]
+        for entry in self._image_dir.iterdir():
+            if entry.suffix in {".dist-info", ".pth"}:
+                installed.extend(_shim(entry, purelib / entry.name))
+        for name, module in self._console_scripts.items():  # ty: ignore[unresolved-attribute]
+            installed.extend(self._create_console_entry_point(name, module, self._creator.script_dir, version_info))
+        record = purelib / self._dist_info.name / "RECORD"  # ty: ignore[unresolved-attribute]
+        lines = (f"{os.path.relpath(str(i), str(purelib))},," for i in sorted(installed, key=str))
+        record.write_text("\n".join(lines), encoding="utf-8")
+        refer_image(self._image_folder, purelib)  # the environment depends on the image from now on
+
+
+def _shim(src: Path, dst: Path) -> list[Path]:
+    """Copy the content without the permissions of the read-only image, so the environment can remove or rewrite it."""
+    if src.is_dir():
+        dst.mkdir()
+        return [path for entry in src.iterdir() for path in _shim(entry, dst / entry.name)]
+    dst.write_bytes(src.read_bytes())
+    return [dst]
+
+
+__all__ = [
+    "PthPipInstall",
+]
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import os
 from stat import S_IREAD, S_IRGRP, S_IROTH
-from subprocess import PIPE, Popen
 from typing import TYPE_CHECKING
 
-from virtualenv.util.path import safe_delete, set_tree
+from virtualenv.app_data.eviction import refer_image
+from virtualenv.util.path import copy, safe_delete, set_tree
 
 from .base import PipInstall
 
@@ -14,14 +14,20 @@ if TYPE_CHECKING:
 
 
 class SymlinkPipInstall(PipInstall):
+    def install(self, version_info: tuple[int, ...]) -> None:
+        super().install(version_info)
+        refer_image(self._image_folder, self._creator.purelib)  # the environment depends on the image from now on
+
     def _sync(self, src: Path, dst: Path) -> None:
         os.symlink(str(src), str(dst))
 
+    def _populate(self, src: Path, dst: Path) -> None:
+        copy(src, dst)  # the image gets bytecode and read-only permissions of its own, so cannot share files
+
     def _generate_new_files(self) -> set[Path]:
-        # create the pyc files, as the build image will be R/O
-        cmd = [str(self._creator.exe), "-m", "compileall", str(self._image_dir)]
-        process = Popen(cmd, stdout=PIPE, stderr=PIPE)
-        process.communicate()
+        # create the pyc files, as the build image will be R/O; the image is built in a staging directory, record the path
+        # it will be renamed to within the pyc files
+        self._compile(dest=self._image_folder)
         # the root pyc is shared, so we'll not symlink that - but still add the pyc files to the RECORD for close
         root_py_cache = self._image_dir / "__pycache__"
         new_files = set()
@@ -46,8 +52,8 @@ class SymlinkPipInstall(PipInstall):
         extra_record_data_str = self._records_text(sorted(extra_record_data, key=str))  # ty: ignore[invalid-argument-type]
         (self._dist_info / "RECORD").write_text(extra_record_data_str, encoding="utf-8")  # ty: ignore[unsupported-operator]
 
-    def build_image(self) -> None:
-        super().build_image()
+    def _build_image(self) -> None:
+        super()._build_image()
         # protect the image by making it read only
         set_tree(self._image_dir, S_IREAD | S_IRGRP | S_IROTH)
 
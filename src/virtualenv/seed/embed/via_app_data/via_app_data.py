@@ -11,16 +11,23 @@ from subprocess import CalledProcessError
 from threading import Lock, Thread
 from typing import TYPE_CHECKING
 
+from virtualenv.app_data.eviction import mark_used
 from virtualenv.info import fs_supports_symlink
 from virtualenv.seed.embed.base_embed import BaseEmbed
 from virtualenv.seed.wheels import get_wheel
+from virtualenv.util.lock import Timeout
+from virtualenv.util.timings import in_context, timed
 
+from .pip_install.base import DEFAULT_INVALIDATION_MODE, DEFAULT_OPTIMIZE, INVALIDATION_MODES, CompileSpec
+from .pip_install.compiler import Compiler
 from .pip_install.copy import CopyPipInstall
+from .pip_install.hardlink import HardlinkPipInstall
+from .pip_install.pth import PthPipInstall
 from .pip_install.symlink import SymlinkPipInstall
 
 if TYPE_CHECKING:
     from argparse import ArgumentParser
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from python_discovery import PythonInfo
 
@@ -38,71 +45,183 @@ LOGGER = logging.getLogger(__name__)
 class FromAppData(BaseEmbed):
     def __init__(self, options: VirtualEnvOptions) -> None:
         super().__init__(options)
-        self.symlinks = options.symlink_app_data
+        self.link = "symlink" if options.symlink_app_data else options.link_app_data
+        if self.link == "symlink" and not self._can_symlink(self.app_data):
+            self.link = "copy"
+        if self.link == "pth" and self.app_data.transient:  # the environment would point into a folder removed on exit
+            self.link = "copy"
+        self.compile_optimize = tuple(sorted(set(options.compile_optimize)))
+        self.compile_invalidation_mode = options.compile_invalidation_mode
+        self.compile_workers = options.compile_workers
+        self.compile_server = options.compile_server
+        self._compilers: dict[str, Compiler] = {}  # by the interpreter compiling, when compiling with a server
+        self._compilers_lock = Lock()
+        self._seed_wheels: dict[str, dict[str, Wheel]] = {}
+        self._seed_wheels_lock = Lock()
 
     @classmethod
     def add_parser_arguments(cls, parser: ArgumentParser, interpreter: PythonInfo, app_data: AppData) -> None:
         super().add_parser_arguments(parser, interpreter, app_data)
-        can_symlink = app_data.transient is False and fs_supports_symlink()
+        can_symlink = cls._can_symlink(app_data)
         sym = "" if can_symlink else "not supported - "
+        parser.add_argument(
+            "--link-app-data",
+            dest="link_app_data",
+            choices=["copy", "symlink", "hardlink", "pth"],
+            help="how to install the python packages from the app-data folder: copy the files, symlink the top level "
+            f"entries ({sym}requires seed pip>=19.3), hardlink the files (falls back to copy across file systems) or "
+            "put the image on the path with a .pth file",
+            default="copy",
+        )
         parser.add_argument(
             "--symlink-app-data",
             dest="symlink_app_data",
             action="store_true" if can_symlink else "store_false",
-            help=f"{sym} symlink the python packages from the app-data folder (requires seed pip>=19.3)",
+            help=f"{sym} same as --link-app-data symlink",
             default=False,
         )
+        parser.add_argument(
+            "--compile-optimize",
+            dest="compile_optimize",
+            metavar="level",
+            type=int,
+            nargs="+",
+            choices=[0, 1, 2],
+            help="optimization levels to precompile the bytecode of the seed packages for, once per image",
+            default=list(DEFAULT_OPTIMIZE),
+        )
+        parser.add_argument(
+            "--compile-invalidation-mode",
+            dest="compile_invalidation_mode",
+            choices=INVALIDATION_MODES,
+            help="how the interpreter checks the precompiled bytecode of the seed packages is up to date",
+            default=DEFAULT_INVALIDATION_MODE,
+        )
+        parser.add_argument(
+            "--compile-workers",
+            dest="compile_workers",
+            metavar="n",
+            type=int,
+            help="number of processes precompiling the bytecode in parallel, 0 for one per CPU",
+            default=0,
+        )
+        parser.add_argument(
+            "--compile-server",
+            dest="compile_server",
+            action="store_true",
+            help="precompile the bytecode of every image built in the run with one long-lived interpreter process, "
+            "instead of one per image",
+            default=False,
+        )
+
+    @staticmethod
+    def _can_symlink(app_data: AppData) -> bool:
+        return app_data.transient is False and fs_supports_symlink()
+
+    def prepare(self, creator: Creator) -> None:
+        # resolving the wheels and building their images only depends on the target interpreter
+        if self.enabled:
+            self._with_images(creator, lambda _name, _installer: None)
 
     def run(self, creator: Creator) -> None:
-        if not self.enabled:
-            return
-        with self._get_seed_wheels(creator) as name_to_whl:
-            pip_version = name_to_whl["pip"].version_tuple if "pip" in name_to_whl else None
-            installer_class = self.installer_class(pip_version)
-            exceptions = {}
-
-            def _install(name: str, wheel: Wheel) -> None:
-                LOGGER.debug("install %s from wheel %s via %s", name, wheel, installer_class.__name__)
-                try:
-                    key = Path(installer_class.__name__) / wheel.path.stem
-                    wheel_img = self.app_data.wheel_image(creator.interpreter.version_release_str, key)
-                    installer = installer_class(wheel.path, creator, wheel_img)
-                    _build_wheel_image(self.app_data.lock / wheel_img.parent, wheel_img.name, installer)
-                    installer.install(creator.interpreter.version_info)  # ty: ignore[invalid-argument-type]
-                except Exception:  # ruff:ignore[blind-except]
-                    exceptions[name] = sys.exc_info()
-
-            threads = [Thread(target=_install, args=(n, w)) for n, w in name_to_whl.items()]
-            for thread in threads:
-                thread.start()
-            for thread in threads:
-                thread.join()
-            if exceptions:
-                messages = [f"failed to build image {', '.join(exceptions.keys())} because:"]
-                for value in exceptions.values():
-                    exc_type, exc_value, exc_traceback = value
-                    messages.append("".join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
-                raise RuntimeError("\n".join(messages))
-
-    @contextmanager
-    def _get_seed_wheels(self, creator: Creator) -> Generator[dict[str, Wheel], None, None]:  # ruff:ignore[complex-structure]
+        def _install(name: str, installer: PipInstall) -> None:
+            with timed(f"install {name}"):
+                installer.install(creator.interpreter.version_info)  # ty: ignore[invalid-argument-type]
+
+        if self.enabled:
+            self._with_images(creator, _install)
+
+    def _with_images(self, creator: Creator, then: Callable[[str, PipInstall], None]) -> None:
+        name_to_whl = self._get_seed_wheels(creator)
+        pip_version = name_to_whl["pip"].version_tuple if "pip" in name_to_whl else None
+        installer_class = self.installer_class(pip_version)
+        exceptions, content = {}, self.app_data.wheel_content
+        compile_spec = CompileSpec(
+            self.compile_optimize, self.compile_invalidation_mode, self.compile_workers, self._compiler(creator)
+        )
+
+        def _image(name: str, wheel: Wheel) -> None:
+            LOGGER.debug("install %s from wheel %s via %s", name, wheel, installer_class.__name__)
+            key = Path(f"{installer_class.__name__}{self._compile_tag()}") / wheel.path.stem
+            wheel_img = self.app_data.wheel_image(creator.interpreter.version_release_str, key)
+            image_lock = self.app_data.lock / wheel_img.parent
+            try:
+                installer = installer_class(
+                    wheel.path,
+                    creator,
+                    wheel_img,
+                    self.app_data.lock / content,
+                    compile_spec,
+                )
+                with _wheel_image(image_lock, wheel_img.name, installer, f"build image {name}"):
+                    then(name, installer)
+            except Exception:  # ruff:ignore[blind-except]
+                exceptions[name] = sys.exc_info()
+
+        threads = [Thread(target=in_context(_image), args=(n, w)) for n, w in name_to_whl.items()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if exceptions:
+            messages = [f"failed to build image {', '.join(exceptions.keys())} because:"]
+            for value in exceptions.values():
+                exc_type, exc_value, exc_traceback = value
+                messages.append("".join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
+            raise RuntimeError("\n".join(messages))
+
+    def _compiler(self, creator: Creator) -> Compiler | None:
+        if not self.compile_server:
+            return None
+        # use the system interpreter, as the images are built while the virtual environment is still being created
+        exe = creator.interpreter.system_executable or creator.exe
+        with self._compilers_lock:
+            if str(exe) not in self._compilers:
+                self._compilers[str(exe)] = Compiler(Path(exe), self.compile_workers)
+            return self._compilers[str(exe)]
+
+    def close(self) -> None:
+        with self._compilers_lock:
+            compilers, self._compilers = list(self._compilers.values()), {}
+        for compiler in compilers:
+            compiler.close()
+
+    def _compile_tag(self) -> str:
+        """:returns: the suffix telling apart the images compiled otherwise than by default, so they can live side by side"""
+        if (self.compile_optimize, self.compile_invalidation_mode) == (DEFAULT_OPTIMIZE, DEFAULT_INVALIDATION_MODE):
+            return ""
+        return f"-o{''.join(str(i) for i in self.compile_optimize)}-{self.compile_invalidation_mode}"
+
+    def _get_seed_wheels(self, creator: Creator) -> dict[str, Wheel]:
+        # the wheels only depend on the target python version, so when the seeder is shared between many creations
+        # (see virtualenv.run.cli_run_many) resolve them once and hand out the same result to everyone
+        for_py_version = creator.interpreter.version_release_str
+        with self._seed_wheels_lock:
+            if for_py_version not in self._seed_wheels:
+                self._seed_wheels[for_py_version] = self._resolve_seed_wheels(for_py_version)
+            return self._seed_wheels[for_py_version]
+
+    def _resolve_seed_wheels(self, for_py_version: str) -> dict[str, Wheel]:  # ruff:ignore[complex-structure]
         name_to_whl, lock, fail = {}, Lock(), {}
 
         def _get(distribution: str, version: str | None) -> None:
-            for_py_version = creator.interpreter.version_release_str
             failure, result = None, None
-            # fallback to download in case the exact version is not available
-            for download in [True] if self.download else [False, True]:
+            search_dirs, do_periodic_update = self.wheel_search(distribution)
+            if distribution in self.seed_packages:  # never look up an extra package on an index unless asked to
+                downloads = [self.download]
+            else:  # fallback to download in case the exact version is not available
+                downloads = [True] if self.download else [False, True]
+            for download in downloads:
                 failure = None
                 try:
                     result = get_wheel(
                         distribution=distribution,
                         version=version,
                         for_py_version=for_py_version,
-                        search_dirs=self.extra_search_dir,
+                        search_dirs=search_dirs,
                         download=download,
                         app_data=self.app_data,
-                        do_periodic_update=self.periodic_update,
+                        do_periodic_update=do_periodic_update,
                         env=self.env,
                     )
                     if result is not None:
@@ -110,6 +229,8 @@ class FromAppData(BaseEmbed):
                 except Exception as exception:
                     LOGGER.exception("fail")
                     failure = exception
+            if failure is None and distribution in self.seed_packages:
+                failure = _check_seed_wheel(distribution, result, search_dirs)
             if failure:
                 if isinstance(failure, CalledProcessError):
                     msg = f"failed to download {distribution}"
@@ -130,7 +251,7 @@ class FromAppData(BaseEmbed):
                     name_to_whl[distribution] = result
 
         threads = [
-            Thread(target=_get, args=(distribution, version))
+            Thread(target=in_context(_get), args=(distribution, version))
             for distribution, version in self.distribution_to_versions().items()
         ]
         for thread in threads:
@@ -140,23 +261,60 @@ class FromAppData(BaseEmbed):
         if fail:
             msg = f"seed failed due to failing to download wheels {', '.join(fail.keys())}"
             raise RuntimeError(msg)
-        yield name_to_whl
+        return name_to_whl
 
     def installer_class(self, pip_version_tuple: tuple[int, ...] | None) -> type[PipInstall]:
-        if self.symlinks and pip_version_tuple and pip_version_tuple >= (19, 3):  # symlink support requires pip 19.3+
+        if self.link == "hardlink":
+            return HardlinkPipInstall
+        if self.link == "pth":
+            return PthPipInstall
+        if self.link == "symlink" and pip_version_tuple and pip_version_tuple >= (19, 3):  # symlink requires pip 19.3+
             return SymlinkPipInstall
         return CopyPipInstall
 
     def __repr__(self) -> str:
-        msg = f", via={'symlink' if self.symlinks else 'copy'}, app_data_dir={self.app_data}"
+        msg = f", via={self.link}, app_data_dir={self.app_data}"
         base = super().__repr__()
         return f"{base[:-1]}{msg}{base[-1]}"
 
 
+@contextmanager
+def _wheel_image(parent: PathLockBase, name: str, installer: PipInstall, label: str) -> Generator[None]:
+    """Build the image unless complete, then keep it in place (no eviction) while in use."""
+    while True:
+        with timed(label):
+            _build_wheel_image(parent, name, installer)
+        with parent.shared_lock_for_key(name):
+            if installer.has_image():  # not evicted since
+                mark_used(parent.path / name)
+                yield
+                return
+
+
 def _build_wheel_image(parent: PathLockBase, name: str, installer: PipInstall) -> None:
-    with parent.non_reentrant_lock_for_key(name):
-        if not installer.has_image():
-            installer.build_image()
+    # images are renamed into place once complete, so finding one needs no lock
+    while not installer.has_image() and not _build_first(parent, name, installer):
+        with parent.shared_lock_for_key(name):  # someone else builds it, wait for them along with the others
+            pass
+
+
+def _build_first(parent: PathLockBase, name: str, installer: PipInstall) -> bool:
+    """:returns: ``False`` if someone else builds the image"""
+    try:
+        with parent.exclusive_lock_for_key(name, no_block=True):
+            if not installer.has_image():
+                installer.build_image()
+    except Timeout:
+        return False
+    return True
+
+
+def _check_seed_wheel(distribution: str, wheel: Wheel | None, search_dirs: list[Path]) -> RuntimeError | None:
+    if wheel is None:
+        return RuntimeError(f"{distribution} wheel not found in {', '.join(str(i) for i in search_dirs)}")
+    if not wheel.purelib_only():  # the images are unpacked as is into purelib
+        return RuntimeError(f"{wheel.path} has content outside of purelib (platlib, scripts, headers or data)")
+    return None
 
 
 __all__ = [
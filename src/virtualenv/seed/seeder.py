@@ -49,6 +49,16 @@ class Seeder(ABC):
         """
         raise NotImplementedError
 
+    def prepare(self, creator: Creator) -> None:  # ruff:ignore[empty-method-without-abstract-decorator]
+        """Do the work of the seed operation that does not need the virtual environment to exist yet.
+
+        Called concurrently with the creation of the virtual environment, before :meth:`run`; by default does nothing.
+
+        :param creator: the creator (based of :class:`virtualenv.create.creator.Creator`) that creates this virtual
+            environment
+
+        """
+
     @abstractmethod
     def run(self, creator: Creator) -> None:
         """Perform the seed operation.
@@ -59,6 +69,9 @@ class Seeder(ABC):
         """
         raise NotImplementedError
 
+    def close(self) -> None:  # ruff:ignore[empty-method-without-abstract-decorator]
+        """Release what the seeder holds on to between seed operations (such as helper processes); by default nothing."""
+
 
 __all__ = [
     "Seeder",
@@ -10,6 +10,8 @@ from pathlib import Path
 from subprocess import PIPE, CalledProcessError, Popen
 from typing import TYPE_CHECKING
 
+from virtualenv.util.timings import timed
+
 from .bundle import from_bundle
 from .periodic_update import add_wheel_to_update_log
 from .util import Version, Wheel, discover_wheels
@@ -59,28 +61,29 @@ def get_wheel(  # ruff:ignore[too-many-arguments]
     env: dict[str, str],
 ) -> Wheel | None:
     """Get a wheel with the given distribution-version-for_py_version trio, by using the extra search dir + download."""
-    # not all wheels are compatible with all python versions, so we need to py version qualify it
-    wheel = None
-
-    if not download or version != Version.bundle:
-        # 1. acquire from bundle
-        wheel = from_bundle(distribution, version, for_py_version, search_dirs, app_data, do_periodic_update, env)
-
-    if download and wheel is None and version != Version.embed:
-        # 2. download from the internet
-        wheel = download_wheel(
-            distribution=distribution,
-            version_spec=Version.as_version_spec(version),
-            for_py_version=for_py_version,
-            search_dirs=search_dirs,
-            app_data=app_data,
-            to_folder=app_data.house,
-            env=env,
-        )
-        if wheel is not None and app_data.can_update:
-            add_wheel_to_update_log(wheel, for_py_version, app_data)
-
-    return wheel
+    with timed(f"get wheel {distribution}"):
+        # not all wheels are compatible with all python versions, so we need to py version qualify it
+        wheel = None
+
+        if not download or version != Version.bundle:
+            # 1. acquire from bundle
+            wheel = from_bundle(distribution, version, for_py_version, search_dirs, app_data, do_periodic_update, env)
+
+        if download and wheel is None and version != Version.embed:
+            # 2. download from the internet
+            wheel = download_wheel(
+                distribution=distribution,
+                version_spec=Version.as_version_spec(version),
+                for_py_version=for_py_version,
+                search_dirs=search_dirs,
+                app_data=app_data,
+                to_folder=app_data.house,
+                env=env,
+            )
+            if wheel is not None and app_data.can_update:
+                add_wheel_to_update_log(wheel, for_py_version, app_data)
+
+        return wheel
 
 
 def download_wheel(  # ruff:ignore[too-many-arguments]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from operator import attrgetter
 from typing import TYPE_CHECKING
 from zipfile import ZipFile
@@ -76,6 +77,15 @@ class Wheel:
                     break
         return True
 
+    def purelib_only(self) -> bool:
+        """Whether all the content goes to purelib: no ``.data`` folder and ``Root-Is-Purelib: true``."""
+        prefix = "-".join(self.path.stem.split("-")[0:2])
+        with ZipFile(str(self.path), "r") as zip_file:
+            if any(i.startswith(f"{prefix}.data/") for i in zip_file.namelist()):
+                return False
+            wheel = zip_file.read(f"{prefix}.dist-info/WHEEL").decode("utf-8")
+        return any(i.replace(" ", "").lower() == "root-is-purelib:true" for i in wheel.splitlines())
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path})"
 
@@ -89,7 +99,7 @@ def discover_wheels(from_folder: Path, distribution: str, version: str | None, f
         wheel = Wheel.from_path(filename)
         if (
             wheel
-            and wheel.distribution == distribution
+            and _canonical(wheel.distribution) == _canonical(distribution)
             and (version is None or wheel.version == version)
             and wheel.support_py(for_py_version)
         ):
@@ -97,6 +107,11 @@ def discover_wheels(from_folder: Path, distribution: str, version: str | None, f
     return sorted(wheels, key=attrgetter("version_tuple", "distribution"), reverse=True)
 
 
+def _canonical(name: str) -> str:
+    # wheel file names escape the distribution name differently across build tools, compare the PEP 503 normalized form
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
 class Version:
     #: the version bundled with virtualenv
     bundle = "bundle"
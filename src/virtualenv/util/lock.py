@@ -4,19 +4,140 @@ from __future__ import annotations
 
 import logging
 import os
+import socket
+import sys
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager, suppress
 from pathlib import Path
-from threading import Lock, RLock
-from typing import TYPE_CHECKING
+from threading import Lock, RLock, Thread, get_ident
+from timeit import default_timer
+from typing import TYPE_CHECKING, NamedTuple
 
-from filelock import FileLock, Timeout
+from filelock import BaseFileLock, FileLock, Timeout
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from types import TracebackType
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover # Windows
+    fcntl = None  # ty: ignore[invalid-assignment]
+
 LOGGER = logging.getLogger(__name__)
+_REPORT_AFTER = 10.0  #: seconds of waiting for a lock after which the holder gets reported, and then again
+_POLL = 0.05
+_LEASE_POLL = 0.1  #: leases are polled for, every poll is a round trip to the file server
+LEASE_STALE = 30.0  #: seconds a lease may go unrenewed before waiters take it over
+
+
+class LockWait(NamedTuple):
+    """How often a lock file was acquired, and how long it was waited for."""
+
+    acquired: int = 0
+    contended: int = 0  #: times someone else held it, so it had to be waited for
+    waited: float = 0.0  #: wall clock seconds spent waiting for it
+
+    def __sub__(self, other: LockWait) -> LockWait:
+        return LockWait(*(a - b for a, b in zip(self, other)))
+
+
+class LockTimeoutError(RuntimeError):
+    """A lock was not acquired within the lock timeout."""
+
+    def __init__(self, lock_file: str, waited: float) -> None:
+        super().__init__(f"could not acquire lock {lock_file} within {waited:.1f}s {_holder(lock_file)}")
+        self.lock_file = lock_file
+
+
+class _Waits:
+    def __init__(self) -> None:
+        self.timeout: float | None = None
+        self.by_file: dict[str, LockWait] = {}
+        self._lock = Lock()
+
+    def count(self, lock_file: str, waited: float | None, acquired: bool = True) -> None:  # ruff:ignore[boolean-default-value-positional-argument]
+        with self._lock:
+            at = self.by_file.get(lock_file, LockWait())
+            contended = waited is not None
+            self.by_file[lock_file] = LockWait(
+                at.acquired + acquired, at.contended + contended, at.waited + (waited or 0)
+            )
+
+
+_WAITS = _Waits()
+
+
+def set_lock_timeout(timeout: float | None) -> None:
+    """Fail with :class:`LockTimeoutError` instead of waiting longer than this many seconds for a lock held elsewhere."""
+    _WAITS.timeout = timeout
+
+
+def lock_waits() -> dict[str, LockWait]:
+    """:returns: for every lock file acquired so far in this process, how often and how long it was waited for"""
+    with _WAITS._lock:  # ruff:ignore[private-member-access]
+        return dict(_WAITS.by_file)
+
+
+def _wait(lock_file: str, acquire: Callable[[float], bool]) -> None:
+    """Wait for a lock held by someone else, reporting the holder while it keeps it, up to the lock timeout."""
+    timeout, start = _WAITS.timeout, default_timer()
+    while not acquire(
+        _REPORT_AFTER if timeout is None else max(0.0, min(_REPORT_AFTER, start + timeout - default_timer()))
+    ):
+        waited = default_timer() - start
+        if timeout is not None and waited >= timeout:
+            _WAITS.count(lock_file, waited, acquired=False)
+            raise LockTimeoutError(lock_file, waited)
+        LOGGER.warning("waiting for lock %s since %.0fs %s", lock_file, waited, _holder(lock_file))
+    _WAITS.count(lock_file, default_timer() - start)
+
+
+def _acquired(lock: BaseFileLock, timeout: float) -> bool:
+    try:
+        lock.acquire(timeout)
+    except Timeout:
+        return False
+    return True
+
+
+def _record_holder(fd: int) -> None:
+    with suppress(OSError):  # only a diagnostic, e.g. Windows does not allow writing a file locked via another handle
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+
+
+def _record_holder_in(lock_file: str) -> None:
+    with suppress(OSError):
+        fd = os.open(lock_file, os.O_WRONLY)
+        try:
+            _record_holder(fd)
+        finally:
+            os.close(fd)
+
+
+def _holder(lock_file: str) -> str:
+    try:
+        pid, *host = Path(lock_file).read_text(encoding="utf-8").split()[:2]  # leases hold the host too
+        pid = int(pid)
+    except (OSError, ValueError):
+        return "(holder unknown)"
+    if host and host[0] != socket.gethostname():
+        return f"(last locked exclusively by PID {pid} on {host[0]})"
+    return f"(last locked exclusively by PID {pid}{'' if _running(pid) else ', which is not running anymore'})"
+
+
+def _running(pid: int) -> bool:
+    if sys.platform == "win32":  # pragma: no cover # signal 0 terminates the process there
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # exists, owned by someone else
+        return True
+    return True
 
 
 class _CountedFileLock(FileLock):
@@ -42,6 +163,7 @@ class _CountedFileLock(FileLock):
             except BaseException:
                 self.thread_safe.release()
                 raise
+            _record_holder_in(self.lock_file)
         self.count += 1
 
     def release(self, force: bool = False) -> None:  # ruff:ignore[boolean-default-value-positional-argument]
@@ -55,6 +177,73 @@ class _CountedFileLock(FileLock):
                     self.thread_safe.release()
 
 
+@contextmanager
+def _flock(lock_file: str, shared: bool, no_block: bool = False) -> Iterator[None]:  # ruff:ignore[boolean-default-value-positional-argument]
+    # every call opens the lock file anew, and locks of different open files exclude each other even within a process;
+    # the exclusive lock is the one FileLock takes on the same file, so it also excludes the key locks of other versions
+    if fcntl is None:  # pragma: no cover # msvcrt has no shared locks, so everyone locks exclusively
+        lock = FileLock(lock_file)
+        if _acquired(lock, 0):
+            _WAITS.count(lock_file, None)
+        elif no_block:
+            raise Timeout(lock_file)
+        else:
+            _wait(lock_file, lambda timeout: _acquired(lock, timeout))
+        try:
+            yield
+        finally:
+            lock.release()
+        return
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(lock_file), exist_ok=True)
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if _flocked(fd, operation, 0):
+            _WAITS.count(lock_file, None)
+        elif no_block:
+            raise Timeout(lock_file)
+        else:
+            LOGGER.debug("lock file %s present, will block until released", lock_file)
+            _wait(lock_file, lambda timeout: _flocked(fd, operation, timeout))
+        if not shared:
+            _record_holder(fd)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _flocked(fd: int, operation: int, timeout: float) -> bool:
+    deadline = default_timer() + timeout
+    while not _try_flock(fd, operation):
+        left = deadline - default_timer()
+        if left <= 0:
+            return False
+        time.sleep(min(_POLL, left))
+    return True
+
+
+def _try_flock(fd: int, operation: int) -> bool:
+    try:
+        fcntl.flock(fd, operation | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _acquire(lock: _CountedFileLock, no_block: bool = False) -> None:  # ruff:ignore[boolean-default-value-positional-argument]
+    if _acquired(lock, 0.0001):
+        _WAITS.count(lock.lock_file, None)
+        return
+    if no_block:
+        raise Timeout(lock.lock_file)
+    LOGGER.debug("lock file %s present, will block until released", lock.lock_file)
+    _wait(lock.lock_file, lambda timeout: _acquired(lock, timeout))
+
+
 _lock_store = {}
 _store_lock = Lock()
 
@@ -90,6 +279,22 @@ class PathLockBase(ABC):
     def non_reentrant_lock_for_key(self, name: str) -> Iterator[None]:
         raise NotImplementedError
 
+    @abstractmethod
+    @contextmanager
+    def shared_lock_for_key(self, name: str) -> Iterator[None]:
+        """Lock the key along with the other shared holders, while no one holds it exclusively; not reentrant."""
+        raise NotImplementedError
+
+    @abstractmethod
+    @contextmanager
+    def exclusive_lock_for_key(self, name: str, no_block: bool = False) -> Iterator[None]:  # ruff:ignore[boolean-default-value-positional-argument]
+        """Lock the key while no one else holds it, shared or exclusive; not reentrant.
+
+        :raises Timeout: with ``no_block`` if the key is already locked
+
+        """
+        raise NotImplementedError
+
 
 class ReentrantFileLock(PathLockBase):
     def __init__(self, folder: str | Path) -> None:
@@ -106,9 +311,14 @@ class ReentrantFileLock(PathLockBase):
     @staticmethod
     def _del_lock(lock: _CountedFileLock | None) -> None:
         if lock is not None:
-            with _store_lock, lock.thread_safe:
-                if lock.count == 0:
-                    _lock_store.pop(lock.lock_file, None)
+            with _store_lock:
+                if not lock.thread_safe.acquire(blocking=False):  # another thread holds it, or waits for it
+                    return
+                try:
+                    if lock.count == 0:
+                        _lock_store.pop(lock.lock_file, None)
+                finally:
+                    lock.thread_safe.release()
 
     def __del__(self) -> None:
         self._del_lock(self._lock)
@@ -130,15 +340,7 @@ class ReentrantFileLock(PathLockBase):
         # Instead here we just ignore if we fail to create the directory.
         with suppress(OSError):
             os.makedirs(str(self.path), exist_ok=True)
-
-        try:
-            lock.acquire(0.0001)
-        except Timeout:
-            if no_block:
-                raise
-            LOGGER.debug("lock file %s present, will block until released", lock.lock_file)
-            lock.release()  # release the acquire try from above
-            lock.acquire()
+        _acquire(lock, no_block)
 
     @staticmethod
     def _release(lock: _CountedFileLock) -> None:
@@ -164,8 +366,248 @@ class ReentrantFileLock(PathLockBase):
 
     @contextmanager
     def non_reentrant_lock_for_key(self, name: str) -> Iterator[None]:
-        with _CountedFileLock(str(self.path / f"{name}.lock")):
+        lock = _CountedFileLock(str(self.path / f"{name}.lock"))
+        _acquire(lock)
+        try:
+            yield
+        finally:
+            lock.release()
+
+    @contextmanager
+    def shared_lock_for_key(self, name: str) -> Iterator[None]:
+        with _flock(str(self.path / f"{name}.lock"), shared=True):
+            yield
+
+    @contextmanager
+    def exclusive_lock_for_key(self, name: str, no_block: bool = False) -> Iterator[None]:  # ruff:ignore[boolean-default-value-positional-argument]
+        with _flock(str(self.path / f"{name}.lock"), shared=False, no_block=no_block):
+            yield
+
+
+class LeaseFileLock(PathLockBase):
+    """Lock with lease files instead of ``flock``, for folders shared between hosts over a network file system.
+
+    A lease is a file created exclusively (``O_EXCL``, atomic on NFS v3 and later) holding the PID and the host of its
+    holder, along with a counter a heartbeat thread increments while the lease is held. Waiters take over a lease whose
+    content has not changed for :data:`LEASE_STALE` seconds, as its holder died (or its host went away); comparing the
+    content instead of the modification time keeps this safe from clock skew between the hosts. There are no shared
+    leases: shared locks are taken exclusively. Locks are reentrant within a thread, and exclude other threads.
+
+    """
+
+    def __init__(self, folder: str | Path) -> None:
+        super().__init__(folder)
+        self._lease: _Lease | None = None
+
+    def __enter__(self) -> None:
+        self._lease = _Lease.of(str(self.path / ".lease"))
+        _acquire_lease(self._lease)
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self._lease.release()  # ty: ignore[possibly-missing-attribute]
+        self._lease = None
+
+    @contextmanager
+    def lock_for_key(self, name: str, no_block: bool = False) -> Iterator[None]:  # ruff:ignore[boolean-default-value-positional-argument]
+        lease = _Lease.of(str(self.path / f"{name}.lease"))
+        _acquire_lease(lease, no_block)
+        try:
+            yield
+        finally:
+            lease.release()
+
+    @contextmanager
+    def non_reentrant_lock_for_key(self, name: str) -> Iterator[None]:
+        lease = _Lease(str(self.path / f"{name}.lease"))
+        _acquire_lease(lease)
+        try:
             yield
+        finally:
+            lease.release()
+
+    @contextmanager
+    def shared_lock_for_key(self, name: str) -> Iterator[None]:
+        with self.non_reentrant_lock_for_key(name):
+            yield
+
+    @contextmanager
+    def exclusive_lock_for_key(self, name: str, no_block: bool = False) -> Iterator[None]:  # ruff:ignore[boolean-default-value-positional-argument]
+        lease = _Lease(str(self.path / f"{name}.lease"))
+        _acquire_lease(lease, no_block)
+        try:
+            yield
+        finally:
+            lease.release()
+
+
+def _acquire_lease(lease: _Lease, no_block: bool = False) -> None:  # ruff:ignore[boolean-default-value-positional-argument]
+    if lease.acquire(0):
+        _WAITS.count(lease.lease_file, None)
+        return
+    if no_block:
+        raise Timeout(lease.lease_file)
+    LOGGER.debug("lease file %s present, will wait until released", lease.lease_file)
+    _wait(lease.lease_file, lease.acquire)
+
+
+class _Lease:
+    """A lease file, held while the count of its acquisitions is above zero."""
+
+    def __init__(self, lease_file: str) -> None:
+        self.lease_file = lease_file
+        self.count = 0
+        self.thread_safe = RLock()
+        self._seen: tuple[str | None, float] | None = None  #: the content of the lease of someone else, since when
+
+    @classmethod
+    def of(cls, lease_file: str) -> _Lease:
+        with _held_lock:
+            return _held.get(lease_file) or cls(lease_file)
+
+    def acquire(self, timeout: float) -> bool:
+        if not self.thread_safe.acquire(timeout=timeout):
+            return False
+        if self.count == 0 and not self._take(default_timer() + timeout):
+            self.thread_safe.release()
+            return False
+        self.count += 1
+        if self.count == 1:
+            with _held_lock:
+                _held[self.lease_file] = self
+        return True
+
+    def release(self) -> None:
+        self.count -= 1
+        if self.count == 0:
+            with _held_lock:
+                _held.pop(self.lease_file, None)
+            _HEARTBEAT.stop(self.lease_file)
+            content = _read_lease(self.lease_file)
+            if _ours(content):
+                with suppress(FileNotFoundError):  # taken over and released meanwhile
+                    os.unlink(self.lease_file)
+            elif content is not None:  # the lease of whoever took it over, theirs to remove
+                LOGGER.warning("lease %s was taken over by another process while held (%s)", self.lease_file, content)
+        self.thread_safe.release()
+
+    def _take(self, deadline: float) -> bool:
+        while not self._create():
+            content = _read_lease(self.lease_file)
+            now = default_timer()
+            if self._seen is None or self._seen[0] != content:
+                self._seen = content, now
+            elif now - self._seen[1] >= LEASE_STALE:
+                self._take_over(content)
+                continue
+            if now >= deadline:
+                return False
+            time.sleep(min(_LEASE_POLL, deadline - now))
+        self._seen = None
+        _HEARTBEAT.start(self.lease_file)
+        return True
+
+    def _create(self) -> bool:
+        try:
+            fd = os.open(self.lease_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+        except FileNotFoundError:  # the folder does not exist yet
+            os.makedirs(os.path.dirname(self.lease_file), exist_ok=True)
+            return self._create()
+        try:
+            os.write(fd, _lease_content(0))
+        finally:
+            os.close(fd)
+        return True
+
+    def _take_over(self, content: str | None) -> None:
+        # move it aside first, so of the waiters taking over at the same time only one gets to remove it
+        stale = f"{self.lease_file}.{os.getpid()}.{get_ident()}.stale"
+        try:
+            os.rename(self.lease_file, stale)
+        except FileNotFoundError:
+            return
+        try:
+            if _read_lease(stale) != content:  # renewed or taken anew since we judged it stale, give it back
+                with suppress(OSError):
+                    os.link(stale, self.lease_file)
+            else:
+                LOGGER.warning("took over lease %s, its holder stopped renewing it (%s)", self.lease_file, content)
+        finally:
+            os.unlink(stale)
+        self._seen = None
+
+
+class _Heartbeat:
+    """Renews the leases held by this process, from a daemon thread running while there are any."""
+
+    def __init__(self) -> None:
+        self._beats: dict[str, int] = {}
+        self._lock = Lock()
+        self._thread: Thread | None = None
+
+    def start(self, lease_file: str) -> None:
+        with self._lock:
+            self._beats[lease_file] = 0
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="virtualenv-lease-heartbeat", daemon=True)
+                self._thread.start()
+
+    def stop(self, lease_file: str) -> None:
+        with self._lock:
+            self._beats.pop(lease_file, None)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(LEASE_STALE / 4)
+            with self._lock:
+                if not self._beats:
+                    self._thread = None
+                    return
+                for lease_file, beat in list(self._beats.items()):
+                    self._beats[lease_file] = beat + 1
+                    if not _renew(lease_file, beat + 1):
+                        del self._beats[lease_file]
+
+
+def _renew(lease_file: str, beat: int) -> bool:
+    """:returns: ``False`` if the lease is no longer ours, it is left to whoever took it over then"""
+    content = _read_lease(lease_file)
+    if not _ours(content):
+        LOGGER.warning("lease %s was taken over by another process while held (%s)", lease_file, content)
+        return False
+    try:
+        fd = os.open(lease_file, os.O_WRONLY | os.O_TRUNC)
+    except FileNotFoundError:
+        LOGGER.warning("lease %s was taken over by another process while held", lease_file)
+        return False
+    try:
+        os.write(fd, _lease_content(beat))
+    finally:
+        os.close(fd)
+    return True
+
+
+def _lease_content(beat: int) -> bytes:
+    return f"{os.getpid()} {socket.gethostname()} {beat}\n".encode()
+
+
+def _ours(content: str | None) -> bool:
+    return content is not None and content.split()[:2] == [str(os.getpid()), socket.gethostname()]
+
+
+def _read_lease(lease_file: str) -> str | None:
+    try:  # opening the file revalidates the cached content on NFS (close-to-open consistency)
+        return Path(lease_file).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+_HEARTBEAT = _Heartbeat()
+_held: dict[str, _Lease] = {}  #: the leases held by this process, so the thread holding one can acquire it again
+_held_lock = Lock()
 
 
 class NoOpFileLock(PathLockBase):
@@ -185,9 +627,23 @@ class NoOpFileLock(PathLockBase):
     def non_reentrant_lock_for_key(self, name: str) -> Iterator[None]:  # ruff:ignore[unused-method-argument]
         yield
 
+    @contextmanager
+    def shared_lock_for_key(self, name: str) -> Iterator[None]:  # ruff:ignore[unused-method-argument]
+        yield
+
+    @contextmanager
+    def exclusive_lock_for_key(self, name: str, no_block: bool = False) -> Iterator[None]:  # ruff:ignore[unused-method-argument, boolean-default-value-positional-argument]
+        yield
+
 
 __all__ = [
+    "LEASE_STALE",
+    "LeaseFileLock",
+    "LockTimeoutError",
+    "LockWait",
     "NoOpFileLock",
     "ReentrantFileLock",
     "Timeout",
+    "lock_waits",
+    "set_lock_timeout",
 ]
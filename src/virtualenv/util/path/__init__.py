@@ -1,16 +1,36 @@
 from __future__ import annotations
 
 from ._permission import make_exe, set_tree
-from ._sync import copy, copytree, ensure_dir, safe_delete, symlink
+from ._sync import (
+    REFLINK_MODES,
+    CopyStats,
+    copy,
+    copy_file,
+    copy_stats,
+    copytree,
+    ensure_dir,
+    hardlink,
+    linktree,
+    safe_delete,
+    set_reflink_mode,
+    symlink,
+)
 from ._win import get_short_path_name
 
 __all__ = [
+    "REFLINK_MODES",
+    "CopyStats",
     "copy",
+    "copy_file",
+    "copy_stats",
     "copytree",
     "ensure_dir",
     "get_short_path_name",
+    "hardlink",
+    "linktree",
     "make_exe",
     "safe_delete",
+    "set_reflink_mode",
     "set_tree",
     "symlink",
 ]
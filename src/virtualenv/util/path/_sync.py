@@ -4,14 +4,66 @@ import logging
 import os
 import shutil
 import sys
-from stat import S_IWUSR
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_IMODE, S_IWUSR
+from threading import Lock
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover # Windows
+    fcntl = None  # ty: ignore[invalid-assignment]
+
 LOGGER = logging.getLogger(__name__)
 
+REFLINK_MODES = ("auto", "always", "never")
+_FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) + 4)  # copies mostly wait on the file system, so more than the CPUs
+_COPY_IN_LINE = 8  # trees with fewer files are copied by the calling thread, handing them over costs more than it saves
+_POOL: list[ThreadPoolExecutor] = []  # shared by the tree copies of the process, so their threads stay bounded
+_POOL_LOCK = Lock()
+
+
+class CopyStats(NamedTuple):
+    """How many files the copy layer duplicated, by the method used."""
+
+    reflink: int = 0  #: copy-on-write clones sharing the data blocks of the source
+    kernel: int = 0  #: in kernel copies via ``copy_file_range`` (some file systems share blocks here too)
+    copy: int = 0  #: regular copies, without sharing blocks (in kernel via ``sendfile`` on Linux)
+
+    def __sub__(self, other: CopyStats) -> CopyStats:
+        return CopyStats(*(a - b for a, b in zip(self, other)))
+
+
+class _Reflink:
+    def __init__(self) -> None:
+        self.mode = "auto"
+        self.stats = CopyStats()
+        self._lock = Lock()
+
+    def count(self, method: str) -> None:
+        with self._lock:
+            self.stats = self.stats._replace(**{method: getattr(self.stats, method) + 1})
+
+
+_REFLINK = _Reflink()
+
+
+def set_reflink_mode(mode: str) -> None:
+    """Set how file content is copied: ``auto`` tries a reflink first, ``always`` requires one, ``never`` skips it."""
+    if mode not in REFLINK_MODES:
+        msg = f"reflink mode must be one of {', '.join(REFLINK_MODES)}, got {mode}"
+        raise ValueError(msg)
+    _REFLINK.mode = mode
+
+
+def copy_stats() -> CopyStats:
+    """:returns: the number of files copied so far in this process, by the method used"""
+    return _REFLINK.stats
+
 
 def ensure_dir(path: Path) -> None:
     if not path.exists():
@@ -42,20 +94,152 @@ def symlink(src: Path, dest: Path) -> None:
 def copy(src: Path, dest: Path) -> None:
     ensure_safe_to_do(src, dest)
     is_dir = src.is_dir()
-    method = copytree if is_dir else shutil.copy
+    method = copytree if is_dir else copy_file
     LOGGER.debug("copy %s", _Debug(src, dest))
     method(str(src), str(dest))
 
 
-def copytree(src: str, dest: str) -> None:
-    for root, _, files in os.walk(src):
+def hardlink(src: Path, dest: Path) -> None:
+    ensure_safe_to_do(src, dest)
+    LOGGER.debug("hardlink %s", _Debug(src, dest))
+    if src.is_symlink():
+        _copy_symlink(str(src), str(dest))
+    elif src.is_dir():
+        linktree(str(src), str(dest))
+    else:
+        _link_or_copy(str(src), str(dest))
+
+
+def linktree(src: str, dest: str) -> None:
+    for root, dirs, files in os.walk(src):
         dest_dir = os.path.join(dest, os.path.relpath(root, src))
         if not os.path.isdir(dest_dir):
             os.makedirs(dest_dir)
+        for name in [i for i in dirs if os.path.islink(os.path.join(root, i))]:
+            dirs.remove(name)  # walk does not descend into symlinked folders, so recreate the link itself
+            files.append(name)
         for name in files:
             src_f = os.path.join(root, name)
             dest_f = os.path.join(dest_dir, name)
-            shutil.copy(src_f, dest_f)
+            if os.path.islink(src_f):
+                _copy_symlink(src_f, dest_f)
+            else:
+                _link_or_copy(src_f, dest_f)
+
+
+def _link_or_copy(src: str, dest: str) -> None:
+    try:
+        os.link(src, dest)
+    except OSError:  # e.g. source and destination are on different file systems
+        copy_file(src, dest)
+        shutil.copystat(src, dest)
+
+
+def _copy_symlink(src: str, dest: str) -> None:
+    os.symlink(os.readlink(src), dest, target_is_directory=os.path.isdir(src))
+
+
+def copytree(src: str, dest: str) -> None:
+    """Copy a directory tree: create its folders first, then copy the files on a pool of threads."""
+    folders, files = _scan(src, dest)
+    for folder in folders:  # parents come before their children
+        if not os.path.isdir(folder):
+            os.mkdir(folder)
+    if len(files) < _COPY_IN_LINE:
+        for src_f, dest_f in files:
+            copy_file(src_f, dest_f)
+    else:
+        for _ in _copy_pool().map(copy_file, *zip(*files)):  # raises the first failure, if any
+            pass
+
+
+def _scan(src: str, dest: str) -> tuple[list[str], list[tuple[str, str]]]:
+    """:returns: the folders to create, and the files to copy from where to where; symlinked folders are skipped"""
+    folders, files, pending = [dest], [], [(src, dest)]
+    while pending:
+        src_dir, dest_dir = pending.pop()
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dest_dir, entry.name)
+                if not entry.is_dir():
+                    files.append((entry.path, target))
+                elif not entry.is_symlink():
+                    folders.append(target)
+                    pending.append((entry.path, target))
+    return folders, files
+
+
+def _copy_pool() -> ThreadPoolExecutor:
+    with _POOL_LOCK:
+        if not _POOL:
+            _POOL.append(ThreadPoolExecutor(max_workers=_COPY_WORKERS, thread_name_prefix="virtualenv-copy"))
+        return _POOL[0]
+
+
+def copy_file(src: str, dest: str) -> None:
+    """Copy the content and permission bits of a file, preferring a copy-on-write clone of the data blocks."""
+    with open(src, "rb") as source, open(dest, "wb") as target:
+        stat = os.fstat(source.fileno())
+        method = _copy_content(source, target, stat.st_size, f"cannot reflink {src} to {dest}")
+        if hasattr(os, "fchmod"):  # on the open file, spares looking up both paths again
+            os.fchmod(target.fileno(), S_IMODE(stat.st_mode))
+    if not hasattr(os, "fchmod"):  # pragma: no cover # Windows
+        shutil.copymode(src, dest)
+    _REFLINK.count(method)
+
+
+def _copy_content(source: BinaryIO, target: BinaryIO, size: int, no_reflink: str) -> str:
+    """:returns: the method that copied the content, see :class:`CopyStats`"""
+    if _REFLINK.mode != "never":
+        if _clone(source.fileno(), target.fileno()):
+            return "reflink"
+        if _REFLINK.mode == "always":
+            msg = f"{no_reflink}, the file system does not support copy-on-write clones"
+            raise OSError(msg)
+        if _copy_range(source.fileno(), target.fileno(), size):
+            return "kernel"
+        source.seek(0)  # a kernel copy failing midway may have moved both files along
+        target.seek(0)
+        target.truncate()
+    if not _send_file(source.fileno(), target.fileno(), size):
+        target.seek(0)
+        target.truncate()
+        shutil.copyfileobj(source, target)
+    return "copy"
+
+
+def _clone(src: int, dest: int) -> bool:
+    if fcntl is None or sys.platform != "linux":
+        return False
+    try:
+        fcntl.ioctl(dest, _FICLONE, src)
+    except OSError:  # e.g. not supported by the file system, or source and destination are on different ones
+        return False
+    return True
+
+
+def _copy_range(src: int, dest: int, size: int) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        while size > 0 and (done := os.copy_file_range(src, dest, size)):
+            size -= done
+    except OSError:  # e.g. not supported by the kernel or across these file systems
+        return False
+    return size <= 0
+
+
+def _send_file(src: int, dest: int, size: int) -> bool:
+    """Copy within the kernel too, but without sharing blocks: the data does not pass through user space."""
+    if sys.platform != "linux":  # elsewhere the destination must be a socket
+        return False
+    offset = 0
+    try:
+        while offset < size and (sent := os.sendfile(dest, src, offset, size - offset)):
+            offset += sent
+    except OSError:
+        return False
+    return offset >= size
 
 
 def safe_delete(dest: Path) -> None:
@@ -82,9 +266,16 @@ class _Debug:
 
 
 __all__ = [
+    "REFLINK_MODES",
+    "CopyStats",
     "copy",
+    "copy_file",
+    "copy_stats",
     "copytree",
     "ensure_dir",
+    "hardlink",
+    "linktree",
     "safe_delete",
+    "set_reflink_mode",
     "symlink",
 ]
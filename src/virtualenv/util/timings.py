@@ -0,0 +1,88 @@
+"""Measure how long the stages of a virtual environment creation take."""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from threading import Lock
+from timeit import default_timer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+_CURRENT: ContextVar[Timing | None] = ContextVar("virtualenv_timing", default=None)
+
+
+class Timing:
+    """A named, timed stage of a run, with the timed sub-stages it contains."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.elapsed: float | None = None  #: wall clock seconds the stage took, ``None`` while it runs
+        self.children: list[Timing] = []
+        self._lock = Lock()
+
+    def add(self, timing: Timing) -> None:
+        with self._lock:  # sub-stages may run on different threads
+            self.children.append(timing)
+
+    @contextmanager
+    def activate(self) -> Generator[Timing, None, None]:
+        """Record the stages timed within this context (on this thread) as sub-stages of this stage."""
+        token = _CURRENT.set(self)
+        start = default_timer()
+        try:
+            yield self
+        finally:
+            self.elapsed = (self.elapsed or 0) + default_timer() - start
+            _CURRENT.reset(token)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "ms": None if self.elapsed is None else round(self.elapsed * 1000, 3),
+            "children": [i.to_dict() for i in self.children],
+        }
+
+    def as_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def as_text(self) -> str:
+        return "\n".join(self._lines(0))
+
+    def _lines(self, depth: int) -> Generator[str, None, None]:
+        elapsed = "?" if self.elapsed is None else f"{self.elapsed * 1000:.0f}ms"
+        yield f"{'  ' * depth}{self.name} {elapsed}"
+        for child in self.children:
+            yield from child._lines(depth + 1)  # ruff:ignore[private-member-access]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, elapsed={self.elapsed!r}, children={len(self.children)})"
+
+
+@contextmanager
+def timed(name: str) -> Generator[None, None, None]:
+    """Time the block as a sub-stage of the active stage; does nothing when no stage is active."""
+    parent = _CURRENT.get()
+    if parent is None:
+        yield
+        return
+    timing = Timing(name)
+    parent.add(timing)
+    with timing.activate():
+        yield
+
+
+def in_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Bind the callable to the active stage, so what it times on another thread lands under it; bind once per thread."""
+    context = copy_context()
+    return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+
+__all__ = [
+    "Timing",
+    "in_context",
+    "timed",
+]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median, quantiles
+from timeit import default_timer
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+#: the phases of a creation, and the stages of the --timings report (as paths) that add up to each
+PHASES: dict[str, tuple[tuple[str, ...], ...]] = {
+    "discovery": (("parse", "discovery"),),
+    "plugins": (("parse", "plugin load"),),
+    "create": (("create",),),
+    "seed": (("prepare seed",), ("seed",)),
+    "activate": (("activate",),),
+}
+NOISE_MS = 2.0  #: slowdowns below this are noise, regardless of the threshold
+
+
+class Benchmark:
+    def __init__(self, config: pytest.Config, tmp_path: Path) -> None:
+        self.rounds: int = config.getoption("--bench-rounds")
+        self.threshold: float = config.getoption("--bench-threshold")
+        baseline = config.getoption("--bench-baseline")
+        self.baseline: dict[str, Any] = json.loads(Path(baseline).read_text(encoding="utf-8")) if baseline else {}
+        self.results: dict[str, dict[str, dict[str, float]]] = {}
+        self._tmp_path = tmp_path
+
+    def run(self, case: str, args: list[str], *, warm: bool) -> dict[str, dict[str, float]]:
+        """Time the creation with the arguments, each round with fresh app data unless warm."""
+        samples: dict[str, list[float]] = {}
+        app_data = self._tmp_path / case / "app-data"
+        if warm:  # populate the app data (interpreter info, wheel images) without timing it
+            self._create(case, args, app_data)
+        for at in range(self.rounds):
+            for phase, elapsed in self._create(case, args, app_data if warm else app_data.with_name(f"cold-{at}")):
+                samples.setdefault(phase, []).append(elapsed)
+        self.results[case] = result = {phase: _stats(values) for phase, values in samples.items()}
+        return result
+
+    def _create(self, case: str, args: list[str], app_data: Path) -> list[tuple[str, float]]:
+        dest = self._tmp_path / case / "venv"
+        cmd = [sys.executable, "-m", "virtualenv", str(dest), "--clear", "--app-data", str(app_data), "-q"]
+        start = default_timer()
+        out = subprocess.check_output([*cmd, *args, "--timings=json"], text=True, encoding="utf-8")
+        total = (default_timer() - start) * 1000
+        timings = json.loads(out)
+        return [("total", total)] + [(phase, _phase_ms(timings, paths)) for phase, paths in PHASES.items()]
+
+    def regressions(self, case: str) -> list[str]:
+        """:returns: the phases of the case whose median slowed down past the threshold compared to the baseline"""
+        baseline = self.baseline.get("cases", {}).get(case, {})
+        regressed = []
+        for phase, stats in self.results[case].items():
+            if phase not in baseline:
+                continue
+            before, now = baseline[phase]["median"], stats["median"]
+            if now - before > max(before * self.threshold, NOISE_MS):
+                regressed.append(f"{phase} {before:.1f}ms -> {now:.1f}ms")
+        return regressed
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": sys.platform,
+            "rounds": self.rounds,
+            "cases": self.results,
+        }
+
+
+def _phase_ms(timings: dict[str, Any], paths: tuple[tuple[str, ...], ...]) -> float:
+    total = 0.0
+    for path in paths:
+        node: dict[str, Any] | None = timings
+        for name in path:
+            node = next((i for i in node["children"] if i["name"] == name), None) if node else None
+        total += (node["ms"] or 0) if node else 0
+    return total
+
+
+def _stats(values: list[float]) -> dict[str, float]:
+    p10, *_, p90 = quantiles(values, n=10, method="inclusive") if len(values) > 1 else values * 2
+    return {
+        "median": round(median(values), 3),
+        "p10": round(p10, 3),
+        "p90": round(p90, 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+@pytest.fixture(scope="session")
+def bench(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Generator[Benchmark, None, None]:
+    benchmark = Benchmark(request.config, tmp_path_factory.mktemp("bench"))
+    yield benchmark
+    save = request.config.getoption("--bench-save")
+    if save and benchmark.results:
+        Path(save).write_text(json.dumps(benchmark.as_dict(), indent=2, sort_keys=True), encoding="utf-8")
@@ -0,0 +1,38 @@
+"""Time virtual environment creations phase by phase; run with ``--bench -n 0``, see ``tests/conftest.py`` for options."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from virtualenv.info import IS_CPYTHON, IS_WIN
+
+NO_ACTIVATORS = ["--activators", ""]
+
+CASES = {
+    "creator-venv": (["--creator", "venv", "--no-seed", *NO_ACTIVATORS], True),
+    "creator-cpython3-posix": (["--creator", "cpython3-posix", "--no-seed", *NO_ACTIVATORS], True),
+    "no-seed-activators-all": (["--no-seed"], True),
+    "no-seed-activators-none": (["--no-seed", *NO_ACTIVATORS], True),
+    "app-data-copy-cold": (["--seeder", "app-data", "--link-app-data", "copy", *NO_ACTIVATORS], False),
+    "app-data-copy-warm": (["--seeder", "app-data", "--link-app-data", "copy", *NO_ACTIVATORS], True),
+    "app-data-symlink-cold": (["--seeder", "app-data", "--link-app-data", "symlink", *NO_ACTIVATORS], False),
+    "app-data-symlink-warm": (["--seeder", "app-data", "--link-app-data", "symlink", *NO_ACTIVATORS], True),
+    "pip": (["--seeder", "pip", *NO_ACTIVATORS], True),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_creation(bench, case: str) -> None:
+    if case == "creator-cpython3-posix" and (IS_WIN or not IS_CPYTHON):
+        pytest.skip("the builtin posix creator needs CPython on a posix platform")
+    if "symlink" in case and IS_WIN:
+        pytest.skip("symlinks need privileges on Windows")
+    args, warm = CASES[case]
+
+    result = bench.run(case, args, warm=warm)
+
+    sys.stdout.write(f"\n{case}: " + ", ".join(f"{k} {v['median']:.1f}ms" for k, v in result.items()))
+    regressed = bench.regressions(case)
+    assert not regressed, f"{case} regressed: {'; '.join(regressed)}"
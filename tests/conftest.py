@@ -20,6 +20,12 @@ from virtualenv.report import LOGGER
 def pytest_addoption(parser) -> None:
     parser.addoption("--int", action="store_true", default=False, help="run integration tests")
     parser.addoption("--skip-slow", action="store_true", default=False, help="skip slow tests")
+    group = parser.getgroup("virtualenv benchmarks")
+    group.addoption("--bench", action="store_true", default=False, help="run the benchmarks (serially, with -n 0)")
+    group.addoption("--bench-rounds", type=int, default=5, help="creations to time per benchmark")
+    group.addoption("--bench-baseline", default=None, help="fail the benchmarks that regressed compared to this file")
+    group.addoption("--bench-threshold", type=float, default=0.25, help="the slowdown of a median allowed, as a ratio")
+    group.addoption("--bench-save", default=None, help="write the results to this file (to use as a baseline)")
 
 
 def pytest_configure(config) -> None:
@@ -37,6 +43,7 @@ def pytest_configure(config) -> None:
 
 def pytest_collection_modifyitems(config, items) -> None:
     int_location = os.path.join("tests", "integration", "").rstrip()
+    _skip_benchmarks(config, items)
     if len(items) == 1:
         return
 
@@ -53,6 +60,14 @@ def pytest_collection_modifyitems(config, items) -> None:
                 item.add_marker(pytest.mark.skip(reason="skipped because --skip-slow was passed"))
 
 
+def _skip_benchmarks(config, items) -> None:
+    bench_location = os.path.join("tests", "benchmark", "").rstrip()
+    if not config.getoption("--bench"):
+        for item in items:
+            if item.location[0].startswith(bench_location):
+                item.add_marker(pytest.mark.skip(reason="need --bench option to run"))
+
+
 @pytest.fixture(scope="session")
 def has_symlink_support():
     return fs_supports_symlink()
@@ -57,3 +57,25 @@ def test_builtin_discovery_class_preferred(mocker) -> None:
     options = VirtualEnvOptions()
     session_via_cli(["venv"], options=options)
     assert options.discovery == "builtin"
+
+
+def test_added_options_take_defaults_without_reparse(gen_parser_no_conf_env, mocker) -> None:
+    with gen_parser_no_conf_env() as (parser, _):
+        parser.add_argument("dest")
+        parser.parse_known_args(["venv"])
+        parse = mocker.spy(VirtualEnvConfigParser.__mro__[1], "parse_known_args")
+        parser.add_argument("--level", type=int, default="3")
+        options, unknown = parser.parse_known_args(["venv"])
+    assert parse.call_count == 0
+    assert (options.dest, options.level, unknown) == ("venv", 3, [])
+
+
+def test_added_options_reparse_unknown_option(gen_parser_no_conf_env) -> None:
+    with gen_parser_no_conf_env() as (parser, _):
+        parser.add_argument("dest")
+        _, unknown = parser.parse_known_args(["venv", "--level", "4"])
+        assert unknown == ["--level", "4"]
+        parser.add_argument("--level", type=int, default=3)
+        options, unknown = parser.parse_known_args(["venv", "--level", "4"])
+    assert (options.level, unknown) == (4, [])
+    assert options.get_source("level") == "cli"
@@ -6,6 +6,7 @@ import gc
 import json
 import logging
 import os
+import re
 import shutil
 import site
 import stat
@@ -845,3 +846,60 @@ def test_pyenv_cfg_preserves_symlinks(tmp_path) -> None:
 
     assert f"test_path = {expected_abspath}" in written_content
     assert expected_abspath != expected_realpath, "Test setup error: paths should differ for symlinks"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("creator", CURRENT_CREATORS)
+def test_create_from_template(tmp_path: Path, creator: str) -> None:
+    template = tmp_path / "template"
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--creator", creator, "--activators", "bash,python"]
+    cli_run([str(template), *cmd])
+    template_cfg = (template / "pyvenv.cfg").read_text(encoding="utf-8")
+
+    dest = tmp_path / "clone"
+    result = cli_run([str(dest), *cmd, "--from-template", str(template)])
+
+    assert result.creator.from_template == template
+    assert (template / "pyvenv.cfg").read_text(encoding="utf-8") == template_cfg
+    assert str(template) not in (dest / "pyvenv.cfg").read_text(encoding="utf-8")
+    pip = result.creator.script("pip")
+    assert str(dest) in pip.read_text(encoding="utf-8").splitlines()[0]
+    assert str(template) in (template / pip.relative_to(dest)).read_text(encoding="utf-8").splitlines()[0]
+    assert str(dest) in (result.creator.bin_dir / "activate").read_text(encoding="utf-8")
+    out = subprocess.check_output([str(pip), "--version", "--disable-pip-version-check"], text=True, encoding="utf-8")
+    assert str(dest) in out
+    prefix = subprocess.check_output([str(result.creator.exe), "-c", "import sys; print(sys.prefix)"], text=True)
+    assert os.path.realpath(prefix.strip()) == os.path.realpath(str(dest))
+    for path in result.creator.bin_dir.iterdir():  # the activators write these in place, must not change the template
+        if path.is_file() and not path.is_symlink():
+            assert not path.samefile(template / path.relative_to(dest))
+
+
+def test_create_from_template_not_a_venv(tmp_path: Path) -> None:
+    template = tmp_path / "template"
+    template.mkdir()
+    with pytest.raises(RuntimeError, match="is not a virtual environment"):
+        cli_run([str(tmp_path / "dest"), "--without-pip", "--from-template", str(template)])
+
+
+def test_create_from_template_other_interpreter(tmp_path: Path) -> None:
+    template = tmp_path / "template"
+    template.mkdir()
+    home = os.path.dirname(os.path.abspath(CURRENT.system_executable or CURRENT.executable))
+    (template / "pyvenv.cfg").write_text(
+        f"home = {home}\nimplementation = {CURRENT.implementation}\nversion_info = 2.7.18.final.0\n", encoding="utf-8"
+    )
+    with pytest.raises(RuntimeError, match=r"was not created for .* \(version_info=2\.7\.18\.final\.0\)"):
+        cli_run([str(tmp_path / "dest"), "--without-pip", "--from-template", str(template)])
+
+
+def test_create_from_template_other_home(tmp_path: Path) -> None:
+    template = tmp_path / "template"
+    cli_run([str(template), "--without-pip", "--activators", ""])
+    cfg = template / "pyvenv.cfg"
+    cfg.write_text(
+        re.sub(r"(?m)^home = .*$", "home = /other/python/bin", cfg.read_text(encoding="utf-8")), encoding="utf-8"
+    )
+
+    with pytest.raises(RuntimeError, match=r"was not created for .* \(home=/other/python/bin\)"):
+        cli_run([str(tmp_path / "dest"), "--without-pip", "--from-template", str(template)])
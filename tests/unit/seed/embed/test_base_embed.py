@@ -53,6 +53,24 @@ def test_unused_wheel_cli_flags_dont_warn(tmp_path, capsys) -> None:
     assert "the --wheel and --no-wheel options do nothing" not in out + err
 
 
+def test_seed_package_cli_flags(tmp_path: Path) -> None:
+    requirements = tmp_path / "seed.txt"
+    requirements.write_text("# our tooling\ntool-b == 2.0  # pinned\n\ntool_c\n", encoding="utf-8")
+    args = ["--seed-package", "tool-a", "--seed-package", "tool-b==1.0", "--seed-requirements", str(requirements)]
+
+    session = session_via_cli([*args, "--no-pip", "--no-setuptools", str(tmp_path / "venv")])
+
+    assert session.seeder.distribution_to_versions() == {"tool-a": None, "tool-b": "1.0", "tool_c": None}
+    assert session.seeder.wheel_search("tool-a") == ([session.seeder.app_data.house], False)
+
+
+@pytest.mark.parametrize("value", ["tool>=1.0", "-r other.txt", "pip"])
+def test_seed_package_invalid(tmp_path: Path, value: str, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        session_via_cli(["--seed-package", value, str(tmp_path)])
+    assert "--seed-package" in capsys.readouterr().err
+
+
 def test_embed_wheel_versions(tmp_path: Path) -> None:
     session = session_via_cli([str(tmp_path)])
     if sys.version_info[:2] >= (3, 12):
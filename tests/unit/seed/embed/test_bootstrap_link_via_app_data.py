@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import contextlib
 import os
+import subprocess
 import sys
 import zipfile
+from pathlib import Path
 from stat import S_IWGRP, S_IWOTH, S_IWUSR
 from subprocess import Popen, check_call
 from threading import Thread
@@ -14,20 +16,19 @@ from python_discovery import PythonInfo
 from python_discovery import _cached_py_info as cached_py_info
 
 from virtualenv.info import fs_supports_symlink
-from virtualenv.run import cli_run
+from virtualenv.run import cli_run, cli_run_many
 from virtualenv.seed.embed.via_app_data.pip_install.base import _safe_extract_zip
-from virtualenv.seed.wheels.embed import BUNDLE_FOLDER, BUNDLE_SUPPORT
+from virtualenv.seed.embed.via_app_data.pip_install.compiler import Compiler
+from virtualenv.seed.wheels.embed import BUNDLE_FOLDER, BUNDLE_SUPPORT, get_embed_wheel
 from virtualenv.util.path import safe_delete
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from pytest_mock import MockerFixture
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("copies", [False, True] if fs_supports_symlink() else [True])
-def test_seed_link_via_app_data(tmp_path, coverage_env, current_fastest, copies) -> None:
+@pytest.mark.parametrize("link", ["copy", "hardlink", "symlink"] if fs_supports_symlink() else ["copy", "hardlink"])
+def test_seed_link_via_app_data(tmp_path, coverage_env, current_fastest, link) -> None:
     current = PythonInfo.current_system()
     bundle_ver = BUNDLE_SUPPORT[current.version_release_str]
     create_cmd = [
@@ -45,10 +46,10 @@ def test_seed_link_via_app_data(tmp_path, coverage_env, current_fastest, copies)
         "--reset-app-data",
         "--creator",
         current_fastest,
+        "--link-app-data",
+        link,
         "-vv",
     ]
-    if not copies:
-        create_cmd.append("--symlink-app-data")
     result = cli_run(create_cmd)
     coverage_env()
     assert result
@@ -61,6 +62,9 @@ def test_seed_link_via_app_data(tmp_path, coverage_env, current_fastest, copies)
     files_post_first_create = set(site_package.iterdir())
     assert pip in files_post_first_create
     assert setuptools in files_post_first_create
+    if link == "hardlink":
+        assert not pip.is_symlink()
+        assert (pip / "__init__.py").stat().st_nlink > 1
     for pip_exe in [
         result.creator.script_dir / f"pip{suffix}{result.creator.exe.suffix}"
         for suffix in (
@@ -302,3 +306,279 @@ def test_safe_extract_zip_rejects_absolute_windows_entry(tmp_path: Path) -> None
 
     with zipfile.ZipFile(str(archive)) as zip_ref, pytest.raises(RuntimeError, match="absolute path"):
         _safe_extract_zip(zip_ref, target)
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_batch_shares_seed_wheels(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.seed.embed.via_app_data import via_app_data  # ruff:ignore[import-outside-top-level]
+
+    get_wheel = mocker.spy(via_app_data, "get_wheel")
+    destinations = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+
+    results = cli_run_many(destinations, ["--seeder", "app-data", "--no-setuptools", "--activators", ""])
+
+    for session in results:
+        assert not isinstance(session, Exception), session
+        assert (session.creator.purelib / "pip").exists()
+    assert get_wheel.call_count == 1  # only pip is seeded, and resolved once for the whole batch
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_complete_image_skips_lock(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.util.lock import ReentrantFileLock  # ruff:ignore[import-outside-top-level]
+
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", ""]
+    first = cli_run([str(tmp_path / "a"), *cmd])
+    images = first.creator.interpreter.version_release_str
+    assert list(first.seeder.app_data.lock.path.glob(f"wheel/{images}/image/1/*/pip-*/.virtualenv-image.json"))
+
+    exclusive = mocker.spy(ReentrantFileLock, "exclusive_lock_for_key")
+    second = cli_run([str(tmp_path / "b"), *cmd])
+
+    assert exclusive.call_count == 0
+    assert (second.creator.purelib / "pip").exists()
+
+
+def test_app_data_failed_build_leaves_no_image(tmp_path: Path, temp_app_data: Path, mocker: MockerFixture) -> None:
+    mocker.patch(
+        "virtualenv.seed.embed.via_app_data.pip_install.copy.CopyPipInstall._fix_records", side_effect=RuntimeError
+    )
+    cmd = [str(tmp_path / "venv"), "--seeder", "app-data", "--no-setuptools", "--link-app-data", "copy"]
+
+    with pytest.raises(RuntimeError, match="failed to build image pip"):
+        cli_run(cmd)
+
+    folder = next(temp_app_data.glob("wheel/*/image/1/CopyPipInstall"))
+    assert not [i for i in folder.iterdir() if i.is_dir()]
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_damaged_image_rebuilt(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.seed.embed.via_app_data.pip_install import base  # ruff:ignore[import-outside-top-level]
+
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", "copy"]
+    session = cli_run([str(tmp_path / "a"), *cmd])
+    images = session.seeder.app_data.lock.path / "wheel" / session.creator.interpreter.version_release_str / "image"
+    image = next(i for i in images.glob("1/CopyPipInstall/pip-*") if i.is_dir())
+    (image / "pip" / "__init__.py").unlink()
+    mocker.patch.dict(base._VERIFIED, clear=True)  # ruff:ignore[private-member-access]
+
+    session = cli_run([str(tmp_path / "b"), *cmd])
+
+    assert (image / "pip" / "__init__.py").exists()
+    assert (session.creator.purelib / "pip" / "__init__.py").exists()
+    assert not list(image.parent.glob("*.staging"))
+
+
+@pytest.mark.skipif(not fs_supports_symlink(), reason="symlink not supported")
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_linked_image_compiled_by_environment(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.seed.embed.via_app_data.pip_install import base  # ruff:ignore[import-outside-top-level]
+    from virtualenv.seed.embed.via_app_data.pip_install.symlink import (  # ruff:ignore[import-outside-top-level]
+        SymlinkPipInstall,
+    )
+
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", "symlink"]
+    session = cli_run([str(tmp_path / "a"), *cmd])
+    version = session.creator.interpreter.version_release_str
+    images = session.seeder.app_data.lock.path / "wheel" / version / "image"
+    image = next(i for i in images.glob("1/SymlinkPipInstall/pip-*") if i.is_dir() and i.suffix != ".refs")
+    py_cache = image / "pip" / "__pycache__"
+    mode = py_cache.stat().st_mode
+    py_cache.chmod(mode | S_IWUSR)
+    try:  # as an environment importing with -O does
+        (py_cache / f"__init__.{sys.implementation.cache_tag}.opt-1.pyc").write_bytes(b"")
+    finally:
+        py_cache.chmod(mode)
+    mocker.patch.dict(base._VERIFIED, clear=True)  # ruff:ignore[private-member-access]
+
+    installer = SymlinkPipInstall(get_embed_wheel("pip", version).path, session.creator, image)
+
+    assert installer.has_image()
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_images_share_wheel_content(tmp_path: Path) -> None:
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", ""]
+    for link in ("copy", "hardlink"):
+        session = cli_run([str(tmp_path / link), *cmd, "--link-app-data", link])
+    app_data = session.seeder.app_data
+    (content,) = [i for i in app_data.wheel_content.iterdir() if i.is_dir()]
+    images = app_data.lock.path / "wheel" / session.creator.interpreter.version_release_str / "image" / "1"
+    copy_image, hardlink_image = (
+        next(i for i in images.glob(f"{name}/pip-*") if i.is_dir()) for name in ("CopyPipInstall", "HardlinkPipInstall")
+    )
+
+    shared = {(i / "pip" / "__init__.py").stat().st_ino for i in (content, copy_image, hardlink_image)}
+    assert len(shared) == 1  # extracted once, the images link to it
+    (dist_info,) = content.glob("*.dist-info")
+    record = (dist_info / "RECORD").read_text(encoding="utf-8")
+    assert (copy_image / dist_info.name / "RECORD").read_text(encoding="utf-8") != record  # rewritten per image
+    with zipfile.ZipFile(str(get_embed_wheel("pip", session.creator.interpreter.version_release_str).path)) as zip_ref:
+        assert zip_ref.read(f"{dist_info.name}/RECORD").decode("utf-8") == record
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_damaged_wheel_content_extracted_again(tmp_path: Path) -> None:
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", "copy"]
+    session = cli_run([str(tmp_path / "a"), *cmd])
+    app_data = session.seeder.app_data
+    (content,) = [i for i in app_data.wheel_content.iterdir() if i.is_dir()]
+    (content / "pip" / "__init__.py").unlink()
+    safe_delete(app_data.lock.path / "wheel" / session.creator.interpreter.version_release_str / "image")
+
+    session = cli_run([str(tmp_path / "b"), *cmd])
+
+    assert (content / "pip" / "__init__.py").exists()
+    assert (session.creator.purelib / "pip" / "__init__.py").exists()
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_copy_image_precompiled(tmp_path: Path) -> None:
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", "copy"]
+    session = cli_run([str(tmp_path / "venv"), *cmd])
+    tag = sys.implementation.cache_tag
+    pyc = session.creator.purelib / "pip" / "__pycache__" / f"__init__.{tag}.pyc"
+
+    assert pyc.read_bytes()[4:8] == b"\x00\x00\x00\x00"  # timestamp based, valid as the source keeps its age
+    image = next(i for i in (tmp_path / "app-data").rglob("CopyPipInstall/pip-*") if i.is_dir())
+    source = session.creator.purelib / "pip" / "__init__.py"
+    assert source.stat().st_mtime_ns == (image / "pip" / "__init__.py").stat().st_mtime_ns
+    (dist_info,) = session.creator.purelib.glob("pip-*.dist-info")
+    records = (dist_info / "RECORD").read_text(encoding="utf-8").splitlines()
+    assert f"pip/__pycache__/__init__.{tag}.pyc,," in records
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_compile_options(tmp_path: Path) -> None:
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", "copy"]
+    options = ["--compile-optimize", "0", "2", "--compile-invalidation-mode", "checked-hash"]
+    session = cli_run([str(tmp_path / "venv"), *cmd, *options])
+    images = session.seeder.app_data.lock.path / "wheel" / session.creator.interpreter.version_release_str / "image"
+    image = next(i for i in images.glob("1/CopyPipInstall-o02-checked-hash/pip-*") if i.is_dir())
+
+    assert list((image / "pip" / "__pycache__").glob("__init__.*.opt-2.pyc"))
+    pyc = session.creator.purelib / "pip" / "__pycache__" / f"__init__.{sys.implementation.cache_tag}.pyc"
+    assert pyc.read_bytes()[4:8] == b"\x03\x00\x00\x00"  # checked hash based, valid for the copied source
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_compile_server(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.seed.embed.via_app_data.pip_install import compiler  # ruff:ignore[import-outside-top-level]
+
+    popen = mocker.patch.object(compiler, "Popen", wraps=compiler.Popen)
+    cmd = ["--seeder", "app-data", "--setuptools", "bundle", "--activators", "", "--compile-server"]
+    session = cli_run([str(tmp_path / "venv"), *cmd])
+
+    assert popen.call_count == 1  # one process compiled both images
+    for name in ("pip", "setuptools"):
+        assert list((session.creator.purelib / name / "__pycache__").glob("__init__.*.pyc"))
+    assert not session.seeder._compilers  # ruff:ignore[private-member-access] # stopped along with the session
+
+
+def test_compiler_reports_failed_sources(tmp_path: Path) -> None:
+    (tmp_path / "good.py").write_text("a = 1\n", encoding="utf-8")
+    (tmp_path / "bad.py").write_text("a = \n", encoding="utf-8")
+    compiler = Compiler(Path(sys.executable), workers=2)
+    try:
+        failed = compiler.compile(tmp_path, None, (0, 2), "unchecked-hash")
+        assert compiler.compile(tmp_path / "missing", None, (0,), "timestamp") == []  # the process serves again
+    finally:
+        compiler.close()
+
+    assert failed == [str(tmp_path / "bad.py")]
+    assert len(list((tmp_path / "__pycache__").glob("good.*.pyc"))) == 2
+
+
+@pytest.mark.timeout(60)
+def test_compiler_many_warnings(tmp_path: Path) -> None:
+    warns = "".join(f"assert ({i}, 'always true')\n" for i in range(100))  # a SyntaxWarning per line
+    for i in range(20):  # more than a pipe buffer of warnings
+        (tmp_path / f"m{i}.py").write_text(warns, encoding="utf-8")
+    compiler = Compiler(Path(sys.executable), workers=2)
+    try:
+        failed = compiler.compile(tmp_path, None, (0,), "timestamp")
+    finally:
+        compiler.close()
+
+    assert failed == []
+    assert len(list((tmp_path / "__pycache__").glob("m*.pyc"))) == 20
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_pth_install(tmp_path: Path) -> None:
+    cmd = ["--seeder", "app-data", "--setuptools", "bundle", "--activators", "", "--link-app-data", "pth"]
+    session = cli_run([str(tmp_path / "venv"), *cmd])
+    purelib, exe = session.creator.purelib, str(session.creator.exe)
+
+    assert not (purelib / "pip").exists()  # stays in the image
+    assert (purelib / "distutils-precedence.pth").exists()
+    (pth,) = purelib.glob("_virtualenv-pip-*.pth")
+    image = Path(pth.read_text(encoding="utf-8").strip())
+    out = subprocess.check_output([exe, "-c", "import setuptools, pip; print(pip.__file__)"], text=True)
+    assert Path(out.strip()) == image / "pip" / "__init__.py"
+
+    check_call([exe, "-m", "pip", "uninstall", "-y", "-q", "pip"])
+    assert not pth.exists()
+    assert not list(purelib.glob("pip-*.dist-info"))
+    assert image.exists()
+
+
+@pytest.mark.usefixtures("temp_app_data")
+@pytest.mark.parametrize("link", ["copy", "hardlink"])
+def test_app_data_seed_package(tmp_path: Path, link: str) -> None:
+    wheels = tmp_path / "wheels"
+    wheels.mkdir()
+    for version in ("1.0", "2.0"):
+        with zipfile.ZipFile(wheels / f"tool_a-{version}-py3-none-any.whl", "w") as zip_ref:
+            zip_ref.writestr("tool_a/__init__.py", f"VERSION = {version!r}\n")
+            zip_ref.writestr(
+                f"tool_a-{version}.dist-info/METADATA", f"Metadata-Version: 2.1\nName: tool-a\nVersion: {version}\n"
+            )
+            zip_ref.writestr(f"tool_a-{version}.dist-info/WHEEL", "Wheel-Version: 1.0\nRoot-Is-Purelib: true\n")
+            zip_ref.writestr(f"tool_a-{version}.dist-info/RECORD", "")
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", link]
+    cmd.extend(["--extra-search-dir", str(wheels), "--seed-package", "tool-a"])
+
+    session = cli_run([str(tmp_path / "venv"), *cmd])
+
+    out = subprocess.check_output([str(session.creator.exe), "-c", "import tool_a; print(tool_a.VERSION)"], text=True)
+    assert out.strip() == "2.0"  # the latest found
+    assert (session.creator.purelib / "pip").exists()
+
+
+@pytest.mark.usefixtures("temp_app_data")
+def test_app_data_seed_package_not_downloaded(tmp_path: Path, mocker: MockerFixture) -> None:
+    download = mocker.patch("virtualenv.seed.wheels.acquire.download_wheel")
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--seed-package", "tool-a"]
+
+    with pytest.raises(RuntimeError, match="tool-a"):
+        cli_run([str(tmp_path / "venv"), *cmd, "--extra-search-dir", str(tmp_path)])
+
+    assert not download.called
+
+
+@pytest.mark.usefixtures("temp_app_data")
+@pytest.mark.parametrize(
+    ("extra", "purelib"),
+    [
+        pytest.param({"tool_a-1.0.data/scripts/tool-a": "#!python\n"}, "true", id="data"),
+        pytest.param({}, "false", id="platlib"),
+    ],
+)
+def test_app_data_seed_package_not_purelib(tmp_path: Path, extra: dict[str, str], purelib: str) -> None:
+    with zipfile.ZipFile(tmp_path / "tool_a-1.0-py3-none-any.whl", "w") as zip_ref:
+        zip_ref.writestr("tool_a/__init__.py", "")
+        zip_ref.writestr("tool_a-1.0.dist-info/METADATA", "Metadata-Version: 2.1\nName: tool-a\nVersion: 1.0\n")
+        zip_ref.writestr("tool_a-1.0.dist-info/WHEEL", f"Wheel-Version: 1.0\nRoot-Is-Purelib: {purelib}\n")
+        zip_ref.writestr("tool_a-1.0.dist-info/RECORD", "")
+        for name, content in extra.items():
+            zip_ref.writestr(name, content)
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--seed-package", "tool-a"]
+
+    with pytest.raises(RuntimeError, match="tool-a"):
+        cli_run([str(tmp_path / "venv"), *cmd, "--extra-search-dir", str(tmp_path)])
+
+    assert not (tmp_path / "venv" / "bin" / "tool-a").exists()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from virtualenv.app_data import AppDataDiskFolder, AppDataMemory, AppDataSQLite
+from virtualenv.app_data.via_disk_folder import JSONStoreDisk
+from virtualenv.run import cli_run, session_via_cli
+from virtualenv.seed.wheels.periodic_update import UpdateLog, add_wheel_to_update_log
+from virtualenv.seed.wheels.util import Wheel
+from virtualenv.util.lock import LeaseFileLock
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_sqlite_backend_selected(tmp_path: Path) -> None:
+    session = session_via_cli([
+        str(tmp_path / "venv"),
+        "--app-data",
+        str(tmp_path / "ad"),
+        "--backend-app-data",
+        "sqlite",
+    ])
+    with session:
+        assert isinstance(session._app_data, AppDataSQLite)  # ruff:ignore[private-member-access]
+    assert (tmp_path / "ad" / "content" / "1.sqlite").is_file()
+
+
+def test_sqlite_store_round_trip(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path))
+    store = app_data.py_info(Path("/usr/bin/python3"))
+    assert not store.exists()
+    assert store.read() is None
+
+    with store.locked():
+        store.write({"a": 1})
+    assert store.exists()
+    assert app_data.py_info(Path("/usr/bin/python3")).read() == {"a": 1}
+    assert not app_data.py_info(Path("/usr/bin/python2")).exists()
+
+    store.remove()
+    assert not store.exists()
+    app_data.close()
+
+
+def test_sqlite_py_info_clear_keeps_other_content(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path))
+    app_data.py_info(Path("python")).write({})
+    app_data.embed_update_log("pip", "3.12").write({"completed": None})
+
+    app_data.py_info_clear()
+
+    assert not app_data.py_info(Path("python")).exists()
+    assert app_data.embed_update_log("pip", "3.12").read() == {"completed": None}
+    assert not app_data.embed_update_log("pip", "3.13").exists()
+
+
+def test_sqlite_bad_content_removed(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path))
+    store = app_data.plugin_index("python")
+    app_data._db.set(store.kind, store.key, "{")  # ruff:ignore[private-member-access]
+
+    assert store.read() is None
+    assert not store.exists()
+
+
+def test_sqlite_shared_across_threads_and_instances(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path))
+
+    def _write(at: int) -> None:
+        with app_data.py_info(Path(f"python{at}")).locked():
+            app_data.py_info(Path(f"python{at}")).write(at)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_write, range(32)))
+
+    other = AppDataSQLite(str(tmp_path))
+    assert [other.py_info(Path(f"python{at}")).read() for at in range(32)] == list(range(32))
+
+
+def test_sqlite_locked_is_a_transaction(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path))
+    store = app_data.py_info(Path("python"))
+    store.write({"a": 0})
+    other = sqlite3.connect(str(store.file), timeout=0, isolation_level=None)
+
+    def _fail() -> None:
+        with store.locked():
+            store.write({"a": 2})
+            msg = "fail"
+            raise ValueError(msg)
+
+    with store.locked():
+        store.write({"a": 1})
+        with pytest.raises(sqlite3.OperationalError, match="locked"):  # other processes wait for the transaction
+            other.execute("BEGIN IMMEDIATE")
+    with pytest.raises(ValueError, match="fail"):
+        _fail()
+
+    assert store.read() == {"a": 1}  # rolled back
+    other.close()
+    app_data.close()
+
+
+def test_sqlite_reset(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path / "ad"))
+    app_data.py_info(Path("python")).write({})
+
+    app_data.reset()
+
+    assert not app_data.py_info(Path("python")).exists()
+
+
+def test_sqlite_update_log(tmp_path: Path) -> None:
+    app_data = AppDataSQLite(str(tmp_path))
+    wheel = Wheel(tmp_path / "pip-99.0-py3-none-any.whl")
+
+    add_wheel_to_update_log(wheel, "3.12", app_data)
+
+    log = UpdateLog.from_dict(app_data.embed_update_log("pip", "3.12").read())
+    assert [i.filename for i in log.versions] == [wheel.name]
+
+
+def test_json_store_write_replaces_file(tmp_path: Path) -> None:
+    store = AppDataDiskFolder(str(tmp_path)).plugin_index("python")
+    store.write({"a": 1})
+    before = store.file.stat().st_ino
+
+    store.write({"a": 2})
+
+    assert store.file.stat().st_ino != before  # readers holding the old file keep reading complete content
+    assert [i.name for i in store.file.parent.iterdir() if not i.name.endswith(".lock")] == [store.file.name]
+    assert store.read() == {"a": 2}
+
+
+def test_json_store_read_memoized(tmp_path: Path, mocker: MockerFixture) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    app_data.embed_update_log("pip", "3.12").write({"versions": [1]})
+    assert app_data.embed_update_log("pip", "3.12").read() == {"versions": [1]}
+    loads = mocker.spy(json, "loads")
+
+    first = app_data.embed_update_log("pip", "3.12").read()
+    first["versions"].append(2)  # callers own what they get
+
+    assert app_data.embed_update_log("pip", "3.12").read() == {"versions": [1]}
+    assert loads.call_count == 0
+
+
+def test_json_store_read_sees_other_process_write(tmp_path: Path) -> None:
+    store = AppDataDiskFolder(str(tmp_path)).plugin_index("python")
+    store.write({"a": 1})
+    assert store.read() == {"a": 1}
+
+    other = store.file.with_name("other")
+    other.write_text('{"a": 2}', encoding="utf-8")
+    os.replace(other, store.file)
+
+    assert store.read() == {"a": 2}
+
+
+def test_json_store_bad_content_removed(tmp_path: Path) -> None:
+    store = AppDataDiskFolder(str(tmp_path)).plugin_index("python")
+    store.file.parent.mkdir(parents=True)
+    store.file.write_text("{", encoding="utf-8")
+
+    assert store.read() is None
+    assert not store.exists()
+
+
+def test_memory_only_backend(tmp_path: Path) -> None:
+    app_data_dir = tmp_path / "ad"
+    args = [str(tmp_path / "venv"), "--app-data", str(app_data_dir), "--backend-app-data", "memory-only"]
+    with session_via_cli([*args, "--no-setuptools", "--activators", ""]) as session:
+        app_data = session._app_data  # ruff:ignore[private-member-access]
+        session.run()
+        assert isinstance(app_data, AppDataMemory)
+        assert app_data.transient
+        folder = app_data.lock.path
+        assert list(folder.glob("wheel/*/image/*/CopyPipInstall/pip-*"))
+
+    assert (tmp_path / "venv" / "pyvenv.cfg").exists()
+    assert not app_data_dir.exists()
+    assert not folder.exists()
+
+
+def test_memory_layer_reads_once_and_writes_through(tmp_path: Path, mocker: MockerFixture) -> None:
+    AppDataDiskFolder(str(tmp_path)).plugin_index("python").write({"a": 1})
+    read = mocker.spy(JSONStoreDisk, "read")
+
+    for _ in range(2):
+        app_data = AppDataMemory(str(tmp_path))
+        assert app_data.plugin_index("python").read() == {"a": 1}
+        app_data.close()
+    assert read.call_count == 1  # the second app data of the process is served from memory
+
+    app_data.plugin_index("python").write({"a": 2})
+    assert AppDataDiskFolder(str(tmp_path)).plugin_index("python").read() == {"a": 2}
+    assert AppDataMemory(backing=AppDataSQLite(str(tmp_path))).plugin_index("python").read() is None
+    app_data.reset()
+
+
+def test_memory_only_store(tmp_path: Path) -> None:
+    app_data = AppDataMemory()
+    gone = tmp_path / "python"
+    store = app_data.py_info(gone)
+    with store.locked():
+        store.write({"a": [1]})
+    store.read()["a"].append(2)  # callers own what they get
+
+    assert store.read() == {"a": [1]}
+    assert not app_data.can_update
+    assert app_data.py_info_prune() == 1
+    assert not store.exists()
+    app_data.close()
+
+
+def test_lease_locks_kept_in_folder(tmp_path: Path) -> None:
+    app_data_dir = tmp_path / "ad"
+    cmd = ["--app-data", str(app_data_dir), "--no-setuptools", "--activators", ""]
+    cli_run([str(tmp_path / "a"), *cmd, "--app-data-lease-locks"])
+    cli_run([str(tmp_path / "b"), *cmd])
+
+    assert isinstance(AppDataDiskFolder(str(app_data_dir)).lock, LeaseFileLock)
+    assert (tmp_path / "b" / "pyvenv.cfg").exists()
+    assert not list(app_data_dir.rglob("*.lock"))
+    assert not list(app_data_dir.rglob("*.lease"))
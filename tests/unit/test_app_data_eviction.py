@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from argparse import ArgumentTypeError
+from typing import TYPE_CHECKING
+
+import pytest
+
+from virtualenv.app_data import AppDataDiskFolder, AppDataSQLite
+from virtualenv.app_data.eviction import (
+    COLLECT_PERIOD,
+    IN_USE_PERIOD,
+    collect,
+    image_path_file,
+    parse_size,
+    refer_image,
+    trigger_collect,
+)
+from virtualenv.info import fs_supports_symlink
+from virtualenv.run import cli_run, session_via_cli
+from virtualenv.util.path import safe_delete
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+OLD = time.time() - 2 * IN_USE_PERIOD.total_seconds()
+
+
+def _image(app_data: AppDataDiskFolder, name: str, size: int, used: float) -> Path:
+    image = app_data.wheel_image("3.12", f"CopyPipInstall/{name}")
+    image.mkdir(parents=True)
+    (image / "content").write_bytes(b"0" * size)
+    os.utime(image, (used, used))
+    return image
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("100", 100), ("1k", 1024), ("500M", 500 << 20), ("2G", 2 << 30), ("1.5 GiB", 3 << 29), ("3TB", 3 << 40)],
+)
+def test_parse_size(value: str, expected: int) -> None:
+    assert parse_size(value) == expected
+
+
+def test_parse_size_invalid() -> None:
+    with pytest.raises(ArgumentTypeError, match="invalid size 'a lot'"):
+        parse_size("a lot")
+
+
+def test_collect_evicts_least_recently_used(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    oldest = _image(app_data, "a-1-py3-none-any", 1000, OLD - 20)
+    older = _image(app_data, "b-1-py3-none-any", 1000, OLD - 10)
+    old = _image(app_data, "c-1-py3-none-any", 1000, OLD)
+    recent = _image(app_data, "d-1-py3-none-any", 1000, time.time())
+
+    collected = collect(app_data, 2500)
+
+    assert not oldest.exists()
+    assert not older.exists()
+    assert old.exists()
+    assert recent.exists()  # might be in use by a creation in progress, even though over the budget
+    assert collected.removed == 2
+    assert collected.freed == 2000
+    assert collected.size == 2000
+
+
+def test_collect_without_budget_removes_only_stale(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    image = _image(app_data, "a-1-py3-none-any", 1000, OLD)
+    staging = image.with_name(f".{image.name}.12345678.staging")
+    staging.mkdir()
+    orphan_refs = image.with_name("gone-1-py3-none-any.refs")
+    orphan_refs.mkdir()
+
+    collected = collect(app_data, None)
+
+    assert image.exists()
+    assert not staging.exists()
+    assert not orphan_refs.exists()
+    assert collected.removed == 2
+
+
+def test_collect_skips_image_in_use(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    image = _image(app_data, "a-1-py3-none-any", 1000, OLD)
+
+    with (app_data.lock / image.parent).shared_lock_for_key(image.name):  # ty: ignore[unresolved-attribute]
+        assert collect(app_data, 0).removed == 0
+    assert image.exists()
+
+
+def test_collect_evicts_wheel_from_update_log(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    wheel = app_data.house / "pip-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"0" * 1000)
+    os.utime(wheel, (OLD, OLD))
+    kept = {"filename": "pip-2.0-py3-none-any.whl", "found_date": None, "release_date": None, "source": "periodic"}
+    update_log = app_data.embed_update_log("pip", "3.12")
+    update_log.write({"versions": [{**kept, "filename": wheel.name}, kept]})
+
+    assert collect(app_data, 0).removed == 1
+
+    assert not wheel.exists()
+    assert update_log.read()["versions"] == [kept]
+
+
+@pytest.mark.parametrize("backend", [AppDataDiskFolder, AppDataSQLite])
+def test_collect_prunes_missing_interpreters(tmp_path: Path, backend: type[AppDataDiskFolder]) -> None:
+    app_data = backend(str(tmp_path))
+    gone = tmp_path / "gone" / "python"
+    for path in (gone, sys.executable):
+        app_data.py_info(path).write({"path": str(path), "st_mtime": 1, "hash": "a", "content": {}})
+
+    assert app_data.py_info_prune() == 1
+
+    assert not app_data.py_info(gone).exists()
+    assert app_data.py_info(sys.executable).exists()
+    app_data.close()
+
+
+@pytest.mark.skipif(not fs_supports_symlink(), reason="symlink not supported")
+def test_collect_keeps_image_linked(tmp_path: Path) -> None:
+    app_data_dir, venv = tmp_path / "app-data", tmp_path / "venv"
+    cli_run([str(venv), "--app-data", str(app_data_dir), "--link-app-data", "symlink", "--activators", ""])
+    app_data = AppDataDiskFolder(str(app_data_dir))
+    images = list(app_data_dir.glob("wheel/*/image/1/SymlinkPipInstall/pip-*"))
+    image = next(i for i in images if i.is_dir() and i.suffix != ".refs")
+    os.utime(image, (OLD, OLD))
+
+    collect(app_data, 0)
+    assert image.exists()
+
+    safe_delete(venv)
+    collect(app_data, 0)
+    assert not image.exists()
+    assert not image.with_name(f"{image.name}.refs").exists()
+
+
+def test_collect_keeps_image_on_path(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path / "app-data"))
+    image = _image(app_data, "a-1-py3-none-any", 1000, OLD)
+    purelib = tmp_path / "venv"
+    purelib.mkdir()
+    refer_image(image, purelib)
+    pth = image_path_file(image, purelib)
+    pth.write_text(f"{image}\n", encoding="utf-8")
+
+    collect(app_data, 0)
+    assert image.exists()
+
+    pth.unlink()
+    collect(app_data, 0)
+    assert not image.exists()
+
+
+def test_collect_keeps_linked_image_without_refs(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    image = app_data.wheel_image("3.12", "PthPipInstall/a-1-py3-none-any")
+    image.mkdir(parents=True)
+    os.utime(image, (OLD, OLD))
+
+    collect(app_data, 0)
+
+    assert image.exists()  # built before the references got recorded, an environment might still link to it
+
+
+@pytest.mark.slow
+def test_collect_keeps_image_of_clone(tmp_path: Path) -> None:
+    app_data_dir, template, clone = tmp_path / "app-data", tmp_path / "template", tmp_path / "clone"
+    cmd = ["--app-data", str(app_data_dir), "--link-app-data", "pth", "--no-setuptools", "--activators", ""]
+    cli_run([str(template), *cmd])
+    cli_run([str(clone), *cmd, "--from-template", str(template)])
+    app_data = AppDataDiskFolder(str(app_data_dir))
+    images = app_data_dir.glob("wheel/*/image/1/PthPipInstall/pip-*")
+    image = next(i for i in images if i.is_dir() and i.suffix != ".refs")
+    os.utime(image, (OLD, OLD))
+
+    safe_delete(template)
+    collect(app_data, 0)
+    assert image.exists()
+
+    safe_delete(clone)
+    collect(app_data, 0)
+    assert not image.exists()
+
+
+def test_gc_command(tmp_path: Path) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    image = _image(app_data, "a-1-py3-none-any", 1000, OLD)
+
+    with pytest.raises(SystemExit) as context:
+        cli_run(["venv", "--app-data", str(tmp_path), "--app-data-gc", "--app-data-max-size", "0"])
+
+    assert context.value.code == 0
+    assert not image.exists()
+
+
+def test_trigger_collect_once_per_period(tmp_path: Path, mocker) -> None:
+    popen = mocker.patch("virtualenv.app_data.eviction.Popen")
+    app_data = AppDataDiskFolder(str(tmp_path))
+
+    trigger_collect(app_data, 100)
+    trigger_collect(app_data, 100)
+    assert popen.call_count == 1
+    assert (
+        "collect(getattr(import_module('virtualenv.app_data.via_disk_folder'), 'AppDataDiskFolder')"
+        in (popen.call_args[0][0][2])
+    )
+
+    stamp = next(tmp_path.glob("*.stamp"))
+    due = time.time() - COLLECT_PERIOD.total_seconds() - 1
+    os.utime(stamp, (due, due))
+    trigger_collect(app_data, 100)
+    assert popen.call_count == 2
+
+
+def test_budget_triggers_collect_on_close(tmp_path: Path, mocker) -> None:
+    trigger = mocker.patch("virtualenv.app_data.via_disk_folder.trigger_collect")
+    args = ["venv", "--app-data", str(tmp_path), "--without-pip", "--activators", ""]
+    with session_via_cli([*args, "--app-data-max-size", "1G"]) as session:
+        app_data = session._app_data  # ruff:ignore[private-member-access]
+    trigger.assert_called_once_with(app_data, 1 << 30)
+    with session_via_cli(args):
+        pass
+    assert trigger.call_count == 1
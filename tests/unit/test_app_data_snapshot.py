@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import tarfile
+from typing import TYPE_CHECKING
+
+import pytest
+
+from virtualenv.app_data import AppDataDiskFolder, AppDataSQLite
+from virtualenv.app_data.snapshot import export_app_data, import_app_data
+from virtualenv.run import cli_run
+from virtualenv.seed.wheels.embed import get_embed_wheel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_snapshot_prewarms_read_only_app_data(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.seed.embed.via_app_data.pip_install.base import PipInstall  # ruff:ignore[import-outside-top-level]
+
+    warm, cold, archive = tmp_path / "warm", tmp_path / "cold", tmp_path / "app-data.tar.gz"
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", ""]
+    cli_run([str(tmp_path / "a"), "--app-data", str(warm), *cmd])
+    assert export_app_data(warm, archive) > 0
+
+    assert import_app_data(cold, archive) > 0
+    build = mocker.spy(PipInstall, "build_image")
+    session = cli_run([str(tmp_path / "b"), "--app-data", str(cold), "--read-only-app-data", *cmd])
+
+    assert build.call_count == 0
+    assert (session.creator.purelib / "pip" / "__init__.py").exists()
+    assert not list(cold.rglob("*.import"))
+
+
+def test_snapshot_keeps_lock_files_of_images(tmp_path: Path, mocker: MockerFixture) -> None:
+    from virtualenv.seed.embed.via_app_data.pip_install import base  # ruff:ignore[import-outside-top-level]
+    from virtualenv.seed.embed.via_app_data.pip_install.copy import (  # ruff:ignore[import-outside-top-level]
+        CopyPipInstall,
+    )
+
+    warm, cold, archive = tmp_path / "warm", tmp_path / "cold", tmp_path / "app-data.tar"
+    cmd = ["--seeder", "app-data", "--no-setuptools", "--activators", "", "--link-app-data", "copy"]
+    session = cli_run([str(tmp_path / "a"), "--app-data", str(warm), *cmd])
+    version = session.creator.interpreter.version_release_str
+    image = next(i for i in (warm / "wheel" / version / "image").glob("1/CopyPipInstall/pip-*") if i.is_dir())
+    manifest = json.loads((image / base.MANIFEST).read_text(encoding="utf-8"))
+    (image / "pip" / "_vendor" / ".lock").write_text("", encoding="utf-8")  # as setuptools vendors
+    manifest["files"] += 1
+    (image / base.MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+    export_app_data(warm, archive)
+
+    import_app_data(cold, archive)
+
+    mocker.patch.dict(base._VERIFIED, clear=True)  # ruff:ignore[private-member-access]
+    imported = cold / image.relative_to(warm)
+    assert (imported / "pip" / "_vendor" / ".lock").exists()
+    assert CopyPipInstall(get_embed_wheel("pip", version).path, session.creator, imported).has_image()
+
+
+def test_snapshot_keeps_exact_modification_times(tmp_path: Path) -> None:
+    wheel = AppDataDiskFolder(str(tmp_path / "a")).house / "pip-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"wheel")
+    os.utime(wheel, ns=(1_700_000_000_123_456_789, 1_700_000_000_123_456_789))
+    export_app_data(tmp_path / "a", tmp_path / "out.tar")
+
+    import_app_data(tmp_path / "b", tmp_path / "out.tar")
+
+    assert (tmp_path / "b" / "wheel" / "house" / wheel.name).stat().st_mtime_ns == 1_700_000_000_123_456_789
+
+
+def test_snapshot_import_keeps_existing_content(tmp_path: Path) -> None:
+    source, target = AppDataSQLite(str(tmp_path / "a")), AppDataSQLite(str(tmp_path / "b"))
+    source.py_info(tmp_path / "python").write({"from": "snapshot"})
+    source.plugin_index("python").write({"from": "snapshot"})
+    target.py_info(tmp_path / "python").write({"from": "target"})
+    (tmp_path / "a" / "wheel").mkdir()
+    (tmp_path / "a" / "wheel" / "file").write_text("snapshot", encoding="utf-8")
+    (tmp_path / "b" / "wheel").mkdir()
+    (tmp_path / "b" / "wheel" / "file").write_text("target", encoding="utf-8")
+    export_app_data(tmp_path / "a", tmp_path / "out.tar")
+    target.close()
+
+    import_app_data(tmp_path / "b", tmp_path / "out.tar")
+
+    target = AppDataSQLite(str(tmp_path / "b"))
+    assert target.py_info(tmp_path / "python").read() == {"from": "target"}
+    assert target.plugin_index("python").read() == {"from": "snapshot"}
+    assert (tmp_path / "b" / "wheel" / "file").read_text(encoding="utf-8") == "target"
+    for app_data in (source, target):
+        app_data.close()
+
+
+def test_snapshot_import_rejects_foreign_archive(tmp_path: Path) -> None:
+    with tarfile.open(str(tmp_path / "out.tar"), "w") as tar:
+        tar.addfile(tarfile.TarInfo("file"), io.BytesIO())
+
+    with pytest.raises(RuntimeError, match="is not an app data snapshot"):
+        import_app_data(tmp_path / "app-data", tmp_path / "out.tar")
+
+
+def test_snapshot_import_rejects_escaping_entry(tmp_path: Path) -> None:
+    export_app_data(tmp_path / "empty", tmp_path / "out.tar")
+    with tarfile.open(str(tmp_path / "out.tar"), "a") as tar:
+        tar.addfile(tarfile.TarInfo("../evil"), io.BytesIO())
+
+    with pytest.raises(RuntimeError, match="outside of the app data"):
+        import_app_data(tmp_path / "app-data", tmp_path / "out.tar")
+    assert not (tmp_path / "evil").exists()
+
+
+@pytest.mark.parametrize("target", ["../secret", "/etc/passwd"])
+def test_snapshot_import_rejects_escaping_link(tmp_path: Path, target: str) -> None:
+    export_app_data(tmp_path / "empty", tmp_path / "out.tar")
+    with tarfile.open(str(tmp_path / "out.tar"), "a") as tar:
+        link = tarfile.TarInfo("wheel/link")
+        link.type, link.linkname = tarfile.LNKTYPE, target
+        tar.addfile(link)
+
+    with pytest.raises(RuntimeError, match="refusing to import link to outside of the app data"):
+        import_app_data(tmp_path / "app-data", tmp_path / "out.tar")
+    assert not (tmp_path / "app-data" / "wheel" / "link").exists()
+
+
+@pytest.mark.parametrize("command", ["--app-data-export", "--app-data-import"])
+def test_snapshot_commands(tmp_path: Path, command: str) -> None:
+    export_app_data(tmp_path / "empty", tmp_path / "in.tar")
+    archive = tmp_path / ("in.tar" if command == "--app-data-import" else "out.tar")
+
+    with pytest.raises(SystemExit) as context:
+        cli_run(["venv", "--app-data", str(tmp_path / "app-data"), command, str(archive)])
+
+    assert context.value.code == 0
+    assert archive.exists()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import socket
+from pathlib import Path
+from threading import Thread
+from typing import TYPE_CHECKING
+
+import pytest
+
+from virtualenv.daemon import ENV_SOCKET, _create, forward, make_server
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+
+
+@pytest.fixture
+def server(tmp_path_factory) -> Generator[str, None, None]:
+    path = str(tmp_path_factory.mktemp("d") / "s")  # keep it short, socket paths are limited to ~100 characters
+    server = make_server(path)
+    thread = Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield path
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+def test_forward_creates(server, tmp_path: Path, monkeypatch, capsys) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    code = forward(["venv", "--without-pip", "--activators", ""], {ENV_SOCKET: server})
+
+    assert code == 0
+    assert (tmp_path / "venv" / "pyvenv.cfg").exists()
+    out, _ = capsys.readouterr()
+    assert "created virtual environment" in out
+
+
+def test_forward_reports_failure(server, tmp_path: Path, capsys) -> None:
+    code = forward([str(tmp_path / "venv"), "--python", "does-not-exist"], {ENV_SOCKET: server})
+
+    assert code == 1
+    out, _ = capsys.readouterr()
+    assert "failed to find interpreter" in out
+
+
+def test_forward_without_server(tmp_path: Path) -> None:
+    assert forward(["venv"], {}) is None
+    assert forward(["venv"], {ENV_SOCKET: str(tmp_path / "missing")}) is None
+
+
+def test_serve_refuses_socket_in_use(server) -> None:
+    with pytest.raises(RuntimeError, match="already listening"):
+        make_server(server)
+
+
+def test_serve_socket_private(server) -> None:
+    assert Path(server).stat().st_mode & 0o077 == 0
+
+
+@pytest.mark.parametrize(
+    "arg", ["--serve", "--serve=other", "--app-data-gc", "--app-data-exp", "--upgrade-embed", "--upgrade-embed-wheels"]
+)
+def test_forward_only_creations(server, arg: str) -> None:
+    assert forward([arg, "other"], {ENV_SOCKET: server}) is None
+
+
+def test_serve_within_request(server, tmp_path: Path, capsys) -> None:
+    response = _create(["--serve", str(tmp_path / "other")], str(tmp_path), {})
+
+    assert response["code"] == 1
+    assert "cannot serve from within a request" in str(response["stdout"]) + str(response["stderr"])
+    assert not (tmp_path / "other").exists()
+    assert forward(["--help"], {ENV_SOCKET: server}) == 0  # the server still answers
+    capsys.readouterr()
+
+
+def test_serve_missing_folder(server, tmp_path: Path, capsys) -> None:
+    cwd = Path.cwd()
+
+    response = _create(["venv"], str(tmp_path / "missing"), {})
+
+    assert response["code"] == 1
+    assert "FileNotFoundError" in str(response["stderr"])
+    assert Path.cwd() == cwd
+    assert forward(["--help"], {ENV_SOCKET: server}) == 0  # the server still answers
+    capsys.readouterr()
+
+
+def test_forward_server_stopped(tmp_path_factory, capsys) -> None:
+    path = str(tmp_path_factory.mktemp("d") / "s")
+
+    def stop(listener: socket.socket) -> None:  # dies without answering
+        connection, _ = listener.accept()
+        connection.close()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(path)
+        listener.listen()
+        thread = Thread(target=stop, args=(listener,))
+        thread.start()
+
+        assert forward(["venv"], {ENV_SOCKET: path}) == 1
+        thread.join()
+    _, err = capsys.readouterr()
+    assert "stopped without answering" in err
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import json
 import logging
+import subprocess
+import sys
+from argparse import ArgumentTypeError
+from importlib.metadata import EntryPoint
+from threading import Event
 
 import pytest
 
 from virtualenv import __version__
-from virtualenv.run import cli_run, session_via_cli
+from virtualenv.__main__ import run
+from virtualenv.app_data import AppDataDiskFolder
+from virtualenv.config.cli.parser import VirtualEnvOptions
+from virtualenv.run import cli_run, cli_run_many, session_via_cli, sessions_via_cli
+from virtualenv.run.plugin import base
+from virtualenv.run.plugin.base import LazyPlugins
+from virtualenv.run.session import Session
 
 
 def test_help(capsys) -> None:
@@ -18,6 +30,17 @@ def test_help(capsys) -> None:
     assert out
 
 
+def test_import_defers_creation_machinery() -> None:
+    code = (
+        "import sys, virtualenv\n"
+        "assert 'virtualenv.run' not in sys.modules\n"
+        "assert virtualenv.run.cli_run is virtualenv.cli_run\n"
+        "assert virtualenv.run.session is sys.modules['virtualenv.run.session']\n"
+    )
+
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
 def test_version(capsys) -> None:
     with pytest.raises(SystemExit) as context:
         cli_run(args=["--version"])
@@ -53,3 +76,157 @@ def test_invalid_discovery_method_via_env(monkeypatch: pytest.MonkeyPatch) -> No
     assert "Available discovery methods:" in error_message
     assert "builtin" in error_message
     assert "Is the plugin installed?" in error_message
+
+
+def test_cli_run_many(tmp_path) -> None:
+    dest_file = tmp_path / "file"
+    dest_file.write_text("", encoding="utf-8")
+    destinations = [tmp_path / "a", dest_file, tmp_path / "b"]
+
+    results = cli_run_many(destinations, ["--without-pip", "--activators", "bash"], setup_logging=False)
+
+    assert len(results) == 3
+    first, failed, second = results
+    assert isinstance(first, Session)
+    assert isinstance(second, Session)
+    assert isinstance(failed, ArgumentTypeError)
+    assert first.creator.dest == destinations[0]
+    assert second.creator.dest == destinations[2]
+    for session in (first, second):
+        assert session.creator.exe.exists()
+        assert (session.creator.bin_dir / "activate").exists()
+    assert first.interpreter is second.interpreter
+    assert first.seeder is second.seeder
+    assert first.creator is not second.creator
+
+
+def test_cli_run_many_reports_stats_once(tmp_path, mocker) -> None:
+    report_copies = mocker.patch("virtualenv.run.session._report_copies")
+    report_locks = mocker.patch("virtualenv.run.session._report_locks")
+
+    cli_run_many([tmp_path / "a", tmp_path / "b"], ["--without-pip", "--activators", ""], setup_logging=False)
+
+    assert report_copies.call_count == 1  # the counters are of the process, so of the whole batch
+    assert report_locks.call_count == 1
+
+
+def test_cli_run_many_reports_creation_failure(tmp_path, mocker) -> None:
+    destinations = [tmp_path / "a", tmp_path / "b"]
+    sessions = sessions_via_cli(destinations, ["--without-pip", "--activators", ""], setup_logging=False)
+    mocker.patch("virtualenv.run.sessions_via_cli", return_value=sessions)
+    mocker.patch.object(sessions[1].creator, "run", side_effect=RuntimeError("boom"))
+
+    first, second = cli_run_many(destinations, setup_logging=False)
+
+    assert first is sessions[0]
+    assert isinstance(second, RuntimeError)
+    assert str(second) == "boom"
+
+
+def test_session_prepares_seed_while_creating(tmp_path, mocker) -> None:
+    session = session_via_cli([str(tmp_path / "venv"), "--activators", "bash"], setup_logging=False)
+    prepared = Event()
+    mocker.patch.object(session.seeder, "prepare", side_effect=lambda _: prepared.set())
+    seed = mocker.patch.object(session.seeder, "run")
+    create = session.creator.run
+
+    def create_after_prepare() -> None:
+        assert prepared.wait(timeout=10), "seed preparation should not wait for the creation"
+        create()
+
+    mocker.patch.object(session.creator, "run", side_effect=create_after_prepare)
+
+    session.run()
+
+    seed.assert_called_once_with(session.creator)
+    assert (session.creator.bin_dir / "activate").exists()
+
+
+def test_session_stage_failure_skips_dependent_stages(tmp_path, mocker) -> None:
+    session = session_via_cli([str(tmp_path / "venv"), "--activators", "bash"], setup_logging=False)
+    mocker.patch.object(session.seeder, "prepare")
+    seed = mocker.patch.object(session.seeder, "run")
+    activate = mocker.patch.object(session.activators[0], "generate")
+    mocker.patch.object(session.creator, "run", side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        session.run()
+
+    assert not seed.called
+    assert not activate.called
+
+
+def test_session_timings(tmp_path) -> None:
+    session = cli_run([str(tmp_path / "venv"), "--without-pip", "--activators", "bash"], setup_logging=False)
+
+    timings = session.timings
+    assert timings.elapsed is not None
+    stages = {i.name: i for i in timings.children}
+    assert {"parse", "create", "prepare seed", "seed", "activate", "pyenv.cfg"} <= set(stages)
+    assert {i.name for i in stages["parse"].children} == {"app data", "discovery", "plugin load"}
+    assert [i.name for i in stages["activate"].children] == ["BashActivator"]
+    assert all(i.elapsed is not None for i in stages.values())
+
+
+@pytest.mark.parametrize("report", ["text", "json"])
+def test_timings_option(tmp_path, report: str) -> None:
+    options = VirtualEnvOptions()
+    session = session_via_cli(["--timings", report, str(tmp_path / "venv")], options, setup_logging=False)
+    assert options.timings == report
+    assert session.creator.dest == tmp_path / "venv"
+
+
+def test_timings_json(tmp_path, capsys) -> None:
+    run([str(tmp_path / "venv"), "--without-pip", "--activators", "", "-q", "--timings", "json"])
+
+    out, _ = capsys.readouterr()
+    timings = json.loads(out)
+    assert timings["name"] == "virtualenv"
+    assert timings["ms"] > 0
+    assert "create" in {i["name"] for i in timings["children"]}
+
+
+def test_plugins_load_lazily() -> None:
+    plugins = LazyPlugins([EntryPoint("broken", "virtualenv.does_not_exist:Plugin", "virtualenv.seed")])
+
+    assert list(plugins) == ["broken"]
+    assert "broken" in plugins
+    with pytest.raises(ModuleNotFoundError):
+        plugins["broken"]
+
+
+def test_plugin_index_skips_scan_until_sys_path_changes(tmp_path, mocker) -> None:
+    app_data = AppDataDiskFolder(str(tmp_path))
+    scan = mocker.spy(base, "_scan_entry_points")
+
+    first = base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    second = base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    assert scan.call_count == 1
+    assert second == first
+    assert "builtin" in {e.name for e in second["virtualenv.discovery"]}
+
+    mocker.patch.object(base, "_mtime", return_value=0)
+    base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    assert scan.call_count == 2
+
+
+def test_plugin_index_ignores_working_directory(tmp_path, mocker, monkeypatch) -> None:
+    app_data, cwd = AppDataDiskFolder(str(tmp_path / "app-data")), tmp_path / "cwd"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    monkeypatch.setattr(sys, "path", ["", str(cwd), *sys.path])
+    scan = mocker.spy(base, "_scan_entry_points")
+
+    base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    (cwd / "venv").mkdir()  # a creation in the working directory
+    base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    assert scan.call_count == 1
+
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setattr(sys, "path", [*sys.path, str(other)])
+    base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    assert scan.call_count == 2  # kept apart from the index of the other path
+    monkeypatch.setattr(sys, "path", sys.path[:-1])
+    base._load_entry_points(app_data)  # ruff:ignore[private-member-access]
+    assert scan.call_count == 2
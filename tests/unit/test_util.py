@@ -2,18 +2,34 @@ from __future__ import annotations
 
 import concurrent.futures
 import os
+import subprocess
+import sys
+import threading
+import time
 import traceback
 import zipfile
 from typing import TYPE_CHECKING
 
 import pytest
+from filelock import FileLock
 
 from virtualenv.app_data import _cache_dir_with_migration, _default_app_data_dir
 from virtualenv.util import zipapp
-from virtualenv.util.lock import ReentrantFileLock
+from virtualenv.util.lock import (
+    LeaseFileLock,
+    LockTimeoutError,
+    ReentrantFileLock,
+    Timeout,
+    _renew,
+    lock_waits,
+    set_lock_timeout,
+)
+from virtualenv.util.path import copy, copy_stats, hardlink, set_reflink_mode
 from virtualenv.util.subprocess import run_cmd
+from virtualenv.util.timings import Timing, in_context, timed
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
@@ -44,6 +60,284 @@ def test_reentrant_file_lock_is_thread_safe(tmp_path) -> None:
                 pytest.fail(traceback.format_exc())
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="shared locks need flock")
+def test_shared_lock_for_key_excludes_only_exclusive(tmp_path) -> None:
+    lock = ReentrantFileLock(tmp_path)
+    with lock.shared_lock_for_key("image"), lock.shared_lock_for_key("image"):
+        with pytest.raises(Timeout), lock.exclusive_lock_for_key("image", no_block=True):
+            pass
+        with lock.exclusive_lock_for_key("other", no_block=True):
+            pass
+    with lock.exclusive_lock_for_key("image", no_block=True):
+        with pytest.raises(Timeout), lock.exclusive_lock_for_key("image", no_block=True):
+            pass
+        with pytest.raises(Timeout):  # the key lock of older versions
+            FileLock(str(tmp_path / "image.lock")).acquire(timeout=0)
+
+
+@pytest.fixture
+def lock_timeout() -> Iterator[None]:
+    set_lock_timeout(0.2)
+    yield
+    set_lock_timeout(None)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shared locks need flock")
+@pytest.mark.usefixtures("lock_timeout")
+def test_lock_timeout_reports_holder(tmp_path) -> None:
+    lock = ReentrantFileLock(tmp_path)
+    with lock.exclusive_lock_for_key("image"):
+        assert (tmp_path / "image.lock").read_text(encoding="utf-8") == f"{os.getpid()}\n"
+        match = rf"image\.lock within .* \(last locked exclusively by PID {os.getpid()}\)"
+        with pytest.raises(LockTimeoutError, match=match), lock.shared_lock_for_key("image"):
+            pass
+    with lock.shared_lock_for_key("image"):
+        pass
+
+
+@pytest.mark.usefixtures("lock_timeout")
+def test_lock_timeout_across_threads(tmp_path) -> None:
+    lock, held, release = ReentrantFileLock(tmp_path), threading.Event(), threading.Event()
+
+    def hold() -> None:
+        with lock.lock_for_key("py_info"):
+            held.set()
+            release.wait()
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        holder = executor.submit(hold)
+        held.wait()
+        with pytest.raises(LockTimeoutError, match=r"py_info\.lock"), lock.lock_for_key("py_info"):
+            pass
+        release.set()
+        holder.result()
+    with lock.lock_for_key("py_info"):
+        pass
+
+
+def test_lock_waits_counted(tmp_path) -> None:
+    lock, held = ReentrantFileLock(tmp_path), threading.Event()
+    lock_file = str(tmp_path / "unzip.lock")
+    before = lock_waits().get(lock_file)
+
+    def hold() -> None:
+        with lock.non_reentrant_lock_for_key("unzip"):
+            held.set()
+            time.sleep(0.2)
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        holder = executor.submit(hold)
+        held.wait()
+        with lock.non_reentrant_lock_for_key("unzip"):
+            pass
+        holder.result()
+
+    waits = lock_waits()[lock_file]
+    assert before is None
+    assert waits.acquired == 2
+    assert waits.contended == 1
+    assert waits.waited > 0.1
+
+
+def test_lease_lock_excludes_processes(tmp_path) -> None:
+    counter = tmp_path / "counter"
+    counter.write_text("0", encoding="utf-8")
+    script = (
+        "import pathlib, sys\n"
+        "from virtualenv.util.lock import LeaseFileLock\n"
+        "counter = pathlib.Path(sys.argv[1])\n"
+        "for _ in range(20):\n"
+        "    with LeaseFileLock(counter.parent).lock_for_key('counter'):\n"
+        "        value = int(counter.read_text())\n"
+        "        counter.write_text(str(value + 1))\n"
+    )
+    processes = [subprocess.Popen([sys.executable, "-c", script, str(counter)]) for _ in range(4)]
+
+    assert [i.wait(timeout=60) for i in processes] == [0] * 4
+    assert counter.read_text(encoding="utf-8") == "80"
+    assert not list(tmp_path.glob("*.lease"))
+
+
+def test_lease_lock_reentrant_within_thread(tmp_path) -> None:
+    lock, other = LeaseFileLock(tmp_path), LeaseFileLock(tmp_path)
+
+    def lock_from_other_thread() -> None:
+        with lock.lock_for_key("py_info", no_block=True):
+            pass
+
+    with lock.lock_for_key("py_info"), other.lock_for_key("py_info"):
+        assert (tmp_path / "py_info.lease").read_text(encoding="utf-8").split()[0] == str(os.getpid())
+        with pytest.raises(Timeout), lock.exclusive_lock_for_key("py_info", no_block=True):
+            pass
+        with concurrent.futures.ThreadPoolExecutor() as executor, pytest.raises(Timeout):
+            executor.submit(lock_from_other_thread).result()
+    assert not (tmp_path / "py_info.lease").exists()
+
+
+def test_lease_lock_takes_over_stale(tmp_path, mocker, caplog) -> None:
+    mocker.patch("virtualenv.util.lock.LEASE_STALE", 0.2)
+    (tmp_path / "image.lease").write_text("1 gone-host 7\n", encoding="utf-8")
+
+    with LeaseFileLock(tmp_path).exclusive_lock_for_key("image"):
+        assert (tmp_path / "image.lease").read_text(encoding="utf-8").split()[0] == str(os.getpid())
+
+    assert "took over lease" in caplog.text
+    assert not list(tmp_path.iterdir())
+
+
+def test_lease_lock_taken_over_while_held(tmp_path, caplog) -> None:
+    lease = tmp_path / "image.lease"
+
+    with LeaseFileLock(tmp_path).exclusive_lock_for_key("image"):
+        lease.write_text("1 other-host 0\n", encoding="utf-8")  # a waiter judged it stale meanwhile
+        assert not _renew(str(lease), 1)
+        assert lease.read_text(encoding="utf-8") == "1 other-host 0\n"
+
+    assert lease.read_text(encoding="utf-8") == "1 other-host 0\n"
+    assert "taken over by another process" in caplog.text
+
+
+def test_hardlink_tree(tmp_path: Path, has_symlink_support) -> None:
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "sub" / "a.txt").write_text("a", encoding="utf-8")
+    if has_symlink_support:
+        (src / "link").symlink_to("sub", target_is_directory=True)
+    dest = tmp_path / "dest"
+
+    hardlink(src, dest)
+
+    assert (dest / "sub" / "a.txt").read_text(encoding="utf-8") == "a"
+    assert os.path.samefile(src / "sub" / "a.txt", dest / "sub" / "a.txt")
+    if has_symlink_support:
+        assert (dest / "link").is_symlink()
+        assert os.readlink(dest / "link") == "sub"
+
+
+def test_hardlink_falls_back_to_copy(tmp_path: Path, mocker) -> None:
+    mocker.patch("virtualenv.util.path._sync.os.link", side_effect=OSError("cross-device link"))
+    src = tmp_path / "a.txt"
+    src.write_text("a", encoding="utf-8")
+    dest = tmp_path / "b.txt"
+
+    hardlink(src, dest)
+
+    assert dest.read_text(encoding="utf-8") == "a"
+    assert not os.path.samefile(src, dest)
+
+
+@pytest.fixture
+def reflink_mode():
+    yield set_reflink_mode
+    set_reflink_mode("auto")
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reflinks are only supported on Linux")
+def test_copy_uses_reflink(tmp_path: Path, mocker) -> None:
+    ioctl = mocker.patch("virtualenv.util.path._sync.fcntl.ioctl")
+    src = tmp_path / "a.txt"
+    src.write_text("a", encoding="utf-8")
+    before = copy_stats()
+
+    copy(src, tmp_path / "b.txt")
+
+    assert ioctl.call_count == 1
+    assert (copy_stats() - before).reflink == 1
+
+
+def test_copy_falls_back_without_reflink(tmp_path: Path, mocker) -> None:
+    mocker.patch("virtualenv.util.path._sync._clone", return_value=False)
+    src = tmp_path / "a.txt"
+    src.write_text("a" * 4096, encoding="utf-8")
+    src.chmod(0o755)
+    dest = tmp_path / "b.txt"
+    before = copy_stats()
+
+    copy(src, dest)
+
+    assert dest.read_text(encoding="utf-8") == "a" * 4096
+    assert dest.stat().st_mode == src.stat().st_mode
+    copied = copy_stats() - before
+    assert copied.reflink == 0
+    assert copied.kernel + copied.copy == 1
+
+
+def test_copy_reflink_always_fails_without_support(tmp_path: Path, mocker, reflink_mode) -> None:
+    mocker.patch("virtualenv.util.path._sync._clone", return_value=False)
+    reflink_mode("always")
+    src = tmp_path / "a.txt"
+    src.write_text("a", encoding="utf-8")
+
+    with pytest.raises(OSError, match="cannot reflink"):
+        copy(src, tmp_path / "b.txt")
+
+
+def test_copy_reflink_never(tmp_path: Path, mocker, reflink_mode) -> None:
+    clone = mocker.patch("virtualenv.util.path._sync._clone")
+    reflink_mode("never")
+    src = tmp_path / "a.txt"
+    src.write_text("a", encoding="utf-8")
+    before = copy_stats()
+
+    copy(src, tmp_path / "b.txt")
+
+    assert not clone.called
+    assert (copy_stats() - before).copy == 1
+
+
+def test_copy_tree_in_parallel(tmp_path: Path, has_symlink_support) -> None:
+    src = tmp_path / "src"
+    for index in range(20):
+        folder = src / f"sub{index % 3}" / "deep"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"{index}.py").write_text(str(index), encoding="utf-8")
+    (src / "sub0" / "deep" / "0.py").chmod(0o755)
+    if has_symlink_support:
+        (src / "link").symlink_to("sub1", target_is_directory=True)
+    before = copy_stats()
+
+    copy(src, tmp_path / "dest")
+
+    assert sum(copy_stats() - before) == 20
+    for index in range(20):
+        assert (tmp_path / "dest" / f"sub{index % 3}" / "deep" / f"{index}.py").read_text(encoding="utf-8") == str(
+            index
+        )
+    assert (tmp_path / "dest" / "sub0" / "deep" / "0.py").stat().st_mode == (
+        src / "sub0" / "deep" / "0.py"
+    ).stat().st_mode
+    assert not (tmp_path / "dest" / "link").exists()  # like os.walk, symlinked folders are not followed
+
+
+def test_copy_without_kernel_copy(tmp_path: Path, mocker) -> None:
+    mocker.patch("virtualenv.util.path._sync._clone", return_value=False)
+    mocker.patch("virtualenv.util.path._sync._copy_range", return_value=False)
+    mocker.patch("virtualenv.util.path._sync._send_file", return_value=False)
+    src = tmp_path / "a.txt"
+    src.write_text("a" * 4096, encoding="utf-8")
+    before = copy_stats()
+
+    copy(src, tmp_path / "b.txt")
+
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "a" * 4096
+    assert (copy_stats() - before).copy == 1
+
+
+def test_timed_nests_across_threads() -> None:
+    def work() -> None:
+        with timed("inner"):
+            pass
+
+    root = Timing("root")
+    with root.activate(), timed("outer"), concurrent.futures.ThreadPoolExecutor() as executor:
+        executor.submit(in_context(work)).result()
+    with timed("not recorded"):
+        pass
+
+    assert [(i.name, [j.name for j in i.children]) for i in root.children] == [("outer", ["inner"])]
+    assert [i.split()[0] for i in root.as_text().splitlines()] == ["root", "outer", "inner"]
+
+
 class TestDefaultAppDataDir:
     def test_override_env_var(self, tmp_path: Path) -> None:
         custom = str(tmp_path / "custom")